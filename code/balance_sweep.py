@@ -0,0 +1,364 @@
+"""
+This file contains source code of the balance sweep of the game "Tenzichi Own The Planet - Board Game Edition".
+A balance sweep plays the same seeded CPU versus CPU games with every economy of a grid or a random sample of a
+search space over a pool of worker processes, and compares their win rates, finishing turns, levels, coins and places
+owned. The results of every block of 'games_per_task' games are cached on the disk under a hash of the economy, the
+rules of the games and the seeds of the block, so that repeated and overlapping sweeps only play the games which
+no sweep has played yet.
+Author: DtjiSoftwareDeveloper
+"""
+
+
+# Importing necessary libraries
+
+import os
+import sys
+import json
+import time
+import random
+import hashlib
+import itertools
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from tenzichi_own_the_planet_board_game_edition import *
+
+
+# Version of the results cached by balance sweeps, which is changed whenever a change of the rules of the game
+# changes the results of the same games, so that results cached by older versions are not used
+BALANCE_CACHE_VERSION: int = 1
+DEFAULT_GAMES_PER_TASK: int = 100  # number of games per block, whose results are cached together
+# Parameters of a sweep which scale the exponents of an economy instead of replacing its arguments
+SCALE_PARAMETERS: tuple = ("upgrade_cost_scale", "upgrade_multiplier_scale", "place_cost_scale", "place_income_scale")
+
+
+# Creating static functions to be used throughout the balance sweep.
+
+
+def create_economy(parameters, base=DEFAULT_ECONOMY):
+    # type: (dict, Economy) -> Economy
+    """
+    This function creates the economy with 'parameters' instead of the arguments of 'base'. Besides the arguments of
+    Economy, the parameters may be one of SCALE_PARAMETERS: 'upgrade_cost_scale' multiplies the exponents of the
+    coin costs of the upgrades, 'upgrade_multiplier_scale' multiplies the gain multipliers of the upgrades which are
+    above 1, 'place_cost_scale' multiplies the exponents of the coin costs of the places and 'place_income_scale'
+    multiplies the exponents of their coins and EXP per turn. Scaled values are rounded to the nearest integers.
+    :return: the economy
+    """
+
+    economy: Economy = base.replace(**{name: value for name, value in parameters.items()
+                                       if name not in SCALE_PARAMETERS})
+    upgrade_cost_scale: float = parameters.get("upgrade_cost_scale", 1)
+    upgrade_multiplier_scale: float = parameters.get("upgrade_multiplier_scale", 1)
+    place_cost_scale: float = parameters.get("place_cost_scale", 1)
+    place_income_scale: float = parameters.get("place_income_scale", 1)
+    return economy.replace(
+        upgrades=[(name, round(coin_cost * upgrade_cost_scale),
+                   max(2, round(coin_gain_multiplier * upgrade_multiplier_scale)) if coin_gain_multiplier > 1
+                   else coin_gain_multiplier,
+                   max(2, round(exp_gain_multiplier * upgrade_multiplier_scale)) if exp_gain_multiplier > 1
+                   else exp_gain_multiplier)
+                  for name, coin_cost, coin_gain_multiplier, exp_gain_multiplier in economy.upgrades],
+        place_exponents=[(round(coin_cost * place_cost_scale), round(coins_per_turn * place_income_scale),
+                          round(exp_per_turn * place_income_scale))
+                         for coin_cost, coins_per_turn, exp_per_turn in economy.place_exponents])
+
+
+def generate_grid(grid):
+    # type: (dict) -> list
+    """
+    This function lists every combination of the values of the parameters in 'grid', which maps the name of every
+    parameter to a list of its values.
+    :return: a list of the parameters of every combination
+    """
+
+    names: list = sorted(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[name] for name in names))]
+
+
+def sample_search_space(space, n_configs, seed):
+    # type: (dict, int, int) -> list
+    """
+    This function draws 'n_configs' random combinations of the values of the parameters in 'space', which maps the
+    name of every parameter to either a list of its values, any of which is drawn, or a dictionary with a "low" and a
+    "high" value, between which a value is drawn uniformly, as an integer if both are integers. The same 'seed'
+    always draws the same combinations.
+    :return: a list of the parameters of every combination
+    """
+
+    rng: random.Random = random.Random(seed)
+    res: list = []  # initial value
+    for i in range(n_configs):
+        parameters: dict = {}  # initial value
+        for name in sorted(space):
+            values: list or dict = space[name]
+            if isinstance(values, dict):
+                low, high = values["low"], values["high"]
+                parameters[name] = rng.randint(low, high) if isinstance(low, int) and isinstance(high, int) \
+                    else rng.uniform(low, high)
+            else:
+                parameters[name] = rng.choice(values)
+        res.append(parameters)
+
+    return res
+
+
+def get_blocks(first_game_index, last_game_index, games_per_task):
+    # type: (int, int, int) -> list
+    # Splits the games with indices in [first_game_index, last_game_index) at the multiples of 'games_per_task', so
+    # that sweeps over overlapping ranges of games share the blocks they both cover in full.
+    boundaries: list = [first_game_index] + list(range((first_game_index // games_per_task + 1) * games_per_task,
+                                                       last_game_index, games_per_task)) + [last_game_index]
+    return [(first, last) for first, last in zip(boundaries, boundaries[1:]) if first < last]
+
+
+def get_cache_key(economy, first_game_index, last_game_index, max_turns, seed, numeric_backend_name,
+                  n_participants):
+    # type: (Economy, int, int, int, int, str, int) -> str
+    """
+    This function hashes everything the results of the games with indices in [first_game_index, last_game_index)
+    of a balance sweep depend on.
+    :return: the hexadecimal SHA-256 hash
+    """
+
+    config: dict = {"version": BALANCE_CACHE_VERSION, "economy": economy.get_parameters(),
+                    "first_game_index": first_game_index, "last_game_index": last_game_index,
+                    "max_turns": max_turns, "seed": seed, "numeric_backend": numeric_backend_name,
+                    "n_participants": n_participants}
+    return hashlib.sha256(json.dumps(config, sort_keys=True, separators=(",", ":")).encode("utf-8")).hexdigest()
+
+
+def evaluate_games(economy, first_game_index, last_game_index, max_turns, seed, numeric_backend_name="mpf",
+                   n_participants=2):
+    # type: (Economy, int, int, int, int, str, int) -> BalanceResult
+    """
+    This function plays the games with indices in the range [first_game_index, last_game_index) of 'n_participants'
+    CPUs with 'economy'. It is run in the worker processes of a balance sweep.
+    :return: the results of the games
+    """
+
+    numeric_backend: NumericBackend = get_numeric_backend(numeric_backend_name)
+    policy: RandomCPUPolicy = RandomCPUPolicy(economy.cpu_probability)
+    result: BalanceResult = BalanceResult(n_participants)
+    for game_index in range(first_game_index, last_game_index):
+        game: Game = Game(CPU(numeric_backend), CPU(numeric_backend), create_board(numeric_backend, economy), seed,
+                          game_index, economy)
+        for seat in range(2, n_participants):
+            game.add_participant(CPU(numeric_backend))
+        winner: Player or None = play_game(game, policy, policy, max_turns)
+        result.add_game(game, None if winner is None else game.get_seat(winner))
+
+    return result
+
+
+def run_sweep(parameter_sets, n_games, max_turns, seed, cache_directory=None, workers=None,
+              games_per_task=DEFAULT_GAMES_PER_TASK, numeric_backend_name="mpf", n_participants=2,
+              first_game_index=0):
+    # type: (list, int, int, int, str or None, int or None, int, str, int, int) -> SweepReport
+    """
+    This function plays the games with indices in [first_game_index, first_game_index + n_games) with the economy
+    of every parameters in 'parameter_sets' over a pool of 'workers' processes (one per CPU core by default). Every
+    economy plays the same seeded games, so that their results differ by their economies rather than by their luck.
+    Blocks of games whose results are cached in 'cache_directory' are not played again, and the results of the
+    blocks played are cached there as soon as they are done, so that an interrupted sweep keeps its work.
+    :return: a report of the results of every economy
+    """
+
+    start_time: float = time.perf_counter()
+    cache: BalanceCache or None = None if cache_directory is None else BalanceCache(cache_directory)
+    blocks: list = get_blocks(first_game_index, first_game_index + n_games, games_per_task)
+    economies: list = [create_economy(parameters) for parameters in parameter_sets]
+    results: dict = {}  # results of the blocks keyed by their cache keys
+    pending: dict = {}  # arguments of evaluate_games() of the blocks to play keyed by their cache keys
+    keys: list = []  # cache keys of the blocks of every economy
+    report: SweepReport = SweepReport()
+    for economy in economies:
+        economy_keys: list = []  # initial value
+        for first, last in blocks:
+            key: str = get_cache_key(economy, first, last, max_turns, seed, numeric_backend_name, n_participants)
+            economy_keys.append(key)
+            if key in results or key in pending:
+                continue
+            cached: BalanceResult or None = None if cache is None else cache.get(key)
+            if cached is None:
+                pending[key] = (economy, first, last, max_turns, seed, numeric_backend_name, n_participants)
+            else:
+                results[key] = cached
+                report.blocks_cached += 1
+        keys.append(economy_keys)
+
+    if len(pending) > 0:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures: dict = {executor.submit(evaluate_games, *arguments): key for key, arguments in pending.items()}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+                if cache is not None:
+                    cache.put(futures[future], results[futures[future]])
+                report.blocks_played += 1
+
+    for parameters, economy_keys in zip(parameter_sets, keys):
+        result: BalanceResult = BalanceResult(n_participants)
+        for key in economy_keys:
+            result.merge(results[key])
+        report.results.append((parameters, result))
+
+    report.elapsed_seconds = time.perf_counter() - start_time
+    return report
+
+
+# Creating necessary classes
+
+
+class BalanceResult:
+    """
+    This class contains attributes of the merged results of games played with one economy, from which the means
+    and rates compared by a balance sweep are computed.
+    """
+
+    def __init__(self, n_participants=2):
+        # type: (int) -> None
+        self.n_participants: int = n_participants
+        self.n_games: int = 0  # initial value
+        self.total_turns: int = 0  # initial value
+        self.wins: list = [0] * n_participants  # number of games won by the participant in each seat
+        self.finishing_turns: int = 0  # total number of turns of the finished games
+        self.levels: list = [0] * n_participants  # total level reached by the participant in each seat
+        self.log10_coins: list = [0.0] * n_participants  # total log10 of the coins left to the participant in each seat
+        self.places_owned: list = [0] * n_participants  # total number of places owned by the participant in each seat
+
+    def __str__(self):
+        # type: () -> str
+        res: str = ""  # initial value
+        res += "Games played: " + str(self.n_games) + "\n"
+        res += "Finished games: " + str(self.get_finished_games()) + "\n"
+        res += "Mean turns of finished games: " + str(self.get_mean_finishing_turn()) + "\n"
+        res += "Win rates: " + str(self.get_win_rates()) + "\n"
+        res += "Mean levels: " + str(self.get_means(self.levels)) + "\n"
+        res += "Mean log10 coins: " + str(self.get_means(self.log10_coins)) + "\n"
+        res += "Mean places owned: " + str(self.get_means(self.places_owned)) + "\n"
+        return res
+
+    def add_game(self, game, winner_seat):
+        # type: (Game, int or None) -> None
+        self.n_games += 1
+        self.total_turns += game.turn
+        if winner_seat is not None:
+            self.wins[winner_seat] += 1
+            self.finishing_turns += game.turn
+        for seat, participant in enumerate(game.participants):
+            self.levels[seat] += participant.level
+            self.log10_coins[seat] += game.numeric_backend.log10(participant.coins) if participant.coins > 0 else 0.0
+            self.places_owned[seat] += participant.count_owned()
+
+    def merge(self, other):
+        # type: (BalanceResult) -> BalanceResult
+        self.n_games += other.n_games
+        self.total_turns += other.total_turns
+        self.finishing_turns += other.finishing_turns
+        for seat in range(self.n_participants):
+            self.wins[seat] += other.wins[seat]
+            self.levels[seat] += other.levels[seat]
+            self.log10_coins[seat] += other.log10_coins[seat]
+            self.places_owned[seat] += other.places_owned[seat]
+        return self
+
+    def get_finished_games(self):
+        # type: () -> int
+        return sum(self.wins)
+
+    def get_win_rates(self):
+        # type: () -> list
+        return [wins / self.n_games if self.n_games > 0 else 0.0 for wins in self.wins]
+
+    def get_mean_finishing_turn(self):
+        # type: () -> float or None
+        return self.finishing_turns / self.get_finished_games() if self.get_finished_games() > 0 else None
+
+    def get_means(self, totals):
+        # type: (list) -> list
+        # Returns the means per game of totals per seat such as 'levels'.
+        return [total / self.n_games if self.n_games > 0 else 0.0 for total in totals]
+
+    def to_dict(self):
+        # type: () -> dict
+        return dict(self.__dict__)
+
+    @staticmethod
+    def from_dict(state):
+        # type: (dict) -> BalanceResult
+        res: BalanceResult = BalanceResult(state["n_participants"])
+        res.__dict__.update(state)
+        return res
+
+
+class BalanceCache:
+    """
+    This class contains attributes of a directory holding the cached results of blocks of games of balance sweeps,
+    one JSON file per block named after its cache key.
+    """
+
+    def __init__(self, directory):
+        # type: (str) -> None
+        self.directory: str = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def get_file_name(self, key):
+        # type: (str) -> str
+        return os.path.join(self.directory, key + ".json")
+
+    def get(self, key):
+        # type: (str) -> BalanceResult or None
+        # Returns the cached results of the block with 'key', or None if they are not cached or cannot be read.
+        try:
+            with open(self.get_file_name(key), "r") as file:
+                return BalanceResult.from_dict(json.load(file))
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, key, result):
+        # type: (str, BalanceResult) -> None
+        write_file_atomically(self.get_file_name(key), json.dumps(result.to_dict()).encode("utf-8"))
+
+
+class SweepReport:
+    """
+    This class contains attributes of the results of a balance sweep: the parameters and results of every economy,
+    and how many blocks of games were played and how many were found in the cache.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self.results: list = []  # pairs of the parameters and the results of every economy
+        self.blocks_played: int = 0  # initial value
+        self.blocks_cached: int = 0  # initial value
+        self.elapsed_seconds: float = 0.0  # initial value
+
+    def __str__(self):
+        # type: () -> str
+        res: str = ""  # initial value
+        for parameters, result in self.results:
+            res += "Parameters: " + json.dumps(parameters, sort_keys=True) + "\n" + str(result) + "\n"
+        res += "Blocks played: " + str(self.blocks_played) + "\n"
+        res += "Blocks found in the cache: " + str(self.blocks_cached) + "\n"
+        res += "Elapsed seconds: " + str(self.elapsed_seconds) + "\n"
+        return res
+
+
+if __name__ == '__main__':
+    if len(sys.argv) in (7, 8, 9) and sys.argv[1] == "grid":
+        with open(sys.argv[2], "r") as grid_file:
+            parameter_sets: list = generate_grid(json.load(grid_file))
+        arguments: list = sys.argv[3:]
+    elif len(sys.argv) in (8, 9, 10) and sys.argv[1] == "sample":
+        with open(sys.argv[2], "r") as space_file:
+            space: dict = json.load(space_file)
+        parameter_sets: list = sample_search_space(space, int(sys.argv[3]), int(sys.argv[6]))
+        arguments: list = sys.argv[4:]
+    else:
+        print("Usage: python balance_sweep.py grid GRID_FILE N_GAMES MAX_TURNS SEED CACHE_DIRECTORY [WORKERS] "
+              "[NUMERIC_BACKEND]")
+        print("       python balance_sweep.py sample SPACE_FILE N_CONFIGS N_GAMES MAX_TURNS SEED CACHE_DIRECTORY "
+              "[WORKERS] [NUMERIC_BACKEND]")
+        sys.exit(1)
+
+    print(run_sweep(parameter_sets, int(arguments[0]), int(arguments[1]), int(arguments[2]), arguments[3],
+                    int(arguments[4]) if len(arguments) >= 5 else None,
+                    numeric_backend_name=arguments[5] if len(arguments) >= 6 else "mpf"))
@@ -0,0 +1,256 @@
+"""
+This file contains source code of the benchmark suite of the game "Tenzichi Own The Planet - Board Game Edition".
+Every benchmark times one hot path of the game on a seeded fixture, so that its results can be reproduced, and
+reports the fastest of a few repeats in seconds per operation. The results are compared with the baseline stored in
+BASELINE_FILE_NAME and a benchmark fails when it is more than REGRESSION_THRESHOLD times slower than its baseline.
+Author: DtjiSoftwareDeveloper
+"""
+
+
+# Importing necessary libraries
+
+import os
+import sys
+import json
+import time
+import random
+import platform
+import tempfile
+from tenzichi_own_the_planet_board_game_edition import *
+
+
+BASELINE_FILE_NAME: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")
+REGRESSION_THRESHOLD: float = 1.5  # largest allowed ratio of a result to its baseline
+REPEATS: int = 5  # number of times every benchmark is run, of which the fastest run is reported
+BENCHMARK_SEED: int = 2024
+LONG_GAME_TURNS: int = 10000
+MANY_UPGRADES: int = 2000  # number of upgrades of the participant whose income is computed
+LONG_GAMES: dict = {}  # long games keyed by the name of their numeric backend, played once per run
+
+
+# Creating static functions to be used throughout the benchmark suite.
+
+
+def create_long_game(numeric_backend=None):
+    # type: (NumericBackend or None) -> Game
+    # Returns a seeded CPU versus CPU game after LONG_GAME_TURNS turns, which must not be changed by benchmarks.
+    backend: NumericBackend = MPF_BACKEND if numeric_backend is None else numeric_backend
+    if backend.name not in LONG_GAMES:
+        game: Game = Game(CPU(backend), CPU(backend), create_board(backend), BENCHMARK_SEED)
+        play_game(game, RandomCPUPolicy(), RandomCPUPolicy(), LONG_GAME_TURNS)
+        LONG_GAMES[backend.name] = game
+    return LONG_GAMES[backend.name]
+
+
+def create_rich_game(numeric_backend=None):
+    # type: (NumericBackend or None) -> Game
+    # Returns a new game whose participants have more coins than any place on the board costs.
+    backend: NumericBackend = MPF_BACKEND if numeric_backend is None else numeric_backend
+    game: Game = Game(CPU(backend), CPU(backend), create_board(backend), BENCHMARK_SEED)
+    game.player.coins = backend.power_of_ten(100000)
+    game.cpu.coins = backend.power_of_ten(100000)
+    return game
+
+
+def time_calls(function, arguments):
+    # type: (callable, list) -> float
+    """
+    This function calls 'function' with every tuple of arguments in 'arguments' REPEATS times.
+    :return: the fastest time per call in seconds
+    """
+
+    best_time: float = float("inf")  # initial value
+    for i in range(REPEATS):
+        start_time: float = time.perf_counter()
+        for call_arguments in arguments:
+            function(*call_arguments)
+        best_time = min(best_time, (time.perf_counter() - start_time) / len(arguments))
+
+    return best_time
+
+
+def time_reset_calls(reset, function, n_calls):
+    # type: (callable, callable, int) -> float
+    """
+    This function calls 'function' 'n_calls' times REPEATS times, calling 'reset' without timing it before every
+    call, for operations which change the state they run on.
+    :return: the fastest time per call in seconds
+    """
+
+    best_time: float = float("inf")  # initial value
+    for i in range(REPEATS):
+        total_time: float = 0.0  # initial value
+        for j in range(n_calls):
+            reset()
+            start_time: float = time.perf_counter()
+            function()
+            total_time += time.perf_counter() - start_time
+        best_time = min(best_time, total_time / n_calls)
+
+    return best_time
+
+
+def benchmark_roll_dice():
+    # type: () -> float
+    game: Game = create_rich_game()
+    rng: random.Random = random.Random(BENCHMARK_SEED)
+    arguments: list = [(Dice(rng), game) for i in range(10000)]
+    return time_calls(game.player.roll_dice, arguments)
+
+
+def benchmark_income():
+    # type: () -> float
+    # Times get_coins_per_turn() and get_exp_per_turn() of a participant owning all places and many upgrades.
+    game: Game = create_rich_game()
+    for place in game.board.get_places():
+        game.player.purchase_place(place)
+    upgrades_sold: list = create_upgrades_sold()
+    for i in range(MANY_UPGRADES):
+        game.player.coins = MPF_BACKEND.power_of_ten(200000)
+        game.player.buy_upgrade(upgrades_sold[i % len(upgrades_sold)])
+
+    player: Player = game.player
+    return time_calls(lambda: (player.get_coins_per_turn(), player.get_exp_per_turn()), [()] * 10000)
+
+
+def benchmark_level_up():
+    # type: () -> float
+    # Times levelling up right after gaining the largest EXP reward a shiny can give.
+    game: Game = create_rich_game()
+    player: Player = game.player
+    player.exp += MPF_BACKEND.power_of_ten(100000)
+    state: PlayerState = player.get_state()
+    return time_reset_calls(lambda: player.set_state(state), player.level_up, 200)
+
+
+def benchmark_purchase_place():
+    # type: () -> float
+    game: Game = create_rich_game()
+    snapshot: GameSnapshot = game.snapshot()
+    places: list = game.board.get_places()
+    rng: random.Random = random.Random(BENCHMARK_SEED)
+    return time_reset_calls(lambda: game.restore(snapshot),
+                            lambda: game.player.purchase_place(places[rng.randrange(len(places))]), 2000)
+
+
+def benchmark_acquire_place():
+    # type: () -> float
+    game: Game = create_rich_game()
+    for place in game.board.get_places():
+        game.cpu.purchase_place(place)
+    snapshot: GameSnapshot = game.snapshot()
+    places: list = game.board.get_places()
+    rng: random.Random = random.Random(BENCHMARK_SEED)
+    return time_reset_calls(lambda: game.restore(snapshot),
+                            lambda: game.player.acquire_place(places[rng.randrange(len(places))], game.cpu), 2000)
+
+
+def save_and_load(game, file_name):
+    # type: (Game, str) -> Game
+    save_game_data(game, file_name)
+    return load_game_data(file_name)
+
+
+def benchmark_save_load():
+    # type: () -> float
+    # Times saving a long game into a file and loading it back.
+    game: Game = create_long_game()
+    with tempfile.TemporaryDirectory() as directory:
+        return time_calls(save_and_load, [(game, os.path.join(directory, "SAVED GAME"))] * 20)
+
+
+def benchmark_clone():
+    # type: () -> float
+    return time_calls(create_long_game().clone, [()] * 20)
+
+
+def benchmark_game(numeric_backend=None):
+    # type: (NumericBackend or None) -> float
+    # Times a whole seeded CPU versus CPU game of LONG_GAME_TURNS turns, reported per game.
+    backend: NumericBackend = MPF_BACKEND if numeric_backend is None else numeric_backend
+    return time_calls(lambda: play_game(Game(CPU(backend), CPU(backend), create_board(backend), BENCHMARK_SEED),
+                                        RandomCPUPolicy(), RandomCPUPolicy(), LONG_GAME_TURNS), [()])
+
+
+# Benchmarks of the suite keyed by their names
+BENCHMARKS: dict = {
+    "roll_dice": benchmark_roll_dice,
+    "income_with_many_places_and_upgrades": benchmark_income,
+    "level_up_after_maximal_shiny": benchmark_level_up,
+    "purchase_place": benchmark_purchase_place,
+    "acquire_place": benchmark_acquire_place,
+    "save_load_long_game": benchmark_save_load,
+    "clone_long_game": benchmark_clone,
+    "game_10000_turns_mpf": benchmark_game,
+    "game_10000_turns_scientific": lambda: benchmark_game(SCIENTIFIC_BACKEND)
+}
+
+
+def run_benchmarks(names=None):
+    # type: (list or None) -> dict
+    """
+    This function runs the benchmarks called 'names', or all benchmarks by default.
+    :return: a dictionary of the seconds per operation of every benchmark run
+    """
+
+    res: dict = {}  # initial value
+    for name in (BENCHMARKS if names is None else names):
+        if name not in BENCHMARKS:
+            raise ValueError("Unknown benchmark: " + str(name))
+        res[name] = BENCHMARKS[name]()
+
+    return res
+
+
+def load_baseline(file_name=BASELINE_FILE_NAME):
+    # type: (str) -> dict
+    with open(file_name, "r") as file:
+        return json.load(file)["results"]
+
+
+def save_baseline(results, file_name=BASELINE_FILE_NAME):
+    # type: (dict, str) -> None
+    with open(file_name, "w") as file:
+        json.dump({"python": platform.python_version(), "machine": platform.machine(), "results": results}, file,
+                  indent=4, sort_keys=True)
+        file.write("\n")
+
+
+def find_regressions(results, baseline, threshold=REGRESSION_THRESHOLD):
+    # type: (dict, dict, float) -> list
+    """
+    This function compares 'results' of run_benchmarks() with 'baseline'.
+    :return: a list of the names of the benchmarks more than 'threshold' times slower than their baseline
+    """
+
+    return [name for name in results if name in baseline and results[name] > baseline[name] * threshold]
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] in ("-h", "--help"):
+        print("Usage: python benchmarks.py [--update-baseline] [BENCHMARK_NAME ...]")
+        print("Benchmarks: " + ", ".join(BENCHMARKS))
+        sys.exit(1)
+
+    update_baseline: bool = "--update-baseline" in sys.argv[1:]
+    benchmark_names: list = [argument for argument in sys.argv[1:] if argument != "--update-baseline"]
+    benchmark_results: dict = run_benchmarks(benchmark_names if len(benchmark_names) > 0 else None)
+    baseline_results: dict = load_baseline() if os.path.exists(BASELINE_FILE_NAME) else {}
+    for benchmark_name, seconds in benchmark_results.items():
+        line: str = benchmark_name + ": " + str(seconds) + " seconds"
+        if benchmark_name in baseline_results:
+            line += " (" + str(round(seconds / baseline_results[benchmark_name], 2)) + " times the baseline)"
+        print(line)
+
+    if update_baseline:
+        baseline_results.update(benchmark_results)
+        save_baseline(baseline_results)
+        print("Saved the baseline into " + BASELINE_FILE_NAME)
+        sys.exit(0)
+
+    regressions: list = find_regressions(benchmark_results, baseline_results)
+    for benchmark_name in regressions:
+        print("Regression: " + benchmark_name + " is more than " + str(REGRESSION_THRESHOLD) +
+              " times slower than its baseline.")
+
+    sys.exit(1 if len(regressions) > 0 else 0)
@@ -0,0 +1,158 @@
+"""
+This file contains source code of the board analytics of the game "Tenzichi Own The Planet - Board Game Edition".
+A participant moving around a board with the dice is a Markov chain over the positions of the board, which is
+solved here for the probabilities of landing on each tile, how often START is passed and shiny zones and upgrade
+shops are visited, and how many turns it is expected to take for every place to pay for itself.
+Author: DtjiSoftwareDeveloper
+"""
+
+
+# Importing necessary libraries
+
+import sys
+import time
+import numpy as np
+from tenzichi_own_the_planet_board_game_edition import *
+
+
+STATIONARY_TOLERANCE: float = 1e-12  # largest change in a landing probability after which the solver stops
+MAX_SOLVER_ITERATIONS: int = 10000
+BOARD_ANALYSES: dict = {}  # analyses of boards keyed by their layout
+
+
+# Creating static functions to be used throughout the board analytics.
+
+
+def get_board_layout(board):
+    # type: (Board) -> tuple
+    # Boards with the same types of tiles in the same order have the same analysis.
+    return tuple(board.get_compiled_board().tile_codes)
+
+
+def get_transition_table(size):
+    # type: (int) -> tuple
+    """
+    This function computes the destination of every position of a board with 'size' tiles for every dice value, and
+    whether START is passed on the way.
+    :return: a tuple of two arrays of shape (size, DICE_FACES)
+    """
+
+    destinations: np.ndarray = np.arange(size)[:, None] + np.arange(1, DICE_FACES + 1)[None, :]
+    return destinations % size, destinations >= size
+
+
+def solve_stationary_distribution(destinations):
+    # type: (np.ndarray) -> np.ndarray
+    """
+    This function finds the probabilities of being on each position of a board in the long run, where rolling the
+    dice on position i moves to destinations[i, value - 1]. Every step of the power iteration scatters the
+    probabilities of all positions to their destinations at once, so a step costs O(size * DICE_FACES).
+    :return: an array of the probability of each position
+    """
+
+    size: int = destinations.shape[0]
+    flat_destinations: np.ndarray = destinations.ravel()
+    probabilities: np.ndarray = np.full(size, 1.0 / size)
+    for iteration in range(MAX_SOLVER_ITERATIONS):
+        # Staying put half of the time makes the chain aperiodic without changing its stationary distribution.
+        moved: np.ndarray = np.bincount(flat_destinations, weights=np.repeat(probabilities / DICE_FACES, DICE_FACES),
+                                        minlength=size)
+        next_probabilities: np.ndarray = 0.5 * (probabilities + moved)
+        if np.abs(next_probabilities - probabilities).max() < STATIONARY_TOLERANCE:
+            return next_probabilities
+        probabilities = next_probabilities
+
+    return probabilities
+
+
+def analyze_board(board):
+    # type: (Board) -> BoardAnalysis
+    # Returns the analysis of the layout of 'board', computing it the first time the layout is seen.
+    layout: tuple = get_board_layout(board)
+    analysis: BoardAnalysis or None = BOARD_ANALYSES.get(layout)
+    if analysis is None:
+        analysis = BoardAnalysis(np.array(layout, dtype=np.int8))
+        BOARD_ANALYSES[layout] = analysis
+    return analysis
+
+
+def number_log10(value):
+    # type: (object) -> float
+    return value.log10() if isinstance(value, ScientificNumber) else MPF_BACKEND.log10(value)
+
+
+def get_payback_turns(board, level, coin_gain_multiplier=1):
+    # type: (Board, int, float) -> list
+    """
+    This function estimates for every place on 'board' how many turns a participant at 'level' whose coin gain
+    multiplier is 'coin_gain_multiplier' needs to land on it and then earn back what it costs him/her.
+    Buying an unowned place earns its current coins per turn. Upgrading or acquiring an owned place levels the
+    participant up to level + 1 and multiplies the coins per turn of the place by 10 ** (level + 1).
+    :return: a list of the expected number of turns for each place, in the order of board.get_places()
+    """
+
+    analysis: BoardAnalysis = analyze_board(board)
+    res: list = []  # initial value
+    for place in board.get_places():
+        log10_income: float = number_log10(place.coins_per_turn) + math.log10(coin_gain_multiplier)
+        if place.owner_id is not None:
+            log10_income += level + 1
+        log10_turns: float = number_log10(place.coin_cost) - log10_income
+        res.append(analysis.get_expected_turns_to_land(analysis.place_positions[place.ordinal]) +
+                   (10.0 ** log10_turns if log10_turns < 300 else float("inf")))
+
+    return res
+
+
+# Creating necessary classes
+
+
+class BoardAnalysis:
+    """
+    This class contains attributes of the Markov chain of a participant moving around a board layout.
+    All expected numbers of visits are per turn of the participant.
+    """
+
+    def __init__(self, tile_codes):
+        # type: (np.ndarray) -> None
+        self.size: int = len(tile_codes)
+        self.tile_codes: np.ndarray = tile_codes
+        self.place_positions: np.ndarray = np.flatnonzero(tile_codes == PLACE_CODE)
+        destinations, passes_start = get_transition_table(self.size)
+        self.landing_probabilities: np.ndarray = solve_stationary_distribution(destinations)
+        self.start_passes_per_turn: float = \
+            float(self.landing_probabilities @ passes_start.mean(axis=1))
+        self.shiny_zone_visits_per_turn: float = self.get_visits_per_turn(SHINY_ZONE_CODE)
+        self.upgrade_shop_visits_per_turn: float = self.get_visits_per_turn(UPGRADE_SHOP_CODE)
+        self.place_visits_per_turn: float = self.get_visits_per_turn(PLACE_CODE)
+
+    def __str__(self):
+        # type: () -> str
+        res: str = ""  # initial value
+        res += "Tiles: " + str(self.size) + "\n"
+        res += "Expected START passes per turn: " + str(self.start_passes_per_turn) + "\n"
+        res += "Expected shiny zone visits per turn: " + str(self.shiny_zone_visits_per_turn) + "\n"
+        res += "Expected upgrade shop visits per turn: " + str(self.upgrade_shop_visits_per_turn) + "\n"
+        res += "Expected place visits per turn: " + str(self.place_visits_per_turn) + "\n"
+        return res
+
+    def get_visits_per_turn(self, tile_code):
+        # type: (int) -> float
+        return float(self.landing_probabilities[self.tile_codes == tile_code].sum())
+
+    def get_expected_turns_to_land(self, position):
+        # type: (int) -> float
+        return 1.0 / float(self.landing_probabilities[position])
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 1:
+        print("Usage: python board_analytics.py")
+        sys.exit(1)
+
+    start_time: float = time.perf_counter()
+    board_analysis: BoardAnalysis = analyze_board(create_board())
+    print("Analyzed in " + str(time.perf_counter() - start_time) + " seconds:\n" + str(board_analysis))
+    new_board: Board = create_board()
+    for a_place, payback_turns in zip(new_board.get_places(), get_payback_turns(new_board, 1)):
+        print(str(a_place.name) + ": " + str(payback_turns) + " turns to pay back")
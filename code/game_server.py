@@ -0,0 +1,473 @@
+"""
+This file contains source code of the game server of the game "Tenzichi Own The Planet - Board Game Edition".
+One process hosts many sessions at once, each of which is a game of a player against CPUs played over a TCP or
+Unix socket connection with the line-based protocol below. Every session is played by the same rules as main(),
+through Game.begin_turn() and Game.complete_turn(), and is saved into its own file in the save directory.
+
+Every command is one line. The server answers every command with zero or more lines followed by a line which is
+either "OK" or starts with "ERROR":
+NEW NAME               starts a new session for a player called NAME and answers "SESSION SESSION_ID"
+RESUME SESSION_ID      continues a saved session
+STATE                  answers "TURN N" and a "PARTICIPANT" line per seat: seat, level, coins, EXP, position,
+                       number of places owned and name
+ROLL                   plays the turns of the CPUs up to the turn of the player and rolls the dice for him/her,
+                       answering a "TURN" line per turn played and "DECISION" if the player has to decide, or
+                       stops after the turn of a CPU owning all places with a "WINNER" line, which ends the session
+YES [UPGRADE_INDEX]    accepts the pending decision, buying the upgrade with UPGRADE_INDEX on an upgrade shop
+NO                     declines the pending decision
+SAVE                   saves the session
+QUIT                   saves the session and closes the connection
+Author: DtjiSoftwareDeveloper
+"""
+
+
+# Importing necessary libraries
+
+import os
+import sys
+import time
+import asyncio
+import logging
+import secrets
+from tenzichi_own_the_planet_board_game_edition import *
+
+
+DEFAULT_HOST: str = "127.0.0.1"
+DEFAULT_PORT: int = 8765
+MAX_LINE_LENGTH: int = 1024  # longest command a client may send, in bytes
+# Number of bytes of answers waiting to be sent to a client above which the server stops reading commands from it
+WRITE_BUFFER_HIGH_WATER: int = 64 * 1024
+IDLE_TIMEOUT: float = 600.0  # seconds after which a connection sending no commands is saved and closed
+MAX_SESSIONS: int = 10000  # largest number of connections served at once
+SAVE_FILE_EXTENSION: str = ".save"
+# Number of random bytes of a session ID, which is all a client needs to resume the session, so it must not be guessable
+SESSION_ID_BYTES: int = 16
+# Number of draws generated at once by every random stream of a session, which is small because the turns of a
+# session are far apart and thousands of sessions are kept in memory
+SESSION_RANDOM_BLOCK_SIZE: int = 64
+OK: str = "OK"
+LOGGER: logging.Logger = logging.getLogger(__name__)
+
+
+# Creating static functions to be used throughout the game server.
+
+
+def is_session_id(string):
+    # type: (str) -> bool
+    # Session IDs are hexadecimal, so that they are safe to use in file names.
+    return 0 < len(string) <= 64 and all(character in "0123456789abcdef" for character in string)
+
+
+def read_save_file(file_name):
+    # type: (str) -> bytes
+    with open(file_name, "rb") as file:
+        return file.read()
+
+
+def describe_report(report):
+    # type: (TurnReport) -> list
+    """
+    This function describes what happened during a turn for the protocol of the game server.
+    :return: a list of lines
+    """
+
+    res: list = ["TURN " + str(report.turn) + " " + str(report.participant.name) + " ROLLED " +
+                 str(report.dice_value) + " TO " + str(report.participant.position) + " " + str(report.tile.name)]
+    if report.passed_start:
+        res.append("PASSED START")
+    if report.shiny is not None:
+        res.append("SHINY " + str(report.shiny.coin_reward) + " COINS " + str(report.shiny.exp_reward) + " EXP")
+    if report.accepted:
+        res.append(("SUCCEEDED " if report.succeeded else "FAILED ") + str(report.decision) + " " +
+                   str(report.target.name))
+    return res
+
+
+# Creating necessary classes
+
+
+class Session:
+    """
+    This class contains attributes of a game played by a player over a connection to the game server.
+    The commands of the protocol are handled here without any input or output, so that they can be tested alone.
+    """
+
+    def __init__(self, session_id, game, cpu_policy):
+        # type: (str, Game, DecisionPolicy) -> None
+        self.session_id: str = session_id
+        self.game: Game = game
+        self.cpu_policy: DecisionPolicy = cpu_policy
+        self.pending_report: TurnReport or None = None  # turn of the player waiting for his/her decision
+        # Participant owning all places, after whose turn the session is finished
+        self.winner: Player or None = next((participant for participant in game.participants
+                                            if participant.owns_all_places(game)), None)
+        self.game.rng.set_block_size(SESSION_RANDOM_BLOCK_SIZE)
+
+    def get_state(self):
+        # type: () -> list
+        res: list = ["TURN " + str(self.game.turn)]
+        for seat, participant in enumerate(self.game.participants):
+            res.append("PARTICIPANT " + str(seat) + " " + str(participant.level) + " " + str(participant.coins) +
+                       " " + str(participant.exp) + " " + str(participant.position) + " " +
+                       str(participant.count_owned()) + " " + str(participant.name))
+        return res
+
+    def roll(self):
+        # type: () -> list
+        """
+        This method plays the turns of the CPUs up to the next turn of the player and starts that turn.
+        :return: a list of lines describing the turns played
+        """
+
+        if self.pending_report is not None:
+            raise ValueError("The pending decision must be answered first.")
+        if self.winner is not None:
+            raise ValueError("The session is finished.")
+
+        res: list = []  # initial value
+        game: Game = self.game
+        while game.get_participant_for_turn(game.turn + 1) is not game.player:
+            report: TurnReport = game.step(self.cpu_policy)
+            res += describe_report(report) + self.check_winner(report)
+            if self.winner is not None:
+                return res
+
+        report: TurnReport = game.begin_turn()
+        res += describe_report(report)
+        if report.decision is None:
+            game.complete_turn(report, DecisionPolicy())
+        else:
+            self.pending_report = report
+            res.append("DECISION " + str(report.decision) + " " + str(report.tile.name))
+        return res
+
+    def decide(self, accepted, upgrade_index=None):
+        # type: (bool, int or None) -> list
+        """
+        This method finishes the turn of the player with his/her answer to the pending decision.
+        :return: a list of lines describing the result
+        """
+
+        report: TurnReport or None = self.pending_report
+        if report is None:
+            raise ValueError("There is no pending decision.")
+        if accepted and report.decision == BUY_UPGRADE:
+            if upgrade_index is None or not 0 <= upgrade_index < len(report.tile.get_upgrades_sold()):
+                raise ValueError("Invalid upgrade index.")
+
+        self.pending_report = None
+        self.game.complete_turn(report, PresetDecisionPolicy(accepted, upgrade_index))
+        res: list = []  # initial value
+        if report.accepted:
+            res.append(("SUCCEEDED " if report.succeeded else "FAILED ") + str(report.decision) + " " +
+                       str(report.target.name))
+        return res + self.check_winner(report)
+
+    def check_winner(self, report):
+        # type: (TurnReport) -> list
+        # Finishes the session if the participant of the turn reported in 'report' owns all places.
+        if not report.participant.owns_all_places(self.game):
+            return []
+
+        self.winner = report.participant
+        return ["WINNER " + str(report.participant.name)]
+
+    def settle(self):
+        # type: () -> None
+        # Declines the pending decision, if any, so that the session can be saved between two turns.
+        if self.pending_report is not None:
+            self.decide(False)
+
+
+class GameServer:
+    """
+    This class contains attributes of a server hosting many sessions in one process with asyncio. Commands of a
+    connection are handled one at a time and the server waits for the answers of a command to be sent before reading
+    the next one, so that a client which does not read its answers only slows down its own session.
+    """
+
+    def __init__(self, save_directory, numeric_backend=None, n_cpus=1, cpu_policy=None, max_sessions=MAX_SESSIONS,
+                 idle_timeout=IDLE_TIMEOUT):
+        # type: (str, NumericBackend or None, int, DecisionPolicy or None, int, float) -> None
+        self.save_directory: str = save_directory
+        self.numeric_backend: NumericBackend = MPF_BACKEND if numeric_backend is None else numeric_backend
+        self.n_cpus: int = n_cpus
+        self.cpu_policy: DecisionPolicy = RandomCPUPolicy() if cpu_policy is None else cpu_policy
+        self.max_sessions: int = max_sessions
+        self.idle_timeout: float = idle_timeout
+        self.n_connections: int = 0  # initial value
+        self.active_session_ids: set = set()  # sessions played by a connection right now
+        os.makedirs(save_directory, exist_ok=True)
+
+    async def start_tcp(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        # type: (str, int) -> asyncio.AbstractServer
+        # Up to 'max_sessions' clients may connect at once before any of them is accepted.
+        return await asyncio.start_server(self.handle_connection, host, port, limit=MAX_LINE_LENGTH,
+                                          backlog=self.max_sessions)
+
+    async def start_unix(self, path):
+        # type: (str) -> asyncio.AbstractServer
+        return await asyncio.start_unix_server(self.handle_connection, path, limit=MAX_LINE_LENGTH,
+                                               backlog=self.max_sessions)
+
+    def get_save_file_name(self, session_id):
+        # type: (str) -> str
+        return os.path.join(self.save_directory, session_id + SAVE_FILE_EXTENSION)
+
+    def new_session(self, name):
+        # type: (str) -> Session
+        game: Game = Game(Player(name, self.numeric_backend), CPU(self.numeric_backend),
+                          create_board(self.numeric_backend))
+        for i in range(1, self.n_cpus):
+            game.add_participant(CPU(self.numeric_backend))
+        return Session(secrets.token_hex(SESSION_ID_BYTES), game, self.cpu_policy)
+
+    async def resume_session(self, session_id):
+        # type: (str) -> Session
+        if not is_session_id(session_id):
+            raise ValueError("Invalid session ID.")
+        try:
+            saved_game: bytes = await asyncio.to_thread(read_save_file, self.get_save_file_name(session_id))
+        except FileNotFoundError:
+            raise ValueError("Unknown session ID.")
+        try:
+            game: Game = decode_game(saved_game)
+        except Exception as error:
+            # Whatever a damaged or truncated file makes decoding raise, the client is only told that it is corrupt.
+            raise ValueError("Corrupt save.") from error
+        return Session(session_id, game, self.cpu_policy)
+
+    async def save_session(self, session):
+        # type: (Session) -> None
+        # The game is encoded here, between two commands, and only the file is written by another thread.
+        session.settle()
+        await asyncio.to_thread(write_file_atomically, self.get_save_file_name(session.session_id),
+                                encode_game(session.game))
+
+    async def handle_command(self, session, line):
+        # type: (Session or None, str) -> tuple
+        """
+        This method handles one command of a connection whose session is 'session', or None before a session is
+        started or resumed.
+        :return: a tuple of the session of the connection afterwards and the lines to answer
+        """
+
+        command, space, argument = line.strip().partition(" ")
+        command = command.upper()
+        if command in ("NEW", "RESUME"):
+            if session is not None:
+                raise ValueError("A session is already being played.")
+            if command == "NEW":
+                if argument == "":
+                    raise ValueError("A name is needed.")
+                session = self.new_session(argument)
+                self.active_session_ids.add(session.session_id)
+            else:
+                if argument in self.active_session_ids:
+                    raise ValueError("The session is being played by another connection.")
+                # Claiming the session before loading it, so that no other connection resumes it in the meantime
+                self.active_session_ids.add(argument)
+                try:
+                    session = await self.resume_session(argument)
+                except BaseException:
+                    self.active_session_ids.discard(argument)
+                    raise
+            return session, ["SESSION " + session.session_id]
+
+        if session is None:
+            raise ValueError("Start a session with NEW or RESUME first.")
+        if command == "STATE":
+            return session, session.get_state()
+        elif command == "ROLL":
+            return session, session.roll()
+        elif command == "YES":
+            return session, session.decide(True, int(argument) if argument != "" else None)
+        elif command == "NO":
+            return session, session.decide(False)
+        elif command == "SAVE":
+            if session.pending_report is not None:
+                raise ValueError("The pending decision must be answered first.")
+            await self.save_session(session)
+            return session, []
+        raise ValueError("Unknown command: " + command)
+
+    async def handle_connection(self, reader, writer):
+        # type: (asyncio.StreamReader, asyncio.StreamWriter) -> None
+        writer.transport.set_write_buffer_limits(high=WRITE_BUFFER_HIGH_WATER)
+        if self.n_connections >= self.max_sessions:
+            try:
+                writer.write(b"ERROR The server is full.\n")
+                await writer.drain()
+                writer.close()
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+            return
+
+        self.n_connections += 1
+        session: Session or None = None
+        quit_requested: bool = False  # initial value
+        try:
+            while True:
+                try:
+                    data: bytes = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+                except asyncio.TimeoutError:
+                    break
+                except ValueError:
+                    # The command is longer than MAX_LINE_LENGTH.
+                    writer.write(b"ERROR The command is too long.\n")
+                    break
+                if data == b"":
+                    break
+
+                line: str = data.decode("utf-8", "replace")
+                if line.strip().upper() == "QUIT":
+                    quit_requested = True
+                    break
+                try:
+                    session, lines = await self.handle_command(session, line)
+                    lines.append(OK)
+                except ValueError as error:
+                    lines = ["ERROR " + str(error)]
+                writer.write(("\n".join(lines) + "\n").encode("utf-8"))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.n_connections -= 1
+            answer: str = OK  # answer to QUIT
+            try:
+                if session is not None:
+                    try:
+                        await self.save_session(session)
+                    except Exception:
+                        LOGGER.exception("Could not save session " + session.session_id + ".")
+                        answer = "ERROR The session could not be saved."
+                    finally:
+                        self.active_session_ids.discard(session.session_id)
+            finally:
+                try:
+                    if quit_requested:
+                        writer.write((answer + "\n").encode("utf-8"))
+                        await writer.drain()
+                    writer.close()
+                    await writer.wait_closed()
+                except ConnectionError:
+                    pass
+
+
+class GameClient:
+    """
+    This class contains attributes of a connection to a game server, e.g. to test it over a loopback connection.
+    """
+
+    def __init__(self, reader, writer):
+        # type: (asyncio.StreamReader, asyncio.StreamWriter) -> None
+        self.reader: asyncio.StreamReader = reader
+        self.writer: asyncio.StreamWriter = writer
+
+    async def request(self, command):
+        # type: (str) -> list
+        """
+        This method sends 'command' to the server and reads its answer.
+        :return: a list of the lines of the answer, the last of which is "OK" or an error
+        """
+
+        self.writer.write((command + "\n").encode("utf-8"))
+        await self.writer.drain()
+        res: list = []  # initial value
+        while True:
+            line: str = (await self.reader.readline()).decode("utf-8").rstrip("\n")
+            res.append(line)
+            if line == OK or line.startswith("ERROR") or line == "":
+                return res
+
+    async def close(self):
+        # type: () -> None
+        await self.request("QUIT")
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+async def connect_tcp(host=DEFAULT_HOST, port=DEFAULT_PORT):
+    # type: (str, int) -> GameClient
+    reader, writer = await asyncio.open_connection(host, port)
+    return GameClient(reader, writer)
+
+
+async def connect_unix(path):
+    # type: (str) -> GameClient
+    reader, writer = await asyncio.open_unix_connection(path)
+    return GameClient(reader, writer)
+
+
+async def play_session(client, name, n_rolls):
+    # type: (GameClient, str, int) -> str
+    """
+    This function plays a new session over 'client' for 'n_rolls' turns of the player, who accepts every decision
+    and buys the first upgrade on upgrade shops.
+    :return: the ID of the session
+    """
+
+    session_id: str = (await client.request("NEW " + name))[0].split(" ")[1]
+    for i in range(n_rolls):
+        lines: list = await client.request("ROLL")
+        if any(line.startswith("DECISION") for line in lines):
+            await client.request("YES 0")
+    await client.close()
+    return session_id
+
+
+async def run_load_test(n_sessions, n_rolls, save_directory, unix_path=None):
+    # type: (int, int, str, str or None) -> float
+    """
+    This function starts a game server on a loopback TCP port, or on the Unix socket at 'unix_path', and plays
+    'n_sessions' sessions of 'n_rolls' turns of the player on it at once.
+    :return: the number of seconds taken
+    """
+
+    game_server: GameServer = GameServer(save_directory, SCIENTIFIC_BACKEND, max_sessions=n_sessions)
+    server: asyncio.AbstractServer = await (game_server.start_tcp(DEFAULT_HOST, 0) if unix_path is None
+                                            else game_server.start_unix(unix_path))
+    async with server:
+        start_time: float = time.perf_counter()
+        if unix_path is None:
+            port: int = server.sockets[0].getsockname()[1]
+            clients: list = await asyncio.gather(*[connect_tcp(DEFAULT_HOST, port) for i in range(n_sessions)])
+        else:
+            clients: list = await asyncio.gather(*[connect_unix(unix_path) for i in range(n_sessions)])
+        await asyncio.gather(*[play_session(client, "PLAYER " + str(i), n_rolls) for i, client in enumerate(clients)])
+        return time.perf_counter() - start_time
+
+
+if __name__ == '__main__':
+    if len(sys.argv) in (2, 3, 4) and sys.argv[1] == "serve":
+        async def serve():
+            # type: () -> None
+            server: asyncio.AbstractServer = await GameServer("saved_sessions").start_tcp(
+                sys.argv[2] if len(sys.argv) >= 3 else DEFAULT_HOST, int(sys.argv[3]) if len(sys.argv) == 4
+                else DEFAULT_PORT)
+            async with server:
+                await server.serve_forever()
+
+        asyncio.run(serve())
+    elif len(sys.argv) == 3 and sys.argv[1] == "serve-unix":
+        async def serve_unix():
+            # type: () -> None
+            server: asyncio.AbstractServer = await GameServer("saved_sessions").start_unix(sys.argv[2])
+            async with server:
+                await server.serve_forever()
+
+        asyncio.run(serve_unix())
+    elif len(sys.argv) in (4, 5) and sys.argv[1] == "loadtest":
+        n_test_sessions: int = int(sys.argv[2])
+        n_test_rolls: int = int(sys.argv[3])
+        seconds: float = asyncio.run(run_load_test(n_test_sessions, n_test_rolls, "load_test_sessions",
+                                                   sys.argv[4] if len(sys.argv) == 5 else None))
+        print("Played " + str(n_test_sessions) + " sessions of " + str(n_test_rolls) + " rolls at once in " +
+              str(seconds) + " seconds (" + str(n_test_sessions * n_test_rolls / seconds) + " rolls per second)")
+    else:
+        print("Usage: python game_server.py serve [HOST] [PORT]")
+        print("       python game_server.py serve-unix PATH")
+        print("       python game_server.py loadtest N_SESSIONS N_ROLLS [UNIX_SOCKET_PATH]")
+        sys.exit(1)
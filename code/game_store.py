@@ -0,0 +1,200 @@
+"""
+This file contains source code of the game store of the game "Tenzichi Own The Planet - Board Game Edition".
+A game store keeps any number of saved games in one SQLite database, one per player keyed by the player ID of the
+player of the game. Next to every saved game, its player's name and level, the turn, the game level and the number
+of places the player owns are stored in indexed columns, so that leaderboards and lookups read a few rows of an
+index instead of loading saved games. Saved games are written in batches, each committed in one transaction.
+Author: DtjiSoftwareDeveloper
+"""
+
+
+# Importing necessary libraries
+
+import sys
+import time
+import sqlite3
+from tenzichi_own_the_planet_board_game_edition import *
+
+
+DEFAULT_BATCH_SIZE: int = 500  # number of saved games written per transaction
+# Columns of the saved games which leaderboards can be ordered by
+LEADERBOARD_COLUMNS: tuple = ("level", "turn", "game_level", "places_owned")
+SUMMARY_COLUMNS: str = "player_id, name, level, turn, game_level, places_owned, saved_at"
+SCHEMA: tuple = (
+    "CREATE TABLE IF NOT EXISTS games (player_id TEXT PRIMARY KEY NOT NULL, name TEXT NOT NULL, "
+    "level INTEGER NOT NULL, turn INTEGER NOT NULL, game_level INTEGER NOT NULL, places_owned INTEGER NOT NULL, "
+    "saved_at REAL NOT NULL, saved_game BLOB NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS games_by_name ON games (name)",
+    "CREATE INDEX IF NOT EXISTS games_by_level ON games (level)",
+    "CREATE INDEX IF NOT EXISTS games_by_turn ON games (turn)",
+    "CREATE INDEX IF NOT EXISTS games_by_game_level ON games (game_level)",
+    "CREATE INDEX IF NOT EXISTS games_by_places_owned ON games (places_owned)"
+)
+
+
+class SavedGameSummary:
+    """
+    This class contains attributes of the indexed columns of a game saved into a game store.
+    """
+
+    def __init__(self, player_id, name, level, turn, game_level, places_owned, saved_at):
+        # type: (str, str, int, int, int, int, float) -> None
+        self.player_id: str = player_id
+        self.name: str = name
+        self.level: int = level
+        self.turn: int = turn
+        self.game_level: int = game_level
+        self.places_owned: int = places_owned
+        self.saved_at: float = saved_at  # seconds since the epoch
+
+    def __str__(self):
+        # type: () -> str
+        res: str = ""  # initial value
+        res += "Player ID: " + str(self.player_id) + "\n"
+        res += "Name: " + str(self.name) + "\n"
+        res += "Level: " + str(self.level) + "\n"
+        res += "Turn: " + str(self.turn) + "\n"
+        res += "Game level: " + str(self.game_level) + "\n"
+        res += "Places owned: " + str(self.places_owned) + "\n"
+        res += "Saved at: " + time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.saved_at)) + "\n"
+        return res
+
+
+class GameStore:
+    """
+    This class contains attributes of a SQLite database holding saved games. Games put into the store are kept
+    in memory until 'batch_size' of them are waiting or commit() is called, and are then written in one
+    transaction, so that saving the games of many sessions costs one commit per batch rather than one per game.
+    Queries see the games waiting to be written as well.
+    """
+
+    def __init__(self, file_name, batch_size=DEFAULT_BATCH_SIZE):
+        # type: (str, int) -> None
+        self.file_name: str = file_name
+        self.batch_size: int = batch_size
+        self.__connection: sqlite3.Connection = sqlite3.connect(file_name)
+        # Readers do not block the writer, and commits only wait for the disk at checkpoints.
+        self.__connection.execute("PRAGMA journal_mode = WAL")
+        self.__connection.execute("PRAGMA synchronous = NORMAL")
+        with self.__connection:
+            for statement in SCHEMA:
+                self.__connection.execute(statement)
+        self.__pending: dict = {}  # rows of the games waiting to be written keyed by player ID
+
+    def put(self, game):
+        # type: (Game) -> None
+        # Saves 'game' under the player ID of its player, replacing the game saved under it before.
+        player: Player = game.player
+        self.__pending[player.player_id] = (player.player_id, str(player.name), player.level, game.turn,
+                                            game.game_level, player.count_owned(), time.time(), encode_game(game))
+        if len(self.__pending) >= self.batch_size:
+            self.commit()
+
+    def commit(self):
+        # type: () -> None
+        # Writes the games waiting to be written in one transaction.
+        if len(self.__pending) > 0:
+            with self.__connection:
+                self.__connection.executemany("INSERT OR REPLACE INTO games VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                                              list(self.__pending.values()))
+            self.__pending = {}
+
+    def close(self):
+        # type: () -> None
+        self.commit()
+        self.__connection.close()
+
+    def load(self, player_id):
+        # type: (str) -> Game or None
+        # Returns the game saved under 'player_id', or None if there is none.
+        if player_id in self.__pending:
+            return decode_game(self.__pending[player_id][-1])
+
+        row: tuple or None = self.__connection.execute("SELECT saved_game FROM games WHERE player_id = ?",
+                                                       (player_id,)).fetchone()
+        return None if row is None else decode_game(row[0])
+
+    def delete(self, player_id):
+        # type: (str) -> bool
+        # Deletes the game saved under 'player_id' and returns whether there was one.
+        pending: tuple or None = self.__pending.pop(player_id, None)
+        with self.__connection:
+            n_deleted: int = self.__connection.execute("DELETE FROM games WHERE player_id = ?", (player_id,)).rowcount
+        return pending is not None or n_deleted > 0
+
+    def count(self):
+        # type: () -> int
+        self.commit()
+        return self.__connection.execute("SELECT COUNT(*) FROM games").fetchone()[0]
+
+    def get_summary(self, player_id):
+        # type: (str) -> SavedGameSummary or None
+        if player_id in self.__pending:
+            return SavedGameSummary(*self.__pending[player_id][:-1])
+
+        row: tuple or None = self.__connection.execute("SELECT " + SUMMARY_COLUMNS + " FROM games WHERE "
+                                                       "player_id = ?", (player_id,)).fetchone()
+        return None if row is None else SavedGameSummary(*row)
+
+    def find_by_name(self, name, limit=10):
+        # type: (str, int) -> list
+        # Returns the summaries of at most 'limit' games whose players are called 'name'.
+        self.commit()
+        return [SavedGameSummary(*row) for row in self.__connection.execute(
+            "SELECT " + SUMMARY_COLUMNS + " FROM games WHERE name = ? LIMIT ?", (name, limit))]
+
+    def get_leaderboard(self, column="level", limit=10):
+        # type: (str, int) -> list
+        """
+        This method finds the games with the highest values of 'column', which is one of LEADERBOARD_COLUMNS, by
+        reading the index of that column from its end.
+        :return: a list of the summaries of at most 'limit' games, the highest first
+        """
+
+        if column not in LEADERBOARD_COLUMNS:
+            raise ValueError("Unknown leaderboard column: " + str(column))
+
+        self.commit()
+        return [SavedGameSummary(*row) for row in self.__connection.execute(
+            "SELECT " + SUMMARY_COLUMNS + " FROM games ORDER BY " + column + " DESC LIMIT ?", (limit,))]
+
+
+# Creating static functions to be used throughout the game store.
+
+
+def import_save_files(store, file_names):
+    # type: (GameStore, list) -> int
+    """
+    This function puts the games saved into the files called 'file_names' into 'store', whether they were saved
+    by save_game_data() or pickled by an older version of the game.
+    :return: the number of games imported
+    """
+
+    for file_name in file_names:
+        store.put(load_game_data(file_name))
+
+    store.commit()
+    return len(file_names)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) >= 4 and sys.argv[1] == "import":
+        game_store: GameStore = GameStore(sys.argv[2])
+        print("Imported " + str(import_save_files(game_store, sys.argv[3:])) + " saved games.")
+        game_store.close()
+    elif len(sys.argv) in (3, 4, 5) and sys.argv[1] == "leaderboard":
+        game_store: GameStore = GameStore(sys.argv[2])
+        for summary in game_store.get_leaderboard(sys.argv[3] if len(sys.argv) >= 4 else "level",
+                                                  int(sys.argv[4]) if len(sys.argv) == 5 else 10):
+            print(summary)
+        game_store.close()
+    elif len(sys.argv) == 4 and sys.argv[1] == "lookup":
+        game_store: GameStore = GameStore(sys.argv[2])
+        for summary in game_store.find_by_name(sys.argv[3]):
+            print(summary)
+        game_store.close()
+    else:
+        print("Usage: python game_store.py import DATABASE_FILE SAVE_FILE ...")
+        print("       python game_store.py leaderboard DATABASE_FILE [" + "|".join(LEADERBOARD_COLUMNS) + "] [LIMIT]")
+        print("       python game_store.py lookup DATABASE_FILE NAME")
+        sys.exit(1)
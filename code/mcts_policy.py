@@ -0,0 +1,364 @@
+"""
+This file contains source code of the Monte Carlo tree search CPU of the game "Tenzichi Own The Planet - Board Game
+Edition". Before every decision, the CPU plays as many short simulated futures of the game as it can within a time
+budget and picks the option which did best. Simulations can also be run in worker processes, and the part of the
+search tree below the option picked is kept for the next decision.
+Author: DtjiSoftwareDeveloper
+"""
+
+
+# Importing necessary libraries
+
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from tenzichi_own_the_planet_board_game_edition import *
+
+
+SEARCH_EXPLORATION: float = 1.4  # weight of exploring options tried less often in the UCT formula
+ROLLOUT_TURNS: int = 20  # number of turns played in each simulated future
+LOCAL_BUDGET_SHARE: float = 0.9  # share of the time budget spent searching, the rest is left for merging results
+EVALUATION_PLACES_WEIGHT: float = 0.35
+EVALUATION_WEALTH_WEIGHT: float = 0.15
+EVALUATION_WEALTH_SCALE: float = 100.0  # difference in base 10 logarithm of wealth worth most of its weight
+WEALTH_INCOME_TURNS: int = 10  # number of turns of income counted as wealth on top of coins
+ROLLOUT_POLICY: RandomCPUPolicy = RandomCPUPolicy()  # decisions made in simulated futures outside the tree
+
+
+# Creating static functions to be used throughout the Monte Carlo tree search.
+
+
+def get_options(participant, decision, tile):
+    # type: (Player, str, Tile) -> list
+    """
+    This function lists the options 'participant' has for the pending 'decision' on 'tile'. Options which cannot be
+    afforded are left out.
+    :return: a list of upgrade indices or None for BUY_UPGRADE, or a list of booleans for the other decisions
+    """
+
+    if decision == BUY_UPGRADE:
+        return [None] + [index for index, upgrade in enumerate(tile.get_upgrades_sold())
+                         if participant.coins >= upgrade.coin_cost]
+    return [False, True] if participant.coins >= tile.coin_cost else [False]
+
+
+def get_option_policy(decision, option):
+    # type: (str, int or bool or None) -> PresetDecisionPolicy
+    if decision == BUY_UPGRADE:
+        return PresetDecisionPolicy(option is not None, option)
+    return PresetDecisionPolicy(option)
+
+
+def get_wealth_log10(participant):
+    # type: (Player) -> float
+    wealth: object = participant.coins + participant.get_coins_per_turn() * WEALTH_INCOME_TURNS
+    return participant.numeric_backend.log10(wealth) if wealth > 0 else 0.0
+
+
+def evaluate(game, participant):
+    # type: (Game, Player) -> float
+    """
+    This function estimates how good the state of 'game' is for 'participant' from the places he/she owns and
+    his/her wealth compared with those of the strongest of his/her opponents.
+    :return: 1 if 'participant' owns all places, 0 if an opponent does and a value in between otherwise
+    """
+
+    if participant.owns_all_places(game):
+        return 1.0
+
+    opponents: list = game.get_opponents(participant)
+    most_owned: int = max(opponent.count_owned() for opponent in opponents)
+    if most_owned == len(game.board.get_places()):
+        return 0.0
+
+    places_term: float = (participant.count_owned() - most_owned) / len(game.board.get_places())
+    wealth_term: float = math.tanh((get_wealth_log10(participant) -
+                                    max(get_wealth_log10(opponent) for opponent in opponents)) /
+                                   EVALUATION_WEALTH_SCALE)
+    return 0.5 + EVALUATION_PLACES_WEIGHT * places_term + EVALUATION_WEALTH_WEIGHT * wealth_term
+
+
+def create_report(game, participant, decision, tile):
+    # type: (Game, Player, str, Tile) -> TurnReport
+    # Recreates the report of the turn being played by 'participant', which is waiting for 'decision'.
+    report: TurnReport = TurnReport(game.turn, participant, 0, False, tile)
+    report.decision = decision
+    if decision == ACQUIRE_PLACE:
+        report.owner = game.get_owner(tile)
+    return report
+
+
+def search(game, participant, decision, tile, root, deadline, rng, exploration=SEARCH_EXPLORATION,
+           rollout_turns=ROLLOUT_TURNS):
+    # type: (Game, Player, str, Tile, SearchNode, float, SearchRandom, float, int) -> int
+    """
+    This function runs simulations from the pending 'decision' of 'participant' in 'game' until time.perf_counter()
+    reaches 'deadline', adding their results to the tree under 'root'. The game is left as it was, and the random
+    numbers of the simulations come from 'rng' rather than from the game, so that they do not foresee its dice.
+    Simulated turns are neither reported nor measured. The simulations take and restore snapshots of the game, which
+    replace its own ones, so a game being played should be searched on a copy of it.
+    :return: the number of simulations run
+    """
+
+    root_snapshot: GameSnapshot = game.snapshot()
+    game_rng: RandomService = game.rng
+    game_metrics: TurnMetrics or None = game.metrics
+    game_reports: list or None = game.reports
+    game.rng = rng
+    game.metrics = None
+    game.reports = None
+    n_simulations: int = 0  # initial value
+    try:
+        while n_simulations == 0 or time.perf_counter() < deadline:
+            simulate_future(game, participant, create_report(game, participant, decision, tile), root, exploration,
+                            rollout_turns)
+            game.restore(root_snapshot)
+            n_simulations += 1
+    finally:
+        game.restore(root_snapshot)
+        game.rng = game_rng
+        game.metrics = game_metrics
+        game.reports = game_reports
+
+    return n_simulations
+
+
+def simulate_future(game, participant, report, root, exploration, rollout_turns):
+    # type: (Game, Player, TurnReport, SearchNode, float, int) -> None
+    """
+    This function plays one simulated future of 'game' from the decision in 'report'. Decisions of 'participant'
+    are picked by the tree as long as the future stays in it, the first decision outside the tree adds a node to
+    it, and the rest of the future is played with ROLLOUT_POLICY.
+    :return: None
+    """
+
+    path: list = []  # pairs of node and option picked there
+    node: SearchNode or None = root
+    last_turn: int = game.turn + rollout_turns
+    while True:
+        if report.participant is participant and report.decision is not None and node is not None:
+            option: int or bool or None = node.select(get_options(participant, report.decision, report.tile),
+                                                      exploration)
+            path.append((node, option))
+            game.complete_turn(report, get_option_policy(report.decision, option))
+            if node.visits.get(option, 0) == 0:
+                node = None  # the rest of the future is outside the tree
+            else:
+                node = node.get_child(option, (report.decision, participant.position))
+        else:
+            game.complete_turn(report, ROLLOUT_POLICY)
+
+        if report.participant.owns_all_places(game) or game.turn >= last_turn:
+            break
+        report = game.begin_turn()
+
+    value: float = evaluate(game, participant)
+    for path_node, option in path:
+        path_node.update(option, value)
+
+
+def search_saved_game(saved_game, seat, decision, wall_deadline, exploration, rollout_turns, seed):
+    # type: (bytes, int, str, float, float, int, int) -> tuple
+    """
+    This function runs a search in a worker process on a game saved with encode_game() while the participant in
+    'seat' waits for 'decision'. The search stops when time.time() reaches 'wall_deadline', which unlike
+    time.perf_counter() is shared by all processes.
+    :return: a tuple of the number of visits and total value of each option at the root
+    """
+
+    game: Game = decode_game(saved_game)
+    participant: Player = game.participants[seat]
+    root: SearchNode = SearchNode()
+    search(game, participant, decision, game.board.get_tiles()[participant.position], root,
+           time.perf_counter() + wall_deadline - time.time(), SearchRandom(seed), exploration, rollout_turns)
+    return root.visits, root.values
+
+
+# Creating necessary classes
+
+
+class SearchRandom(random.Random):
+    """
+    This class contains attributes of the random number generator of simulated futures. It can stand in for the
+    random number service of a game.
+    """
+
+    def begin_turn(self, turn, seat):
+        # type: (int, int) -> None
+        pass
+
+    def draws(self, kind):
+        # type: (int) -> SearchRandom
+        return self
+
+
+class SearchNode:
+    """
+    This class contains attributes of a decision of the searching participant in the search tree. Its children are
+    the next decisions of the participant, keyed by the option picked here and then by the kind of decision and
+    position of the participant, as the turns in between are random.
+    """
+
+    __slots__ = ("visits", "values", "children", "total_visits")
+
+    def __init__(self):
+        # type: () -> None
+        self.visits: dict = {}  # number of simulations through each option
+        self.values: dict = {}  # total value of the simulations through each option
+        self.children: dict = {}  # initial value
+        self.total_visits: int = 0  # initial value
+
+    def select(self, options, exploration):
+        # type: (list, float) -> int or bool or None
+        # Options never tried are picked first, then the one with the highest upper confidence bound.
+        best_option: int or bool or None = None  # initial value
+        best_score: float = float("-inf")  # initial value
+        log_total_visits: float = math.log(max(1, self.total_visits))
+        for option in options:
+            visits: int = self.visits.get(option, 0)
+            if visits == 0:
+                return option
+            score: float = self.values[option] / visits + exploration * math.sqrt(log_total_visits / visits)
+            if score > best_score:
+                best_option, best_score = option, score
+
+        return best_option
+
+    def update(self, option, value):
+        # type: (int or bool or None, float) -> None
+        self.visits[option] = self.visits.get(option, 0) + 1
+        self.values[option] = self.values.get(option, 0.0) + value
+        self.total_visits += 1
+
+    def get_child(self, option, key):
+        # type: (int or bool or None, tuple) -> SearchNode
+        children: dict = self.children.setdefault(option, {})
+        child: SearchNode or None = children.get(key)
+        if child is None:
+            child = SearchNode()
+            children[key] = child
+        return child
+
+
+class MCTSPolicy(DecisionPolicy):
+    """
+    This class contains the decisions of a CPU which searches for the best option with Monte Carlo tree search
+    within 'time_budget' seconds per decision. If 'workers' is positive, that many worker processes search as well
+    and their results are merged into those of the search in this process. The worker processes are started with the
+    policy and shut down by close(), which leaving a with statement calls.
+    """
+
+    def __init__(self, time_budget=0.05, workers=0, exploration=SEARCH_EXPLORATION, rollout_turns=ROLLOUT_TURNS,
+                 seed=None):
+        # type: (float, int, float, int, int or None) -> None
+        self.time_budget: float = time_budget
+        self.workers: int = workers
+        self.exploration: float = exploration
+        self.rollout_turns: int = rollout_turns
+        self.last_simulations: int = 0  # number of simulations run in this process for the last decision
+        self.last_worker_simulations: int = 0  # number of simulations merged from worker processes
+        self.__rng: SearchRandom = SearchRandom(seed)
+        # Worker processes, which are shut down by close()
+        self.__executor: ProcessPoolExecutor or None = ProcessPoolExecutor(max_workers=workers) if workers > 0 \
+            else None
+        self.__game: Game or None = None  # game of the last decision
+        self.__participant: Player or None = None  # participant of the last decision
+        self.__root: SearchNode or None = None  # search tree of the last decision
+        self.__root_option: int or bool or None = None  # option picked at the last decision
+
+    def __enter__(self):
+        # type: () -> MCTSPolicy
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # type: (type, BaseException, object) -> None
+        self.close()
+
+    def close(self):
+        # type: () -> None
+        # Shuts the worker processes down, after which only the search in this process is run.
+        if self.__executor is not None:
+            self.__executor.shutdown(cancel_futures=True)
+            self.__executor = None
+
+    def choose_upgrade(self, game, participant, upgrade_shop):
+        # type: (Game, Player, UpgradeShop) -> int or None
+        return self.__choose(game, participant, BUY_UPGRADE, upgrade_shop)
+
+    def should_purchase_place(self, game, participant, place):
+        # type: (Game, Player, Place) -> bool
+        return self.__choose(game, participant, PURCHASE_PLACE, place)
+
+    def should_upgrade_place(self, game, participant, place):
+        # type: (Game, Player, Place) -> bool
+        return self.__choose(game, participant, UPGRADE_PLACE, place)
+
+    def should_acquire_place(self, game, participant, place, owner):
+        # type: (Game, Player, Place, Player) -> bool
+        return self.__choose(game, participant, ACQUIRE_PLACE, place)
+
+    def __get_root(self, game, participant, decision):
+        # type: (Game, Player, str) -> SearchNode
+        # Reuses the subtree for this decision if it was reached by the search for the last decision.
+        if self.__root is not None and game is self.__game and participant is self.__participant:
+            child: SearchNode or None = \
+                self.__root.children.get(self.__root_option, {}).get((decision, participant.position))
+            if child is not None:
+                return child
+        return SearchNode()
+
+    def __choose(self, game, participant, decision, tile):
+        # type: (Game, Player, str, Tile) -> int or bool or None
+        start_time: float = time.perf_counter()
+        root: SearchNode = self.__get_root(game, participant, decision)
+        options: list = get_options(participant, decision, tile)
+        option: int or bool or None = options[0]
+        self.last_simulations = 0
+        self.last_worker_simulations = 0
+        if len(options) > 1:
+            futures: list = []  # initial value
+            if self.__executor is not None:
+                saved_game: bytes = encode_game(game)
+                wall_deadline: float = time.time() + self.time_budget * LOCAL_BUDGET_SHARE - \
+                    (time.perf_counter() - start_time)
+                futures = [self.__executor.submit(search_saved_game, saved_game, game.get_seat(participant), decision,
+                                                  wall_deadline, self.exploration, self.rollout_turns,
+                                                  self.__rng.getrandbits(64)) for i in range(self.workers)]
+
+            # Searching on a copy of the game, so that the snapshots of the game for undo() and autosaves are kept
+            search_game: Game = game.clone()
+            search_participant: Player = search_game.participants[game.get_seat(participant)]
+            self.last_simulations = search(search_game, search_participant, decision,
+                                           search_game.board.get_tiles()[participant.position], root,
+                                           start_time + self.time_budget * LOCAL_BUDGET_SHARE, self.__rng,
+                                           self.exploration, self.rollout_turns)
+            visits: dict = dict(root.visits)
+            for future in futures:
+                try:
+                    worker_visits, worker_values = \
+                        future.result(timeout=max(0.0, start_time + self.time_budget - time.perf_counter()))
+                except FutureTimeoutError:
+                    future.cancel()  # too late to be used for this decision
+                    continue
+                for worker_option, worker_option_visits in worker_visits.items():
+                    visits[worker_option] = visits.get(worker_option, 0) + worker_option_visits
+                    self.last_worker_simulations += worker_option_visits
+
+            # The most visited option is the most reliable one.
+            option = max(options, key=lambda an_option: visits.get(an_option, 0))
+
+        self.__game = game
+        self.__participant = participant
+        self.__root = root
+        self.__root_option = option
+        return option
+
+
+if __name__ == '__main__':
+    if len(sys.argv) not in (1, 2, 3):
+        print("Usage: python mcts_policy.py [TIME_BUDGET_SECONDS] [WORKERS]")
+        sys.exit(1)
+
+    with MCTSPolicy(float(sys.argv[1]) if len(sys.argv) >= 2 else 0.05,
+                    int(sys.argv[2]) if len(sys.argv) == 3 else 0) as mcts_policy:
+        main(mcts_policy)
@@ -0,0 +1,91 @@
+"""
+This file contains source code of the startup time measurement of the game "Tenzichi Own The Planet - Board Game
+Edition". Every run imports the game in a new process, like the many short-lived processes of a test harness, and
+measures how long the import and the creation of a new game take. The script fails if the median import time is
+above STARTUP_TIME_TARGET or if importing the game imports any of the libraries it defers.
+Author: DtjiSoftwareDeveloper
+"""
+
+
+# Importing necessary libraries
+
+import os
+import sys
+import json
+import statistics
+import subprocess
+
+
+STARTUP_TIME_TARGET: float = 0.05  # largest median number of seconds importing the game may take
+DEFERRED_MODULES: tuple = ("mpmath", "numpy", "uuid", "pickle")  # libraries only imported once a game needs them
+# Code run by every new process, which prints the measurements as JSON
+MEASUREMENT_CODE: str = """
+import sys
+import json
+import time
+start_time = time.perf_counter()
+import tenzichi_own_the_planet_board_game_edition as game_module
+import_time = time.perf_counter() - start_time
+imported_modules = [name for name in %r if name in sys.modules]
+start_time = time.perf_counter()
+game_module.Game(game_module.Player("PLAYER"), game_module.CPU(), game_module.create_board())
+new_game_time = time.perf_counter() - start_time
+print(json.dumps({"import_time": import_time, "new_game_time": new_game_time, "imported_modules": imported_modules}))
+""" % (DEFERRED_MODULES,)
+
+
+# Creating static functions to be used throughout the startup time measurement.
+
+
+def measure_startup(n_runs):
+    # type: (int) -> list
+    """
+    This function starts 'n_runs' new processes which import the game and create a new game.
+    :return: a list of the measurements of every process
+    """
+
+    res: list = []  # initial value
+    for i in range(n_runs):
+        output: bytes = subprocess.check_output([sys.executable, "-c", MEASUREMENT_CODE],
+                                                cwd=os.path.dirname(os.path.abspath(__file__)))
+        res.append(json.loads(output))
+
+    return res
+
+
+def check_startup(measurements, target=STARTUP_TIME_TARGET):
+    # type: (list, float) -> list
+    """
+    This function checks 'measurements' made by measure_startup() against 'target'.
+    :return: a list of the problems found, which is empty if the startup time meets the target
+    """
+
+    res: list = []  # initial value
+    median_import_time: float = statistics.median(measurement["import_time"] for measurement in measurements)
+    if median_import_time > target:
+        res.append("Importing the game takes " + str(median_import_time) + " seconds, which is above the target of " +
+                   str(target) + " seconds.")
+
+    imported_modules: set = {name for measurement in measurements for name in measurement["imported_modules"]}
+    if len(imported_modules) > 0:
+        res.append("Importing the game imports " + ", ".join(sorted(imported_modules)) + ".")
+
+    return res
+
+
+if __name__ == '__main__':
+    if len(sys.argv) not in (1, 2):
+        print("Usage: python startup_time.py [N_RUNS]")
+        sys.exit(1)
+
+    startup_measurements: list = measure_startup(int(sys.argv[1]) if len(sys.argv) == 2 else 20)
+    print("Median import time: " +
+          str(statistics.median(measurement["import_time"] for measurement in startup_measurements)) + " seconds")
+    print("Median new game time: " +
+          str(statistics.median(measurement["new_game_time"] for measurement in startup_measurements)) + " seconds")
+    print("Target import time: " + str(STARTUP_TIME_TARGET) + " seconds")
+    problems: list = check_startup(startup_measurements)
+    for problem in problems:
+        print(problem)
+
+    sys.exit(1 if len(problems) > 0 else 0)
@@ -0,0 +1,412 @@
+"""
+This file contains source code of the streaming analytics of the game "Tenzichi Own The Planet - Board Game Edition".
+Simulated games are turned by generators into a stream of chunks of events, each holding a few columns of at most
+about 'chunk_size' rows per table. Every chunk is written into its own .npz file as it passes by and folded into
+aggregates whose size does not depend on the number of games, so that any number of games is analyzed in constant
+memory: win rates, the turn by which every place is owned, how often each place is bought, upgraded and acquired,
+the mix of upgrades bought and quantiles of log10 coins and EXP every 'sample_interval' turns.
+Author: DtjiSoftwareDeveloper
+"""
+
+
+# Importing necessary libraries
+
+import os
+import sys
+import time
+import array
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from tenzichi_own_the_planet_board_game_edition import *
+
+
+DEFAULT_CHUNK_SIZE: int = 65536  # number of rows of a table of a chunk of events after which the chunk is complete
+DEFAULT_SAMPLE_INTERVAL: int = 100  # number of turns between samples of the coins and EXP of the participants
+DECISION_CODES: dict = {BUY_UPGRADE: 1, PURCHASE_PLACE: 2, UPGRADE_PLACE: 3, ACQUIRE_PLACE: 4}
+NO_TARGET: int = -1  # target of a declined offer to buy an upgrade
+# Columns of the tables of a chunk of events and their array type codes
+TRANSACTION_COLUMNS: tuple = (("game_index", "q"), ("turn", "q"), ("seat", "H"), ("decision", "B"), ("target", "q"),
+                              ("accepted", "B"), ("succeeded", "B"))
+SAMPLE_COLUMNS: tuple = (("game_index", "q"), ("turn", "q"), ("seat", "H"), ("log10_coins", "d"),
+                         ("log10_exp", "d"))
+GAME_COLUMNS: tuple = (("game_index", "q"), ("turns", "q"), ("winner", "q"), ("all_owned_turn", "q"))
+# Upper edges of the buckets of the histograms of log10 coins and EXP: one bucket for values below 1 and
+# LOG10_BUCKETS_PER_DECADE buckets for every decade of values up to 10 ** LOG10_DECADES, the last bucket being unbounded
+LOG10_BUCKETS_PER_DECADE: int = 1000
+LOG10_DECADES: int = 8
+LOG10_BUCKET_EDGES: np.ndarray = 10.0 ** (np.arange(LOG10_DECADES * LOG10_BUCKETS_PER_DECADE + 1) /
+                                          LOG10_BUCKETS_PER_DECADE)
+TURN_BUCKETS: int = 1000  # number of buckets of the histogram of the turns by which every place is owned
+QUANTILES: tuple = (0.05, 0.25, 0.5, 0.75, 0.95)
+ANALYTICS_FILE_NAME: str = "analytics.npz"
+
+
+# Creating static functions to be used throughout the streaming analytics.
+
+
+def get_histogram_bucket(edges, values):
+    # type: (np.ndarray, np.ndarray) -> np.ndarray
+    # Values below edges[0] are in bucket 0, values in [edges[i - 1], edges[i]) in bucket i and the others in the last.
+    return np.searchsorted(edges, values, side="right")
+
+
+def get_histogram_quantiles(counts, edges, quantiles=QUANTILES):
+    # type: (np.ndarray, np.ndarray, tuple) -> np.ndarray
+    """
+    This function estimates 'quantiles' of the values counted into the buckets of 'counts' with upper edges 'edges',
+    interpolating linearly within a bucket.
+    :return: an array of the quantiles, which are NaN if nothing was counted
+    """
+
+    total: int = int(counts.sum())
+    if total == 0:
+        return np.full(len(quantiles), np.nan)
+
+    cumulative_counts: np.ndarray = np.cumsum(counts)
+    res: list = []  # initial value
+    for quantile in quantiles:
+        target: float = quantile * total
+        bucket: int = min(int(np.searchsorted(cumulative_counts, target, side="left")), len(counts) - 1)
+        lower: float = float(edges[max(bucket - 1, 0)])
+        upper: float = float(edges[min(bucket, len(edges) - 1)])
+        before: float = float(cumulative_counts[bucket] - counts[bucket])
+        fraction: float = (target - before) / counts[bucket] if counts[bucket] > 0 else 0.0
+        res.append(lower + fraction * (upper - lower))
+
+    return np.array(res)
+
+
+def generate_event_chunks(first_game_index, last_game_index, max_turns, seed, numeric_backend=None,
+                          n_participants=2, sample_interval=DEFAULT_SAMPLE_INTERVAL, chunk_size=DEFAULT_CHUNK_SIZE,
+                          board_file_name=None):
+    # type: (int, int, int, int, NumericBackend or None, int, int, int, str or None) -> iter
+    """
+    This function plays the games with indices in the range [first_game_index, last_game_index) of 'n_participants'
+    CPUs of at most 'max_turns' turns each, like simulate() does, on the board saved into 'board_file_name' if it is
+    given. Each game is fast-forwarded 'sample_interval' turns at a time, after which the decisions of the turns
+    played in full are taken from its reports and the coins and EXP of its participants are sampled. Only one game
+    and one chunk are held in memory at once.
+    :return: a generator of the chunks of the events of the games
+    """
+
+    policy: RandomCPUPolicy = RandomCPUPolicy()
+    chunk: EventChunk = EventChunk()
+    for game_index in range(first_game_index, last_game_index):
+        board: Board = create_board(numeric_backend) if board_file_name is None else \
+            load_board(board_file_name, numeric_backend)
+        game: Game = Game(CPU(numeric_backend), CPU(numeric_backend), board, seed, game_index)
+        for seat in range(2, n_participants):
+            game.add_participant(CPU(numeric_backend))
+        upgrade_indices: dict = {upgrade.name: index for index, upgrade in enumerate(board.get_upgrade_catalog())}
+        n_unowned_places: int = len(board.get_places())
+        all_owned_turn: int = -1  # initial value
+        winner: Player or None = None  # initial value
+        game.reports = []
+        while winner is None and game.turn < max_turns:
+            next_sample_turn: int = (game.turn // sample_interval + 1) * sample_interval
+            winner = game.fast_forward(min(next_sample_turn, max_turns) - game.turn, policy)
+            for report in game.reports:
+                if report.decision is None:
+                    continue
+
+                if report.decision == BUY_UPGRADE:
+                    target: int = NO_TARGET if report.target is None else upgrade_indices[report.target.name]
+                else:
+                    target: int = report.tile.ordinal
+                chunk.add_transaction(game_index, report.turn, game.get_seat(report.participant),
+                                      DECISION_CODES[report.decision], target, report.accepted, report.succeeded)
+                if report.decision == PURCHASE_PLACE and report.succeeded:
+                    n_unowned_places -= 1
+                    if n_unowned_places == 0:
+                        all_owned_turn = report.turn
+
+            game.reports.clear()
+            if game.turn % sample_interval == 0:
+                for seat, participant in enumerate(game.participants):
+                    backend: NumericBackend = participant.numeric_backend
+                    chunk.add_sample(game_index, game.turn, seat, backend.log10(participant.coins),
+                                     backend.log10(participant.exp))
+
+            if chunk.count_rows() >= chunk_size:
+                yield chunk
+                chunk = EventChunk()
+
+        chunk.add_game(game_index, game.turn, -1 if winner is None else game.get_seat(winner), all_owned_turn)
+
+    if chunk.count_rows() > 0:
+        yield chunk
+
+
+def write_event_chunks(chunks, directory, prefix="events"):
+    # type: (iter, str, str) -> iter
+    """
+    This function writes every chunk of 'chunks' into its own compressed .npz file in 'directory' as it passes by.
+    :return: a generator of the same chunks
+    """
+
+    os.makedirs(directory, exist_ok=True)
+    for index, chunk in enumerate(chunks):
+        np.savez_compressed(os.path.join(directory, prefix + "_" + str(index).zfill(6) + ".npz"),
+                            **chunk.get_columns())
+        yield chunk
+
+
+def load_event_chunks(directory, prefix="events"):
+    # type: (str, str) -> iter
+    """
+    This function reads the chunks written by write_event_chunks() into 'directory' one at a time.
+    :return: a generator of dictionaries of the columns of every chunk
+    """
+
+    for file_name in sorted(os.listdir(directory)):
+        if file_name.startswith(prefix + "_") and file_name.endswith(".npz"):
+            with np.load(os.path.join(directory, file_name)) as columns:
+                yield {name: columns[name] for name in columns.files}
+
+
+def analyze_games(first_game_index, last_game_index, max_turns, seed, numeric_backend_name="mpf", n_participants=2,
+                  sample_interval=DEFAULT_SAMPLE_INTERVAL, chunk_size=DEFAULT_CHUNK_SIZE, directory=None,
+                  board_file_name=None):
+    # type: (int, int, int, int, str, int, int, int, str or None, str or None) -> StreamingAnalytics
+    """
+    This function runs the pipeline over the games with indices in the range [first_game_index, last_game_index).
+    It is run in the worker processes of run_pipeline(). The chunks of events are written into 'directory' if it is
+    given, into files named after the first game.
+    :return: the aggregates of the games
+    """
+
+    numeric_backend: NumericBackend = get_numeric_backend(numeric_backend_name)
+    board: Board = create_board(numeric_backend) if board_file_name is None else \
+        load_board(board_file_name, numeric_backend)
+    analytics: StreamingAnalytics = StreamingAnalytics(len(board.get_places()), [
+        upgrade.name for upgrade in board.get_upgrade_catalog()], n_participants, max_turns, sample_interval)
+    chunks: iter = generate_event_chunks(first_game_index, last_game_index, max_turns, seed, numeric_backend,
+                                         n_participants, sample_interval, chunk_size, board_file_name)
+    if directory is not None:
+        chunks = write_event_chunks(chunks, directory, "events_" + str(first_game_index).zfill(9))
+    for chunk in chunks:
+        analytics.add_chunk(chunk.get_columns())
+
+    return analytics
+
+
+def run_pipeline(n_games, max_turns, seed, directory=None, workers=None, games_per_task=1000,
+                 numeric_backend_name="mpf", n_participants=2, sample_interval=DEFAULT_SAMPLE_INTERVAL,
+                 chunk_size=DEFAULT_CHUNK_SIZE, board_file_name=None):
+    # type: (int, int, int, str or None, int or None, int, str, int, int, int, str or None) -> StreamingAnalytics
+    """
+    This function simulates 'n_games' games over a pool of 'workers' processes (one per CPU core by default) and
+    analyzes them with the streaming pipeline. The chunks of events and the aggregates, in ANALYTICS_FILE_NAME, are
+    written into 'directory' if it is given. The results only depend on the arguments other than 'workers',
+    'games_per_task' and 'chunk_size'.
+    :return: the merged aggregates of all games
+    """
+
+    start_time: float = time.perf_counter()
+    analytics: StreamingAnalytics or None = None  # initial value
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures: list = [executor.submit(analyze_games, first, min(first + games_per_task, n_games), max_turns, seed,
+                                         numeric_backend_name, n_participants, sample_interval, chunk_size,
+                                         directory, board_file_name)
+                         for first in range(0, n_games, games_per_task)]
+        for future in futures:
+            analytics = future.result() if analytics is None else analytics.merge(future.result())
+
+    analytics.elapsed_seconds = time.perf_counter() - start_time
+    if directory is not None:
+        analytics.save(os.path.join(directory, ANALYTICS_FILE_NAME))
+    return analytics
+
+
+# Creating necessary classes
+
+
+class EventChunk:
+    """
+    This class contains attributes of a chunk of the events of simulated games in three tables of typed columns:
+    the decisions made during turns, samples of the coins and EXP of the participants and the results of games.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self.transactions: dict = {name: array.array(type_code) for name, type_code in TRANSACTION_COLUMNS}
+        self.samples: dict = {name: array.array(type_code) for name, type_code in SAMPLE_COLUMNS}
+        self.games: dict = {name: array.array(type_code) for name, type_code in GAME_COLUMNS}
+
+    def add_transaction(self, game_index, turn, seat, decision, target, accepted, succeeded):
+        # type: (int, int, int, int, int, bool, bool) -> None
+        for name, value in zip(("game_index", "turn", "seat", "decision", "target", "accepted", "succeeded"),
+                               (game_index, turn, seat, decision, target, accepted, succeeded)):
+            self.transactions[name].append(value)
+
+    def add_sample(self, game_index, turn, seat, log10_coins, log10_exp):
+        # type: (int, int, int, float, float) -> None
+        for name, value in zip(("game_index", "turn", "seat", "log10_coins", "log10_exp"),
+                               (game_index, turn, seat, log10_coins, log10_exp)):
+            self.samples[name].append(value)
+
+    def add_game(self, game_index, turns, winner, all_owned_turn):
+        # type: (int, int, int, int) -> None
+        for name, value in zip(("game_index", "turns", "winner", "all_owned_turn"),
+                               (game_index, turns, winner, all_owned_turn)):
+            self.games[name].append(value)
+
+    def count_rows(self):
+        # type: () -> int
+        return max(len(self.transactions["turn"]), len(self.samples["turn"]), len(self.games["turns"]))
+
+    def get_columns(self):
+        # type: () -> dict
+        # Returns the columns as arrays keyed by "TABLE.COLUMN", sharing memory with this chunk.
+        res: dict = {}  # initial value
+        for table_name, table in (("transactions", self.transactions), ("samples", self.samples),
+                                  ("games", self.games)):
+            for name, column in table.items():
+                res[table_name + "." + name] = np.frombuffer(column, dtype=column.typecode)
+
+        return res
+
+
+class StreamingAnalytics:
+    """
+    This class contains attributes of aggregates of the events of simulated games, which take the same memory for
+    any number of games. Coins and EXP are aggregated as histograms of their log10 with LOG10_BUCKETS_PER_DECADE
+    buckets per decade, per sampled turn, so their quantiles are estimated to within about 0.23% of their log10. The
+    trajectories only cover the games still being played at each sampled turn. Aggregates of different games can be
+    merged.
+    """
+
+    def __init__(self, n_places, upgrade_names, n_participants, max_turns, sample_interval):
+        # type: (int, list, int, int, int) -> None
+        self.upgrade_names: list = upgrade_names
+        self.n_participants: int = n_participants
+        self.max_turns: int = max_turns
+        self.sample_interval: int = sample_interval
+        self.elapsed_seconds: float = 0.0  # initial value
+        self.n_games: int = 0  # initial value
+        self.total_turns: int = 0  # initial value
+        self.wins: np.ndarray = np.zeros(n_participants + 1, dtype=np.int64)  # wins of every seat, unfinished last
+        self.turn_edges: np.ndarray = np.linspace(0, max_turns, TURN_BUCKETS + 1)[1:]
+        self.all_owned_turn_counts: np.ndarray = np.zeros(TURN_BUCKETS + 1, dtype=np.int64)
+        self.place_purchases: np.ndarray = np.zeros(n_places, dtype=np.int64)
+        self.place_upgrades: np.ndarray = np.zeros(n_places, dtype=np.int64)
+        self.place_acquisitions: np.ndarray = np.zeros(n_places, dtype=np.int64)
+        self.upgrade_purchases: np.ndarray = np.zeros(len(upgrade_names), dtype=np.int64)
+        n_samples: int = max_turns // sample_interval
+        self.coin_counts: np.ndarray = np.zeros((n_samples, len(LOG10_BUCKET_EDGES) + 1), dtype=np.int64)
+        self.exp_counts: np.ndarray = np.zeros((n_samples, len(LOG10_BUCKET_EDGES) + 1), dtype=np.int64)
+
+    def __str__(self):
+        # type: () -> str
+        res: str = ""  # initial value
+        res += "Games analyzed: " + str(self.n_games) + "\n"
+        res += "Turns played: " + str(self.total_turns) + "\n"
+        res += "Elapsed seconds: " + str(self.elapsed_seconds) + "\n"
+        if self.elapsed_seconds > 0:
+            res += "Turns per second: " + str(self.total_turns / self.elapsed_seconds) + "\n"
+        for seat, win_rate in enumerate(self.get_win_rates()):
+            res += ("Unfinished games: " if seat == self.n_participants else "Win rate of seat " + str(seat) + ": ") + \
+                str(win_rate) + "\n"
+        res += "Games in which every place was owned: " + str(int(self.all_owned_turn_counts.sum())) + "\n"
+        res += "Quantiles of the turn by which every place was owned: " + \
+            str(self.get_all_owned_turn_quantiles().round(1).tolist()) + "\n"
+        res += "Places bought most often: " + str(np.argsort(-self.place_purchases, kind="stable")[:5].tolist()) + "\n"
+        res += "Places acquired most often: " + \
+            str(np.argsort(-self.place_acquisitions, kind="stable")[:5].tolist()) + "\n"
+        for name, share in zip(self.upgrade_names, self.get_upgrade_mix()):
+            res += "Share of upgrades bought which are " + str(name) + ": " + str(share) + "\n"
+        n_samples: int = len(self.coin_counts)
+        for index in sorted({0, n_samples // 2, n_samples - 1}) if n_samples > 0 else []:
+            turn: int = (index + 1) * self.sample_interval
+            res += "Quantiles of log10 coins at turn " + str(turn) + ": " + \
+                str(get_histogram_quantiles(self.coin_counts[index], LOG10_BUCKET_EDGES).round(1).tolist()) + "\n"
+            res += "Quantiles of log10 EXP at turn " + str(turn) + ": " + \
+                str(get_histogram_quantiles(self.exp_counts[index], LOG10_BUCKET_EDGES).round(1).tolist()) + "\n"
+        return res
+
+    def add_chunk(self, columns):
+        # type: (dict) -> None
+        # Folds the columns of a chunk of events, as returned by EventChunk.get_columns(), into these aggregates.
+        decisions: np.ndarray = columns["transactions.decision"]
+        succeeded: np.ndarray = columns["transactions.succeeded"].astype(bool)
+        targets: np.ndarray = columns["transactions.target"]
+        for decision, counts in ((PURCHASE_PLACE, self.place_purchases), (UPGRADE_PLACE, self.place_upgrades),
+                                 (ACQUIRE_PLACE, self.place_acquisitions), (BUY_UPGRADE, self.upgrade_purchases)):
+            counts += np.bincount(targets[succeeded & (decisions == DECISION_CODES[decision])],
+                                  minlength=len(counts))
+
+        sample_indices: np.ndarray = columns["samples.turn"] // self.sample_interval - 1
+        for values, counts in ((columns["samples.log10_coins"], self.coin_counts),
+                               (columns["samples.log10_exp"], self.exp_counts)):
+            flat_indices: np.ndarray = sample_indices * counts.shape[1] + get_histogram_bucket(LOG10_BUCKET_EDGES,
+                                                                                                values)
+            counts += np.bincount(flat_indices, minlength=counts.size).reshape(counts.shape)
+
+        winners: np.ndarray = columns["games.winner"]
+        all_owned_turns: np.ndarray = columns["games.all_owned_turn"]
+        self.n_games += len(winners)
+        self.total_turns += int(columns["games.turns"].sum())
+        self.wins += np.bincount(np.where(winners < 0, self.n_participants, winners), minlength=len(self.wins))
+        self.all_owned_turn_counts += np.bincount(get_histogram_bucket(
+            self.turn_edges, all_owned_turns[all_owned_turns >= 0]), minlength=len(self.all_owned_turn_counts))
+
+    def merge(self, other):
+        # type: (StreamingAnalytics) -> StreamingAnalytics
+        # Adds the aggregates of 'other', which must have been made with the same settings, to these.
+        self.n_games += other.n_games
+        self.total_turns += other.total_turns
+        for name in ("wins", "all_owned_turn_counts", "place_purchases", "place_upgrades", "place_acquisitions",
+                     "upgrade_purchases", "coin_counts", "exp_counts"):
+            getattr(self, name).__iadd__(getattr(other, name))
+        return self
+
+    def get_win_rates(self):
+        # type: () -> np.ndarray
+        # Returns the share of the games won by every seat, followed by the share of unfinished games.
+        return self.wins / max(self.n_games, 1)
+
+    def get_all_owned_turn_quantiles(self):
+        # type: () -> np.ndarray
+        return get_histogram_quantiles(self.all_owned_turn_counts, self.turn_edges)
+
+    def get_upgrade_mix(self):
+        # type: () -> np.ndarray
+        return self.upgrade_purchases / max(int(self.upgrade_purchases.sum()), 1)
+
+    def get_trajectory_quantiles(self):
+        # type: () -> tuple
+        """
+        This method estimates QUANTILES of log10 coins and EXP at every sampled turn.
+        :return: a tuple of the sampled turns and two arrays of shape (number of sampled turns, len(QUANTILES))
+        """
+
+        turns: np.ndarray = np.arange(1, len(self.coin_counts) + 1) * self.sample_interval
+        return turns, np.array([get_histogram_quantiles(counts, LOG10_BUCKET_EDGES) for counts in self.coin_counts]), \
+            np.array([get_histogram_quantiles(counts, LOG10_BUCKET_EDGES) for counts in self.exp_counts])
+
+    def save(self, file_name):
+        # type: (str) -> None
+        # Saves the aggregates and the quantiles estimated from them as columns of a .npz file.
+        sampled_turns, coin_quantiles, exp_quantiles = self.get_trajectory_quantiles()
+        np.savez_compressed(file_name, n_games=self.n_games, total_turns=self.total_turns, wins=self.wins,
+                            win_rates=self.get_win_rates(), turn_edges=self.turn_edges,
+                            all_owned_turn_counts=self.all_owned_turn_counts,
+                            all_owned_turn_quantiles=self.get_all_owned_turn_quantiles(),
+                            place_purchases=self.place_purchases, place_upgrades=self.place_upgrades,
+                            place_acquisitions=self.place_acquisitions, upgrade_names=np.array(self.upgrade_names),
+                            upgrade_purchases=self.upgrade_purchases, upgrade_mix=self.get_upgrade_mix(),
+                            log10_bucket_edges=LOG10_BUCKET_EDGES, coin_counts=self.coin_counts,
+                            exp_counts=self.exp_counts, quantiles=np.array(QUANTILES), sampled_turns=sampled_turns,
+                            coin_quantiles=coin_quantiles, exp_quantiles=exp_quantiles)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) not in range(5, 9):
+        print("Usage: python streaming_analytics.py N_GAMES MAX_TURNS SEED OUTPUT_DIRECTORY [WORKERS] "
+              "[NUMERIC_BACKEND] [N_PARTICIPANTS]")
+        sys.exit(1)
+
+    print(str(run_pipeline(int(sys.argv[1]), int(sys.argv[2]), int(sys.argv[3]), sys.argv[4],
+                           int(sys.argv[5]) if len(sys.argv) >= 6 else None,
+                           numeric_backend_name=sys.argv[6] if len(sys.argv) >= 7 else "mpf",
+                           n_participants=int(sys.argv[7]) if len(sys.argv) == 8 else 2)))
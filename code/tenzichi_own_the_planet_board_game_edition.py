@@ -1,809 +1,3555 @@
-"""
-This file contains source code of the game "Tenzichi Own The Planet - Board Game Edition".
-Author: DtjiSoftwareDeveloper
-"""
-
-
-# Game version: 1
-
-
-# Importing necessary libraries
-
-import sys
-import uuid
-import pickle
-import copy
-import random
-from mpmath import *
-
-mp.pretty = True
-
-
-# Creating static functions to be used throughout the game.
-
-
-def is_number(string: str) -> bool:
-    try:
-        mpf(string)
-        return True
-    except ValueError:
-        return False
-
-
-def mpf_sum_of_list(a_list: list) -> mpf:
-    return mpf(str(sum(mpf(str(elem)) for elem in a_list if is_number(str(elem)))))
-
-
-def mpf_product_of_list(a_list: list) -> mpf:
-    product: mpf = mpf("1")  # initial value
-    for item in a_list:
-        if is_number(item):
-            product *= mpf(item)
-
-    return product
-
-
-def load_game_data(file_name):
-    # type: (str) -> Game
-    return pickle.load(open(file_name, "rb"))
-
-
-def save_game_data(game_data, file_name):
-    # type: (Game, str) -> None
-    pickle.dump(game_data, open(file_name, "wb"))
-
-
-# Creating necessary classes
-
-
-class Upgrade:
-    """
-    This class contains attributes of upgrades in this game.
-    """
-
-    def __init__(self, name, coin_cost, coin_gain_multiplier, exp_gain_multiplier):
-        # type: (str, mpf, int, int) -> None
-        self.name: str = name
-        self.coin_cost: mpf = coin_cost
-        self.coin_gain_multiplier: int = coin_gain_multiplier
-        self.exp_gain_multiplier: int = exp_gain_multiplier
-
-    def __str__(self):
-        # type: () -> str
-        res: str = ""  # initial value
-        res += "Name: " + str(self.name) + "\n"
-        res += "Coin cost: " + str(self.coin_cost) + "\n"
-        res += "Coin gain multiplier: " + str(self.coin_gain_multiplier) + "\n"
-        res += "EXP gain multiplier: " + str(self.exp_gain_multiplier) + "\n"
-        return res
-
-    def clone(self):
-        # type: () -> Upgrade
-        return copy.deepcopy(self)
-
-
-class Player:
-    """
-    This class contains attributes of the player in this game.
-    """
-
-    def __init__(self, name):
-        # type: (str) -> None
-        self.player_id: str = str(uuid.uuid1())  # randomly generate player ID
-        self.name: str = name
-        self.level: int = 1
-        self.exp: mpf = mpf("0")
-        self.required_exp: mpf = mpf("1e6")
-        self.coins: mpf = mpf("0")
-        self.position: int = 0
-        self.__owned_list: list = []  # initial value
-        self.__upgrade_list: list = []  # initial value
-
-    def __str__(self):
-        # type: () -> str
-        res: str = ""  # initial value
-        res += "Player ID: " + str(self.player_id) + "\n"
-        res += "Name: " + str(self.name) + "\n"
-        res += "Level: " + str(self.level) + "\n"
-        res += "EXP: " + str(self.exp) + "\n"
-        res += "Required EXP: " + str(self.required_exp) + "\n"
-        res += "Coins: " + str(self.coins) + "\n"
-        res += "Position: " + str(self.position) + "\n"
-        res += "Below is a list of places owned by this player:\n"
-        for place in self.__owned_list:
-            res += str(place) + "\n"
-
-        res += "Below is a list of upgrades owned by this player:\n"
-        for upgrade in self.__upgrade_list:
-            res += str(upgrade) + "\n"
-
-        return res
-
-    def get_coins_per_turn(self):
-        # type: () -> mpf
-        return mpf_sum_of_list([place.coins_per_turn for place in self.__owned_list]) * \
-               mpf_product_of_list([upgrade.coin_gain_multiplier for upgrade in self.__upgrade_list])
-
-    def get_exp_per_turn(self):
-        # type: () -> mpf
-        return mpf_sum_of_list([place.exp_per_turn for place in self.__owned_list]) * \
-               mpf_product_of_list([upgrade.exp_gain_multiplier for upgrade in self.__upgrade_list])
-
-    def level_up(self):
-        # type: () -> None
-        while self.exp >= self.required_exp:
-            self.level += 1
-            self.required_exp *= mpf("10") ** self.level
-
-    def roll_dice(self, dice, game):
-        # type: (Dice, Game) -> None
-        self.position += dice.value
-        if self.position >= len(game.board.get_tiles()):
-            self.position -= len(game.board.get_tiles())
-            self.coins += game.start_coin_bonus
-
-    def buy_upgrade(self, upgrade):
-        # type: (Upgrade) -> bool
-        if self.coins >= upgrade.coin_cost:
-            self.coins -= upgrade.coin_cost
-            self.__upgrade_list.append(upgrade)
-            return True
-        return False
-
-    def purchase_place(self, place):
-        # type: (Place) -> bool
-        if self.coins >= place.coin_cost and place not in self.__owned_list:
-            self.coins -= place.coin_cost
-            place.coin_cost *= mpf("10") ** self.level
-            self.__owned_list.append(place)
-            return True
-        return False
-
-    def upgrade_place(self, place):
-        # type: (Place) -> bool
-        if self.coins >= place.coin_cost and place in self.__owned_list:
-            self.coins -= place.coin_cost
-            self.level += 1
-            place.coin_cost *= mpf("10") ** self.level
-            place.coins_per_turn *= mpf("10") ** self.level
-            place.exp_per_turn *= mpf("10") ** self.level
-            return True
-        return False
-
-    def acquire_place(self, place, other):
-        # type: (Place, Player) -> bool
-        if self.coins >= place.coin_cost and place in other.get_owned_list() and place not in self.__owned_list:
-            self.coins -= place.coin_cost
-            self.level += 1
-            place.coin_cost *= mpf("10") ** self.level
-            place.coins_per_turn *= mpf("10") ** self.level
-            place.exp_per_turn *= mpf("10") ** self.level
-            self.__owned_list.append(place)
-            other.get_owned_list().remove(place)
-            return True
-        return False
-
-    def get_owned_list(self):
-        # type: () -> list
-        return self.__owned_list
-
-    def get_upgrade_list(self):
-        # type: () -> list
-        return self.__upgrade_list
-
-    def clone(self):
-        # type: () -> Player
-        return copy.deepcopy(self)
-
-
-class CPU(Player):
-    """
-    This class contains attributes of player's CPU controlled
-    """
-
-    def __init__(self):
-        # type: () -> None
-        Player.__init__(self, "CPU PLAYER")
-
-
-class Board:
-    """
-    This class contains attributes of the board.
-    """
-
-    def __init__(self, tiles):
-        # type: (list) -> None
-        self.__tiles: list = tiles
-
-    def __str__(self):
-        # type: () -> str
-        res: str = "Below is a list of tiles on the board:\n"
-        for tile in self.__tiles:
-            res += str(tile) + "\n"
-
-        return res
-
-    def get_tiles(self):
-        # type: () -> list
-        return self.__tiles
-
-    def clone(self):
-        # type: () -> Board
-        return copy.deepcopy(self)
-
-
-class Tile:
-    """
-    This class contains attributes of a tile on the board.
-    """
-
-    def __init__(self):
-        # type: () -> None
-        self.name: str = ""  # initial value
-        self.description: str = ""  # initial value
-
-    def __str__(self):
-        # type: () -> str
-        res: str = ""  # initial value
-        res += "Name: " + str(self.name) + "\n"
-        res += "Description: " + str(self.description) + "\n"
-        return res
-
-    def clone(self):
-        # type: () -> Tile
-        return copy.deepcopy(self)
-
-
-class Place(Tile):
-    """
-    This class contains attributes of a place which the player and CPU can purchase.
-    """
-
-    def __init__(self, name, description, coin_cost, coins_per_turn, exp_per_turn):
-        # type: (str, str, mpf, mpf, mpf) -> None
-        Tile.__init__(self)
-        self.name = name.upper()
-        self.level: int = 1  # initial value
-        self.description = description
-        self.coin_cost: mpf = coin_cost
-        self.coins_per_turn: mpf = coins_per_turn
-        self.exp_per_turn: mpf = exp_per_turn
-
-    def __str__(self):
-        # type: () -> str
-        res: str = Tile.__str__(self)
-        res += "Level: " + str(self.level) + "\n"
-        res += "Coin cost: " + str(self.coin_cost) + "\n"
-        res += "Coins per turn: " + str(self.coins_per_turn) + "\n"
-        res += "EXP per turn: " + str(self.exp_per_turn) + "\n"
-        return res
-
-
-class StartTile(Tile):
-    """
-    This class contains attributes of the start tile where the player and CPU gains bonus for landing at or passing it.
-    """
-
-    def __init__(self):
-        # type: () -> None
-        Tile.__init__(self)
-        self.name = "START"
-        self.description: str = "A tile where the player and CPU gains bonus for passing it."
-
-
-class EmptySpace(Tile):
-    """
-    This class contains attributes of empty spaces on the board.
-    """
-
-    def __init__(self):
-        # type: () -> None
-        Tile.__init__(self)
-        self.name = "EMPTY SPACE"
-        self.description = "An empty space."
-
-
-class ShinyZone(Tile):
-    """
-    This class contains attributes of shiny zones on the board where the player and CPU can gain random rewards.
-    """
-
-    def __init__(self):
-        # type: () -> None
-        Tile.__init__(self)
-        self.name = "SHINY ZONE"
-        self.description = "A tile where the player and CPU can gain random rewards."
-
-    def generate_shiny(self):
-        # type: () -> Shiny
-        return Shiny()
-
-
-class UpgradeShop(Tile):
-    """
-    This class contains attributes of an upgrade shop for the player and CPU to buy upgrades.
-    """
-
-    def __init__(self, upgrades_sold):
-        # type: (list) -> None
-        Tile.__init__(self)
-        self.name = "UPGRADE SHOP"
-        self.description = "A shop selling upgrades."
-        self.__upgrades_sold: list = upgrades_sold
-
-    def __str__(self):
-        # type: () -> str
-        res: str = Tile.__str__(self)
-        res += "Below is a list of upgrades sold on this tile:\n"
-        for upgrade_sold in self.__upgrades_sold:
-            res += str(upgrade_sold) + "\n"
-
-        return res
-
-    def get_upgrades_sold(self):
-        # type: () -> list
-        return self.__upgrades_sold
-
-
-class Shiny:
-    """
-    This class contains attributes of shinies which the player and CPU can gain when landing on shiny zones.
-    """
-
-    def __init__(self):
-        # type: () -> None
-        self.coin_reward: mpf = mpf("10") ** random.randint(10, 100000)
-        self.exp_reward: mpf = mpf("10") ** random.randint(10, 100000)
-
-    def __str__(self):
-        # type: () -> str
-        res: str = ""  # initial value
-        res += "Coin reward: " + str(self.coin_reward) + "\n"
-        res += "EXP reward: " + str(self.exp_reward) + "\n"
-        return res
-
-    def clone(self):
-        # type: () -> Shiny
-        return copy.deepcopy(self)
-
-
-class Dice:
-    """
-    This class contains attributes of the dice to be rolled.
-    """
-
-    def __init__(self):
-        # type: () -> None
-        self.value: int = random.randint(1, 20)
-
-    def __str__(self):
-        # type: () -> str
-        return str(self.value)
-
-    def clone(self):
-        # type: () -> Dice
-        return copy.deepcopy(self)
-
-
-class Game:
-    """
-    This class contains attributes of saved game data in this game.
-    """
-
-    def __init__(self, player, cpu, board):
-        # type: (Player, CPU, Board) -> None
-        self.game_level: int = 1
-        self.turn: int = 0  # initial value
-        self.player: Player = player
-        self.cpu: CPU = cpu
-        self.board: Board = board
-        self.start_coin_bonus: mpf = mpf("1e4")
-
-    def __str__(self):
-        # type: () -> str
-        res: str = ""  # initial value
-        res += "Game level: " + str(self.game_level) + "\n"
-        res += "Turn: " + str(self.turn) + "\n"
-        res += "Player in this game:\n" + str(self.player) + "\n"
-        res += "CPU controlled opponent in this game:\n" + str(self.cpu) + "\n"
-        res += "Board representation:\n" + str(self.board) + "\n"
-        res += "Start coin bonus: " + str(self.start_coin_bonus) + "\n"
-        return res
-
-    def update_game_level(self):
-        # type: () -> None
-        self.game_level = min(1 + self.player.level // 10, 1 + self.cpu.level // 10)
-        self.start_coin_bonus = mpf("1e4") ** self.game_level
-
-    def clone(self):
-        # type: () -> Game
-        return copy.deepcopy(self)
-
-
-# Creating main method of the game.
-
-
-def main():
-    # type: () -> None
-    """
-    This main method is used to run the game.
-    :return: None
-    """
-
-    print("Welcome to 'Tenzichi Own The Planet - Board Game Edition' by 'DtjiSoftwareDeveloper'.")
-    print("This game is a board game where the player needs to own the planet by purchasing and upgrading places.")
-
-    upgrades_sold: list = [
-        Upgrade("COIN UPGRADE #1", mpf("1e10"), 10, 1),
-        Upgrade("COIN UPGRADE #2", mpf("1e40"), 20, 1),
-        Upgrade("COIN UPGRADE #3", mpf("1e160"), 30, 1),
-        Upgrade("COIN UPGRADE #4", mpf("1e640"), 40, 1),
-        Upgrade("COIN UPGRADE #5", mpf("1e2560"), 50, 1),
-        Upgrade("COIN UPGRADE #6", mpf("1e10240"), 60, 1),
-        Upgrade("COIN UPGRADE #7", mpf("1e40960"), 70, 1),
-        Upgrade("COIN UPGRADE #8", mpf("1e163840"), 80, 1),
-        Upgrade("EXP UPGRADE #1", mpf("1e10"), 1, 10),
-        Upgrade("EXP UPGRADE #2", mpf("1e40"), 1, 20),
-        Upgrade("EXP UPGRADE #3", mpf("1e160"), 1, 30),
-        Upgrade("EXP UPGRADE #4", mpf("1e640"), 1, 40),
-        Upgrade("EXP UPGRADE #5", mpf("1e2560"), 1, 50),
-        Upgrade("EXP UPGRADE #6", mpf("1e10240"), 1, 60),
-        Upgrade("EXP UPGRADE #7", mpf("1e40960"), 1, 70),
-        Upgrade("EXP UPGRADE #8", mpf("1e163840"), 1, 80)
-    ]
-
-    board: Board = Board([
-        StartTile(),
-        Place("Naivagadi Wild", "A jungle.", mpf("1e5"), mpf("1e4"), mpf("1e3")),
-        EmptySpace(),
-        EmptySpace(),
-        EmptySpace(),
-        UpgradeShop(upgrades_sold),
-        EmptySpace(),
-        EmptySpace(),
-        ShinyZone(),
-        EmptySpace(),
-        EmptySpace(),
-        ShinyZone(),
-        EmptySpace(),
-        EmptySpace(),
-        Place("Cardley Strand", "A beach.", mpf("1e10"), mpf("1e8"), mpf("1e6")),
-        Place("Sanctuary Of Serenity", "A temple.", mpf("1e16"), mpf("1e13"), mpf("1e10")),
-        EmptySpace(),
-        Place("Berthierpon Park", "A park.", mpf("1e23"), mpf("1e19"), mpf("1e15")),
-        EmptySpace(),
-        EmptySpace(),
-        ShinyZone(),
-        EmptySpace(),
-        EmptySpace(),
-        ShinyZone(),
-        EmptySpace(),
-        UpgradeShop(upgrades_sold),
-        EmptySpace(),
-        Place("Danpawa Shallows", "A lake.", mpf("1e31"), mpf("1e26"), mpf("1e21")),
-        Place("Venroy Tops", "A mountain.", mpf("1e40"), mpf("1e34"), mpf("1e28")),
-        EmptySpace(),
-        EmptySpace(),
-        EmptySpace(),
-        Place("The Sunken Tunnels", "A dungeon.", mpf("1e50"), mpf("1e43"), mpf("1e36")),
-        EmptySpace(),
-        ShinyZone(),
-        EmptySpace(),
-        EmptySpace(),
-        Place("The Dragon Shore", "A beach.", mpf("1e61"), mpf("1e53"), mpf("1e45")),
-        EmptySpace(),
-        EmptySpace(),
-        ShinyZone(),
-        UpgradeShop(upgrades_sold),
-        EmptySpace(),
-        EmptySpace(),
-        Place("Monastery Of Muvdall", "A temple.", mpf("1e73"), mpf("1e64"), mpf("1e55")),
-        EmptySpace(),
-        EmptySpace(),
-        Place("Venneau Hideout", "A cave.", mpf("1e86"), mpf("1e76"), mpf("1e66")),
-        Place("Salbridge River", "A river.", mpf("1e100"), mpf("1e89"), mpf("1e78")),
-        EmptySpace(),
-        Place("Stancier Meadows", "A park.", mpf("1e115"), mpf("1e103"), mpf("1e91")),
-        EmptySpace(),
-        EmptySpace(),
-        ShinyZone(),
-        EmptySpace(),
-        Place("The Ellisgonie Tundra", "A snowland.", mpf("1e131"), mpf("1e118"), mpf("1e105")),
-        ShinyZone(),
-        EmptySpace(),
-        EmptySpace(),
-        EmptySpace(),
-        UpgradeShop(upgrades_sold),
-        EmptySpace(),
-        ShinyZone(),
-        Place("The Grounds Of Hermibriand", "A park.", mpf("1e148"), mpf("1e134"), mpf("1e120")),
-        EmptySpace(),
-        EmptySpace(),
-        Place("Riverfront Plaza", "A park.", mpf("1e166"), mpf("1e151"), mpf("1e136")),
-        EmptySpace(),
-        ShinyZone(),
-        EmptySpace(),
-        Place("The Tranquil Tombs", "A dungeon.", mpf("1e185"), mpf("1e169"), mpf("1e153")),
-        EmptySpace(),
-        UpgradeShop(upgrades_sold),
-        EmptySpace(),
-        Place("The Grave Deep", "A sea.", mpf("1e205"), mpf("1e188"), mpf("1e171")),
-        EmptySpace(),
-        EmptySpace(),
-        ShinyZone(),
-        EmptySpace(),
-        EmptySpace(),
-        Place("Yorkdiac Point", "A beach.", mpf("1e226"), mpf("1e208"), mpf("1e190")),
-        EmptySpace(),
-        EmptySpace(),
-        Place("The Dark Desert", "A desert.", mpf("1e248"), mpf("1e229"), mpf("1e210")),
-        EmptySpace(),
-        EmptySpace(),
-        ShinyZone(),
-        EmptySpace(),
-        EmptySpace(),
-        Place("Celestial Library", "A library.", mpf("1e271"), mpf("1e251"), mpf("1e231")),
-        UpgradeShop(upgrades_sold),
-        EmptySpace(),
-        EmptySpace(),
-        EmptySpace(),
-        Place("Aptitude Bibliotheca", "A library.", mpf("1e295"), mpf("1e274"), mpf("1e253")),
-        EmptySpace(),
-        ShinyZone(),
-        EmptySpace(),
-        Place("The Windless Wilderness", "A jungle.", mpf("1e320"), mpf("1e298"), mpf("1e276")),
-        EmptySpace(),
-        EmptySpace(),
-        EmptySpace(),
-        EmptySpace(),
-        EmptySpace(),
-        Place("The Wild of Megeisa", "A jungle.", mpf("1e346"), mpf("1e323"), mpf("1e300")),
-        ShinyZone(),
-        EmptySpace(),
-        EmptySpace(),
-        UpgradeShop(upgrades_sold),
-        Place("The Windy Burrows", "A dungeon.", mpf("1e373"), mpf("1e349"), mpf("1e325")),
-        EmptySpace(),
-        UpgradeShop(upgrades_sold),
-        EmptySpace(),
-        Place("Royal Isle Plaza", "A park.", mpf("1e401"), mpf("1e376"), mpf("1e351")),
-        EmptySpace(),
-        EmptySpace(),
-        ShinyZone(),
-        EmptySpace(),
-        EmptySpace(),
-        Place("Pleasant View Grounds", "A park.", mpf("1e430"), mpf("1e404"), mpf("1e378")),
-        Place("The Shimmering Coast", "A beach.", mpf("1e460"), mpf("1e433"), mpf("1e406")),
-        EmptySpace(),
-        EmptySpace(),
-        UpgradeShop(upgrades_sold),
-        EmptySpace(),
-        Place("Durnola Shore", "A beach.", mpf("1e491"), mpf("1e463"), mpf("1e435")),
-        EmptySpace(),
-        ShinyZone(),
-        EmptySpace(),
-        Place("Merimer Strand", "A beach.", mpf("1e523"), mpf("1e494"), mpf("1e465")),
-        EmptySpace(),
-        EmptySpace(),
-        EmptySpace(),
-        ShinyZone(),
-        Place("Richronto Key", "An island.", mpf("1e556"), mpf("1e526"), mpf("1e496")),
-        EmptySpace(),
-        EmptySpace(),
-        EmptySpace(),
-        EmptySpace(),
-        EmptySpace(),
-        Place("Meribrook Ait", "An island.", mpf("1e590"), mpf("1e559"), mpf("1e528")),
-        Place("Grettrie Rise", "A mountain.", mpf("1e625"), mpf("1e593"), mpf("1e561")),
-        ShinyZone(),
-        Place("Scarscour Volcano", "A volcano.", mpf("1e661"), mpf("1e628"), mpf("1e595")),
-        EmptySpace(),
-        EmptySpace(),
-        Place("Plasack Hill", "A hill.", mpf("1e698"), mpf("1e664"), mpf("1e630")),
-        UpgradeShop(upgrades_sold),
-        Place("Kerrokasing Deep", "A sea.", mpf("1e736"), mpf("1e701"), mpf("1e666")),
-        EmptySpace(),
-        EmptySpace(),
-        EmptySpace(),
-        Place("Troutriver Mansion", "A mansion.", mpf("1e775"), mpf("1e739"), mpf("1e703")),
-        Place("Fullernelly Residence", "A mansion.", mpf("1e815"), mpf("1e778"), mpf("1e741"))
-    ])
-
-    # Automatically load saved game data
-    file_name: str = "SAVED TENZICHI OWN THE PLANET - BOARD GAME EDITION GAME PROGRESS"
-    new_game: Game
-    try:
-        new_game = load_game_data(file_name)
-        print("Current game progress:\n", str(new_game))
-    except FileNotFoundError:
-        name: str = input("Please enter your name: ")
-        player: Player = Player(name)
-        new_game = Game(player, CPU(), board)
-
-    print("Enter 'Y' for yes.")
-    print("Enter anything else for no.")
-    continue_playing: str = input("Do you want to continue playing 'Tenzichi Own The Planet - Board Game Edition'? ")
-    while continue_playing == "Y":
-        # Printing your stats and your opponent's stats
-        print("Your current stats:\n" + str(new_game.player))
-        print("\n")
-        print("Your opponent's stats:\n" + str(new_game.cpu))
-        new_game.turn += 1
-        # Checking whether it is player's turn or CPU's turn
-        if new_game.turn % 2 == 1:
-            # It is player's turn
-            print("It is your turn.")
-            print("Enter 'Y' for yes.")
-            print("Enter anything else for no.")
-            roll_dice: str = input("Do you want to roll the dice? ")
-            if roll_dice == "Y":
-                new_game.player.roll_dice(Dice(), new_game)
-                print("You are now at:\n" + str(new_game.board.get_tiles()[new_game.player.position]))
-
-                # Checking what type of tile the player lands on
-                if isinstance(new_game.board.get_tiles()[new_game.player.position], EmptySpace):
-                    pass  # do nothing
-                elif isinstance(new_game.board.get_tiles()[new_game.player.position], StartTile):
-                    pass  # do nothing
-                elif isinstance(new_game.board.get_tiles()[new_game.player.position], ShinyZone):
-                    # Randomly generate a shiny
-                    shiny_zone: ShinyZone = new_game.board.get_tiles()[new_game.player.position]
-                    shiny: Shiny = shiny_zone.generate_shiny()
-                    print("You earn " + str(shiny.coin_reward) + " coins and " + str(shiny.exp_reward) + " EXP.")
-                    new_game.player.coins += shiny.coin_reward
-                    new_game.player.exp += shiny.exp_reward
-                    new_game.player.level_up()
-                elif isinstance(new_game.board.get_tiles()[new_game.player.position], UpgradeShop):
-                    # Ask the player whether he/she wants to buy an upgrade or not
-                    print("Enter 'Y' for yes.")
-                    print("Enter anything else for no.")
-                    buy_upgrade: str = input("Do you want to buy an upgrade? ")
-                    if buy_upgrade == "Y":
-                        upgrade_shop: UpgradeShop = new_game.board.get_tiles()[new_game.player.position]
-                        print("Below is a list of upgrades sold:\n")
-                        for upgrade in upgrade_shop.get_upgrades_sold():
-                            print(str(upgrade) + "\n")
-
-                        upgrade_index: int = int(input("Please enter index of upgrade you want to buy: "))
-                        while upgrade_index < 0 or upgrade_index >= len(upgrade_shop.get_upgrades_sold()):
-                            upgrade_index = int(input("Sorry, invalid input! "
-                                                      "Please enter index of upgrade you want to buy: "))
-
-                        to_buy: Upgrade = upgrade_shop.get_upgrades_sold()[upgrade_index]
-                        if new_game.player.buy_upgrade(to_buy):
-                            print("Congratulations! You have successfully bought " + str(to_buy.name))
-                        else:
-                            print("Sorry, insufficient coins!")
-                    else:
-                        pass  # Do nothing
-                elif isinstance(new_game.board.get_tiles()[new_game.player.position], Place):
-                    place: Place = new_game.board.get_tiles()[new_game.player.position]
-
-                    # Checking whether the place has an owner or not
-                    # 1. If the place does not have an owner
-                    if place not in new_game.player.get_owned_list() and place not in new_game.cpu.get_owned_list():
-                        # Ask whether the player wants to buy the place or not
-                        print("Enter 'Y' for yes.")
-                        print("Enter anything else for no.")
-                        buy_place: str = input("Do you want to buy this place? ")
-                        if buy_place == "Y":
-                            if new_game.player.purchase_place(place):
-                                print("Congratulations! You have successfully bought " + str(place.name))
-                            else:
-                                print("Sorry, insufficient coins!")
-                        else:
-                            pass  # do nothing
-                    # 2. If the place is owned by the player
-                    elif place in new_game.player.get_owned_list():
-                        # Ask whether the player wants to upgrade the place or not
-                        print("Enter 'Y' for yes.")
-                        print("Enter anything else for no.")
-                        upgrade_place: str = input("Do you want to upgrade this place? ")
-                        if upgrade_place == "Y":
-                            if new_game.player.upgrade_place(place):
-                                print("Congratulations! You have successfully upgraded " + str(place.name))
-                            else:
-                                print("Sorry, insufficient coins!")
-                        else:
-                            pass  # do nothing
-                    # 3. If the place is owned by the CPU
-                    elif place in new_game.cpu.get_owned_list():
-                        # Ask whether the player wants to acquire the place or not
-                        print("Enter 'Y' for yes.")
-                        print("Enter anything else for no.")
-                        acquire_place: str = input("Do you want to acquire this place? ")
-                        if acquire_place == "Y":
-                            if new_game.player.acquire_place(place, new_game.cpu):
-                                print("Congratulations! You have successfully acquired " + str(place.name))
-                            else:
-                                print("Sorry, insufficient coins!")
-                        else:
-                            pass  # Do nothing
-
-                new_game.player.coins += new_game.player.get_coins_per_turn()
-                new_game.player.exp += new_game.player.get_exp_per_turn()
-            else:
-                # Save game data and quit the game
-                save_game_data(new_game, file_name)
-                sys.exit()
-        else:
-            # It is CPU's turn
-            print("It is CPU's turn.")
-
-            new_game.cpu.roll_dice(Dice(), new_game)
-            print("Your opponent is now at:\n" + str(new_game.board.get_tiles()[new_game.cpu.position]))
-
-            # Checking what type of tile the CPU lands on
-            if isinstance(new_game.board.get_tiles()[new_game.cpu.position], EmptySpace):
-                pass  # do nothing
-            elif isinstance(new_game.board.get_tiles()[new_game.cpu.position], StartTile):
-                pass  # do nothing
-            elif isinstance(new_game.board.get_tiles()[new_game.cpu.position], ShinyZone):
-                # Randomly generate a shiny
-                shiny_zone: ShinyZone = new_game.board.get_tiles()[new_game.cpu.position]
-                shiny: Shiny = shiny_zone.generate_shiny()
-                print("Your opponent earns " + str(shiny.coin_reward) + " coins and " + str(shiny.exp_reward) + " EXP.")
-                new_game.cpu.coins += shiny.coin_reward
-                new_game.cpu.exp += shiny.exp_reward
-                new_game.cpu.level_up()
-            elif isinstance(new_game.board.get_tiles()[new_game.cpu.position], UpgradeShop):
-                cpu_buy_upgrade: bool = random.random() <= 0.75
-                if cpu_buy_upgrade:
-                    upgrade_shop: UpgradeShop = new_game.board.get_tiles()[new_game.cpu.position]
-                    upgrade_index: int = random.randint(0, len(upgrade_shop.get_upgrades_sold()) - 1)
-                    to_buy: Upgrade = upgrade_shop.get_upgrades_sold()[upgrade_index]
-                    if new_game.cpu.buy_upgrade(to_buy):
-                        print("Your opponent has successfully bought " + str(to_buy.name))
-                    else:
-                        print("Your opponent has insufficient coins!")
-                else:
-                    pass  # Do nothing
-            elif isinstance(new_game.board.get_tiles()[new_game.cpu.position], Place):
-                place: Place = new_game.board.get_tiles()[new_game.cpu.position]
-
-                # Checking whether the place has an owner or not
-                # 1. If the place does not have an owner
-                if place not in new_game.player.get_owned_list() and place not in new_game.cpu.get_owned_list():
-                    cpu_buy_place: bool = random.random() <= 0.75
-                    if cpu_buy_place:
-                        if new_game.cpu.purchase_place(place):
-                            print("Your opponent has successfully bought " + str(place.name))
-                        else:
-                            print("Your opponent has insufficient coins!")
-                    else:
-                        pass  # do nothing
-                # 2. If the place is owned by the CPU
-                elif place in new_game.cpu.get_owned_list():
-                    cpu_upgrade_place: bool = random.random() <= 0.75
-                    if cpu_upgrade_place:
-                        if new_game.cpu.upgrade_place(place):
-                            print("Your opponent has successfully upgraded " + str(place.name))
-                        else:
-                            print("Your opponent has insufficient coins!")
-                    else:
-                        pass  # do nothing
-                # 3. If the place is owned by the player
-                elif place in new_game.player.get_owned_list():
-                    cpu_acquire_place: bool = random.random() <= 0.75
-                    if cpu_acquire_place:
-                        if new_game.cpu.acquire_place(place, new_game.player):
-                            print("Your opponent has successfully acquired " + str(place.name))
-                        else:
-                            print("Your opponent has insufficient coins!")
-                    else:
-                        pass  # do nothing
-
-            new_game.cpu.coins += new_game.cpu.get_coins_per_turn()
-            new_game.cpu.exp += new_game.cpu.get_exp_per_turn()
-        print("Enter 'Y' for yes.")
-        print("Enter anything else for no.")
-        continue_playing = input(
-            "Do you want to continue playing 'Tenzichi Own The Planet - Board Game Edition'? ")
-
-    # Save game data and quit the game
-    save_game_data(new_game, file_name)
-    sys.exit()
-
-
-if __name__ == '__main__':
-    main()
+"""
+This file contains source code of the game "Tenzichi Own The Planet - Board Game Edition".
+Author: DtjiSoftwareDeveloper
+"""
+
+
+# Game version: 1
+
+
+# Importing necessary libraries
+
+import os
+import sys
+import array
+import math
+import copy
+import random
+import time
+import mmap
+import bisect
+import heapq
+import struct
+
+
+# Importing this module has no side effects. The libraries which are slow to import are only imported by the
+# functions below once a game needs them, since many short-lived processes import this module.
+MPMATH: object = None  # mpmath module once get_mpmath() has imported it
+
+
+# Creating static functions to be used throughout the game.
+
+
+def get_mpmath():
+    # type: () -> object
+    global MPMATH
+    if MPMATH is None:
+        import mpmath
+        MPMATH = mpmath
+    return MPMATH
+
+
+def generate_player_id():
+    # type: () -> str
+    import uuid
+    return str(uuid.uuid1())
+
+
+def is_number(string: str) -> bool:
+    try:
+        get_mpmath().mpf(string)
+        return True
+    except ValueError:
+        return False
+
+
+def mpf_sum_of_list(a_list: list) -> "mpf":
+    mpf = get_mpmath().mpf
+    return mpf(str(sum(mpf(str(elem)) for elem in a_list if is_number(str(elem)))))
+
+
+def mpf_product_of_list(a_list: list) -> "mpf":
+    mpf = get_mpmath().mpf
+    product: mpf = mpf("1")  # initial value
+    for item in a_list:
+        if is_number(item):
+            product *= mpf(item)
+
+    return product
+
+
+def load_game_data(file_name):
+    # type: (str) -> Game
+    # Loads the game saved into the file called 'file_name', applying the delta autosaved against it if there is one.
+    with open(file_name, "rb") as file:
+        if file.read(len(SAVE_FORMAT_MAGIC)) != SAVE_FORMAT_MAGIC:
+            # Saved by a version of the game which pickled the whole game
+            import pickle
+            file.seek(0)
+            return pickle.load(file)
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            game: Game = decode_game(buffer)
+            delta: bytes or None = read_delta_file(file_name, buffer)
+
+    return game if delta is None else decode_game(delta, game.board)
+
+
+def write_file_atomically(file_name, data):
+    # type: (str, bytes) -> None
+    """
+    This function replaces the file called 'file_name' with 'data' in one step. The data is written into a
+    temporary file and flushed to the disk before the temporary file is renamed, so that a crash leaves either the
+    old file or the new one behind, never half of one.
+    :return: None
+    """
+
+    temporary_file_name: str = file_name + ".tmp"
+    with open(temporary_file_name, "wb") as file:
+        file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary_file_name, file_name)
+    if os.name == "posix":
+        # Flushing the directory as well, so that the rename itself survives a crash
+        directory: int = os.open(os.path.dirname(os.path.abspath(file_name)), os.O_RDONLY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+
+
+def save_game_data(game_data, file_name):
+    # type: (Game, str) -> None
+    metrics: TurnMetrics or None = game_data.metrics
+    start_time: float = time.perf_counter() if metrics is not None else 0.0
+    write_file_atomically(file_name, encode_game(game_data))
+    remove_delta_file(file_name)  # autosaved against the game saved before
+
+    if metrics is not None:
+        metrics.record(SAVE_IO_PHASE, start_time)
+        metrics.increment("saves")
+
+
+# Creating numeric backends of the game.
+
+
+def normalize_scientific(mantissa, exponent):
+    # type: (float, int) -> tuple
+    """
+    This function scales 'mantissa' into the range [1, 10) in absolute value and adjusts 'exponent' so that
+    mantissa * 10 ** exponent does not change.
+    :return: the normalized (mantissa, exponent) pair
+    """
+
+    if mantissa == 0.0:
+        return 0.0, 0
+
+    magnitude: float = abs(mantissa)
+    if 1.0 <= magnitude < 10.0:
+        return mantissa, exponent
+    if 10.0 <= magnitude < 100.0:
+        return mantissa / 10.0, exponent + 1
+
+    shift: int = math.floor(math.log10(magnitude))
+    mantissa /= 10.0 ** shift
+    # Correcting rounding errors of math.log10()
+    if abs(mantissa) >= 10.0:
+        mantissa /= 10.0
+        shift += 1
+    elif abs(mantissa) < 1.0:
+        mantissa *= 10.0
+        shift -= 1
+
+    return mantissa, exponent + shift
+
+
+class ScientificNumber:
+    """
+    This class contains attributes of a number stored as a float mantissa times an unbounded integer power of ten.
+    It has the same precision as an mpf number at the default precision of mpmath but is much cheaper to compute with.
+    """
+
+    __slots__ = ("mantissa", "exponent")
+
+    def __init__(self, mantissa=0.0, exponent=0):
+        # type: (float, int) -> None
+        self.mantissa: float
+        self.exponent: int
+        self.mantissa, self.exponent = normalize_scientific(float(mantissa), exponent)
+
+    @staticmethod
+    def from_value(value):
+        # type: (ScientificNumber or int or float or str) -> ScientificNumber
+        if isinstance(value, ScientificNumber):
+            return value
+        if isinstance(value, str):
+            string: str = value.strip().lower()
+            if "e" in string:
+                mantissa_string, exponent_string = string.split("e")
+                return ScientificNumber(float(mantissa_string), int(exponent_string))
+            return ScientificNumber(float(string))
+        if isinstance(value, int) and abs(value) >= 2 ** 53:
+            digits: str = str(abs(value))
+            mantissa: float = float(digits[:17])
+            return ScientificNumber(mantissa if value > 0 else -mantissa, len(digits) - 17)
+        return ScientificNumber(float(value))
+
+    def __str__(self):
+        # type: () -> str
+        if self.mantissa == 0.0:
+            return "0.0"
+        if -5 <= self.exponent < 15:
+            string: str = "%.15g" % float(self)
+            return string if "." in string or "e" in string else string + ".0"
+
+        mantissa_string: str = "%.15g" % self.mantissa
+        if "." not in mantissa_string:
+            mantissa_string += ".0"
+        return mantissa_string + "e" + ("+" if self.exponent >= 0 else "") + str(self.exponent)
+
+    def __repr__(self):
+        # type: () -> str
+        return "ScientificNumber('" + str(self) + "')"
+
+    def __float__(self):
+        # type: () -> float
+        if self.exponent > 308:
+            return math.copysign(float("inf"), self.mantissa)
+        if self.exponent < -330:
+            return 0.0
+        return self.mantissa * 10.0 ** self.exponent
+
+    def __bool__(self):
+        # type: () -> bool
+        return self.mantissa != 0.0
+
+    # __eq__() compares with ints and floats after rounding them to scientific numbers, so different ints and floats
+    # with different hashes can equal the same scientific number. No hash can agree with that, so scientific numbers
+    # are not hashable.
+    __hash__ = None
+
+    def __neg__(self):
+        # type: () -> ScientificNumber
+        return ScientificNumber(-self.mantissa, self.exponent)
+
+    def __abs__(self):
+        # type: () -> ScientificNumber
+        return ScientificNumber(abs(self.mantissa), self.exponent)
+
+    def __add__(self, other):
+        # type: (ScientificNumber or int or float) -> ScientificNumber
+        if not isinstance(other, ScientificNumber):
+            if not isinstance(other, (int, float)):
+                return NotImplemented
+            other = ScientificNumber.from_value(other)
+        if other.mantissa == 0.0:
+            return self
+        if self.mantissa == 0.0:
+            return other
+
+        difference: int = self.exponent - other.exponent
+        # Terms more than 17 orders of magnitude apart are lost in the precision of the mantissa.
+        if difference > 17:
+            return self
+        if difference < -17:
+            return other
+        if difference >= 0:
+            return ScientificNumber(self.mantissa + other.mantissa / 10.0 ** difference, self.exponent)
+        return ScientificNumber(self.mantissa / 10.0 ** -difference + other.mantissa, other.exponent)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        # type: (ScientificNumber or int or float) -> ScientificNumber
+        if not isinstance(other, ScientificNumber):
+            if not isinstance(other, (int, float)):
+                return NotImplemented
+            other = ScientificNumber.from_value(other)
+        return self + (-other)
+
+    def __rsub__(self, other):
+        # type: (int or float) -> ScientificNumber
+        return ScientificNumber.from_value(other) - self
+
+    def __mul__(self, other):
+        # type: (ScientificNumber or int or float) -> ScientificNumber
+        if not isinstance(other, ScientificNumber):
+            if type(other) is int and -2 ** 53 < other < 2 ** 53:
+                return ScientificNumber(self.mantissa * other, self.exponent)  # e.g. income times a number of turns
+            if not isinstance(other, (int, float)):
+                return NotImplemented
+            other = ScientificNumber.from_value(other)
+        return ScientificNumber(self.mantissa * other.mantissa, self.exponent + other.exponent)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        # type: (ScientificNumber or int or float) -> ScientificNumber
+        if not isinstance(other, ScientificNumber):
+            if not isinstance(other, (int, float)):
+                return NotImplemented
+            other = ScientificNumber.from_value(other)
+        return ScientificNumber(self.mantissa / other.mantissa, self.exponent - other.exponent)
+
+    def __rtruediv__(self, other):
+        # type: (int or float) -> ScientificNumber
+        return ScientificNumber.from_value(other) / self
+
+    def __pow__(self, power):
+        # type: (int) -> ScientificNumber
+        if not isinstance(power, int):
+            return NotImplemented
+        if power == 0:
+            return ScientificNumber(1.0)
+        if self.mantissa == 0.0:
+            return self
+
+        log_mantissa: float = power * math.log10(abs(self.mantissa))
+        shift: int = math.floor(log_mantissa)
+        sign: float = -1.0 if self.mantissa < 0 and power % 2 == 1 else 1.0
+        return ScientificNumber(sign * 10.0 ** (log_mantissa - shift), self.exponent * power + shift)
+
+    def compare(self, other):
+        # type: (ScientificNumber or int or float) -> int
+        """
+        This method compares this number with 'other'.
+        :return: -1 if this number is smaller, 0 if both are equal and 1 if this number is larger
+        """
+
+        if not isinstance(other, ScientificNumber):
+            other = ScientificNumber.from_value(other)
+        self_sign: int = (self.mantissa > 0.0) - (self.mantissa < 0.0)
+        other_sign: int = (other.mantissa > 0.0) - (other.mantissa < 0.0)
+        if self_sign != other_sign:
+            return 1 if self_sign > other_sign else -1
+        if self_sign == 0:
+            return 0
+        if self.exponent != other.exponent:
+            return self_sign if self.exponent > other.exponent else -self_sign
+        return (self.mantissa > other.mantissa) - (self.mantissa < other.mantissa)
+
+    def __eq__(self, other):
+        # type: (object) -> bool
+        if not isinstance(other, (ScientificNumber, int, float)):
+            return NotImplemented
+        return self.compare(other) == 0
+
+    def __lt__(self, other):
+        # type: (ScientificNumber or int or float) -> bool
+        return self.compare(other) < 0
+
+    def __le__(self, other):
+        # type: (ScientificNumber or int or float) -> bool
+        return self.compare(other) <= 0
+
+    def __gt__(self, other):
+        # type: (ScientificNumber or int or float) -> bool
+        return self.compare(other) > 0
+
+    def __ge__(self, other):
+        # type: (ScientificNumber or int or float) -> bool
+        return self.compare(other) >= 0
+
+    def log10(self):
+        # type: () -> float
+        return math.log10(abs(self.mantissa)) + self.exponent if self.mantissa != 0.0 else float("-inf")
+
+
+class NumericBackend:
+    """
+    This class contains the operations of the type of number used for coins, EXP and costs in a game.
+    """
+
+    name: str = ""
+
+    def number(self, string):
+        # type: (str) -> object
+        raise NotImplementedError
+
+    def power_of_ten(self, exponent):
+        # type: (int) -> object
+        raise NotImplementedError
+
+    def log10(self, number):
+        # type: (object) -> float
+        # Returns the base 10 logarithm of a positive number as a float, e.g. to estimate how many levels it is worth.
+        raise NotImplementedError
+
+    def sum_of_list(self, a_list):
+        # type: (list) -> object
+        raise NotImplementedError
+
+    def product_of_list(self, a_list):
+        # type: (list) -> object
+        raise NotImplementedError
+
+    def encode_number(self, number):
+        # type: (object) -> bytes
+        # Numbers are encoded into NUMBER_STRUCT.size bytes in saved games.
+        raise NotImplementedError
+
+    def decode_number(self, buffer, offset):
+        # type: (bytes, int) -> object
+        raise NotImplementedError
+
+
+class MpfBackend(NumericBackend):
+    """
+    This class contains the operations of mpf numbers, which are the default numbers of the game.
+    """
+
+    name: str = "mpf"
+
+    def number(self, string):
+        # type: (str) -> mpf
+        return get_mpmath().mpf(string)
+
+    def power_of_ten(self, exponent):
+        # type: (int) -> mpf
+        return get_mpmath().mpf("10") ** exponent
+
+    def log10(self, number):
+        # type: (mpf) -> float
+        return float(get_mpmath().log10(number))
+
+    def sum_of_list(self, a_list):
+        # type: (list) -> mpf
+        return mpf_sum_of_list(a_list)
+
+    def product_of_list(self, a_list):
+        # type: (list) -> mpf
+        return mpf_product_of_list(a_list)
+
+    def encode_number(self, number):
+        # type: (mpf) -> bytes
+        # An mpf number is exactly (-1) ** sign * mantissa * 2 ** exponent.
+        sign, mantissa, exponent, bit_count = number._mpf_
+        return NUMBER_STRUCT.pack(-mantissa if sign else mantissa, exponent)
+
+    def decode_number(self, buffer, offset):
+        # type: (bytes, int) -> mpf
+        return get_mpmath().mpf(NUMBER_STRUCT.unpack_from(buffer, offset))
+
+
+class ScientificBackend(NumericBackend):
+    """
+    This class contains the operations of scientific numbers.
+    """
+
+    name: str = "scientific"
+
+    def number(self, string):
+        # type: (str) -> ScientificNumber
+        return ScientificNumber.from_value(string)
+
+    def power_of_ten(self, exponent):
+        # type: (int) -> ScientificNumber
+        return ScientificNumber(1.0, exponent)
+
+    def log10(self, number):
+        # type: (ScientificNumber) -> float
+        return number.log10()
+
+    def sum_of_list(self, a_list):
+        # type: (list) -> ScientificNumber
+        total: ScientificNumber = ScientificNumber()  # initial value
+        for elem in a_list:
+            total += elem
+
+        return total
+
+    def product_of_list(self, a_list):
+        # type: (list) -> ScientificNumber
+        product: ScientificNumber = ScientificNumber(1.0)  # initial value
+        for item in a_list:
+            product *= item
+
+        return product
+
+    def encode_number(self, number):
+        # type: (ScientificNumber) -> bytes
+        return SCIENTIFIC_NUMBER_STRUCT.pack(number.mantissa, number.exponent)
+
+    def decode_number(self, buffer, offset):
+        # type: (bytes, int) -> ScientificNumber
+        return ScientificNumber(*SCIENTIFIC_NUMBER_STRUCT.unpack_from(buffer, offset))
+
+
+NUMBER_STRUCT: struct.Struct = struct.Struct("<qq")
+SCIENTIFIC_NUMBER_STRUCT: struct.Struct = struct.Struct("<dq")
+MPF_BACKEND: MpfBackend = MpfBackend()
+SCIENTIFIC_BACKEND: ScientificBackend = ScientificBackend()
+NUMERIC_BACKENDS: dict = {
+    MPF_BACKEND.name: MPF_BACKEND,
+    SCIENTIFIC_BACKEND.name: SCIENTIFIC_BACKEND
+}
+
+
+def get_numeric_backend(name):
+    # type: (str) -> NumericBackend
+    if name not in NUMERIC_BACKENDS:
+        raise ValueError("Unknown numeric backend: " + str(name))
+    return NUMERIC_BACKENDS[name]
+
+
+# Setting this to True makes every turn check the incomes kept up to date by the participant against
+# recomputing them from scratch, which is slow and only meant for debugging.
+VERIFY_INCOME_AGGREGATES: bool = False
+
+
+# Number of faces of the dice, which rolls a value from 1 to DICE_FACES inclusive
+DICE_FACES: int = 20
+
+
+# Default economy of the game, which an Economy can change when balancing the game
+SHINY_EXPONENT_RANGE: tuple = (10, 100000)  # smallest and largest N of the coin and EXP rewards 10 ** N of a shiny
+# Largest N of the rewards of a shiny, which turn journals store in 32 bits. They store N = 0 for no shiny, so N >= 1.
+MAX_SHINY_EXPONENT: int = 0xFFFFFFFF
+START_COIN_BONUS_EXPONENT: int = 4  # the start coin bonus is 10 ** (START_COIN_BONUS_EXPONENT * game level)
+CPU_DECISION_PROBABILITY: float = 0.75  # probability with which the CPU accepts every offer
+
+
+# Codes of the types of tiles on a compiled board
+EMPTY_SPACE_CODE: int = 0
+START_TILE_CODE: int = 1
+SHINY_ZONE_CODE: int = 2
+UPGRADE_SHOP_CODE: int = 3
+PLACE_CODE: int = 4
+QUIET_TILE_CODES: tuple = (EMPTY_SPACE_CODE, START_TILE_CODE)  # tiles where landing changes nothing else
+MAX_TRANSITION_TABLE_TILES: int = 4096  # largest number of tiles of a board whose moves are looked up in a table
+COMPILED_BOARDS: dict = {}  # compiled boards keyed by their tile codes, shared by all boards with the same tiles
+FAST_FORWARD_BLOCK_SIZE: int = 512  # number of turns per participant whose dice Game.fast_forward() rolls at once
+SNAPSHOT_CHAIN_LENGTH: int = 32  # a game snapshot holds the states of all places once every this many snapshots
+
+
+def get_tile_code(tile):
+    # type: (Tile) -> int
+    if isinstance(tile, Place):
+        return PLACE_CODE
+    elif isinstance(tile, ShinyZone):
+        return SHINY_ZONE_CODE
+    elif isinstance(tile, UpgradeShop):
+        return UPGRADE_SHOP_CODE
+    elif isinstance(tile, StartTile):
+        return START_TILE_CODE
+    return EMPTY_SPACE_CODE
+
+
+# Creating the random number generators of the game.
+
+
+# Every random draw of a game is computed from the seed of the game, the index of the game, the seat of the
+# participant drawing, the kind of draw and a counter derived from the turn, so that any single draw can be
+# reproduced without drawing the ones before it.
+DICE_DRAWS: int = 0
+SHINY_DRAWS: int = 1
+DECISION_DRAWS: int = 2
+DRAWS_PER_TURN: tuple = (1, 2, 2)  # maximum number of draws of each kind per turn
+RANDOM_BLOCK_SIZE: int = 4096  # number of draws generated at once by a stream
+MASK_64: int = (1 << 64) - 1
+GOLDEN_GAMMA: int = 0x9E3779B97F4A7C15
+NUMPY: object = False  # NumPy module once get_numpy() has tried importing it
+
+
+def mix64(value):
+    # type: (int) -> int
+    """
+    This function scrambles a 64-bit value with the finalizer of the SplitMix64 generator.
+    :return: the scrambled 64-bit value
+    """
+
+    value = (value + GOLDEN_GAMMA) & MASK_64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK_64
+    return value ^ (value >> 31)
+
+
+def get_stream_key(seed, game_index, seat, kind):
+    # type: (int, int, int, int) -> int
+    return mix64(mix64(mix64(mix64(seed & MASK_64) ^ game_index) ^ seat) ^ kind)
+
+
+def generate_turn_values(key, first_turn, n_turns, draws_per_turn, turn_stride):
+    # type: (int, int, int, int, int) -> list
+    """
+    This function generates the 64-bit random values of the stream with 'key' for the 'n_turns' turns first_turn,
+    first_turn + turn_stride, first_turn + 2 * turn_stride and so on at once, with NumPy if it is installed. Each
+    turn has 'draws_per_turn' values at consecutive counters from turn * draws_per_turn.
+    :return: a list of the random values in the order of their turns and counters
+    """
+
+    numpy = get_numpy()
+    if numpy is None:
+        return [mix64((key + ((first_turn + i * turn_stride) * draws_per_turn + draw) * GOLDEN_GAMMA) & MASK_64)
+                for i in range(n_turns) for draw in range(draws_per_turn)]
+
+    turns = numpy.arange(n_turns, dtype=numpy.uint64) * numpy.uint64(turn_stride) + numpy.uint64(first_turn)
+    counters = (turns[:, None] * numpy.uint64(draws_per_turn) +
+                numpy.arange(draws_per_turn, dtype=numpy.uint64)[None, :]).ravel()
+    return mix64_array(numpy.uint64(key) + counters * numpy.uint64(GOLDEN_GAMMA)).tolist()
+
+
+def mix64_array(values):
+    # type: (object) -> object
+    # NumPy version of mix64() scrambling a whole array of unsigned 64-bit values
+    numpy = get_numpy()
+    values = values + numpy.uint64(GOLDEN_GAMMA)
+    values = (values ^ (values >> numpy.uint64(30))) * numpy.uint64(0xBF58476D1CE4E5B9)
+    values = (values ^ (values >> numpy.uint64(27))) * numpy.uint64(0x94D049BB133111EB)
+    return values ^ (values >> numpy.uint64(31))
+
+
+def get_numpy():
+    # type: () -> object
+    # Returns the NumPy module, or None if it is not installed. NumPy is optional and only imported when needed.
+    global NUMPY
+    if NUMPY is False:
+        try:
+            import numpy
+            NUMPY = numpy
+        except ImportError:
+            NUMPY = None
+    return NUMPY
+
+
+def value_to_randint(value, a, b):
+    # type: (int, int, int) -> int
+    # Maps a 64-bit random value to an integer from 'a' to 'b' inclusive.
+    return a + (((value >> 32) * (b - a + 1)) >> 32)
+
+
+def value_to_random(value):
+    # type: (int) -> float
+    # Maps a 64-bit random value to a float in [0, 1).
+    return (value >> 11) * (1.0 / (1 << 53))
+
+
+class CounterRandomStream:
+    """
+    This class contains attributes of the stream of random draws of one kind made by one participant of a game.
+    Draws are generated in blocks of 'block_size' holding the draws of every 'turn_stride'-th turn, which are the
+    turns of the participant when the game has 'turn_stride' participants, so that no draws are wasted on the turns
+    of the others.
+    """
+
+    def __init__(self, key, draws_per_turn, turn_stride=1, block_size=RANDOM_BLOCK_SIZE):
+        # type: (int, int, int, int) -> None
+        self.key: int = key
+        self.draws_per_turn: int = draws_per_turn
+        self.turn_stride: int = turn_stride
+        self.block_size: int = block_size
+        self.counter: int = 0  # initial value
+        self.turn: int = -1  # turn whose draws the counter points at
+        self.__block_turn: int = -1  # first turn of the block
+        self.__block: list = []  # initial value
+
+    def seek(self, turn):
+        # type: (int) -> None
+        if turn != self.turn:
+            self.turn = turn
+            self.counter = turn * self.draws_per_turn
+
+    def next_value(self):
+        # type: () -> int
+        turn, draw = divmod(self.counter, self.draws_per_turn)
+        offset: int = turn - self.__block_turn
+        index: int = offset // self.turn_stride * self.draws_per_turn + draw
+        if offset < 0 or offset % self.turn_stride != 0 or index >= len(self.__block):
+            self.__block_turn = turn
+            self.__block = generate_turn_values(self.key, turn, max(1, self.block_size // self.draws_per_turn),
+                                                self.draws_per_turn, self.turn_stride)
+            index = draw
+
+        self.counter += 1
+        return self.__block[index]
+
+    def randint(self, a, b):
+        # type: (int, int) -> int
+        return value_to_randint(self.next_value(), a, b)
+
+    def random(self):
+        # type: () -> float
+        return value_to_random(self.next_value())
+
+
+class RandomService:
+    """
+    This class contains attributes of the random number generator of a game, which hands out counter-based streams
+    per participant and kind of draw.
+    """
+
+    def __init__(self, seed=None, game_index=0):
+        # type: (int or None, int) -> None
+        self.seed: int = random.getrandbits(64) if seed is None else seed & MASK_64
+        self.game_index: int = game_index
+        self.turn: int = 0  # initial value
+        self.seat: int = 0  # initial value
+        self.n_seats: int = 2  # number of participants taking turns in the game
+        self.block_size: int = RANDOM_BLOCK_SIZE  # number of draws generated at once by each stream
+        self.__streams: dict = {}  # streams keyed by (seat, kind), created when first needed
+
+    def __getstate__(self):
+        # type: () -> dict
+        # The streams are recreated from the seed when needed.
+        return {"seed": self.seed, "game_index": self.game_index, "turn": self.turn, "seat": self.seat,
+                "n_seats": self.n_seats, "block_size": self.block_size}
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        self.__dict__.update(state)
+        self.__streams = {}
+
+    def set_block_size(self, block_size):
+        # type: (int) -> None
+        # Small blocks use less memory in games whose turns are far apart, e.g. games played interactively.
+        self.block_size = block_size
+        self.__streams = {}
+
+    def set_seat_count(self, n_seats):
+        # type: (int) -> None
+        # The draws do not depend on the number of seats, which only decides which draws are generated together.
+        self.n_seats = n_seats
+        self.__streams = {}
+
+    def get_stream(self, seat, kind):
+        # type: (int, int) -> CounterRandomStream
+        stream: CounterRandomStream or None = self.__streams.get((seat, kind))
+        if stream is None:
+            stream = CounterRandomStream(get_stream_key(self.seed, self.game_index, seat, kind), DRAWS_PER_TURN[kind],
+                                         self.n_seats, self.block_size)
+            self.__streams[(seat, kind)] = stream
+        return stream
+
+    def begin_turn(self, turn, seat):
+        # type: (int, int) -> None
+        self.turn = turn
+        self.seat = seat
+
+    def draws(self, kind):
+        # type: (int) -> CounterRandomStream
+        # Returns the stream of draws of 'kind' for the participant playing the current turn.
+        stream: CounterRandomStream = self.get_stream(self.seat, kind)
+        stream.seek(self.turn)
+        return stream
+
+    def pregenerate_dice(self, seat, turns):
+        # type: (int, list) -> list
+        """
+        This method computes the dice values rolled by the participant in 'seat' on each of 'turns' at once.
+        :return: a list of dice values
+        """
+
+        key: int = self.get_stream(seat, DICE_DRAWS).key
+        numpy = get_numpy()
+        if numpy is None:
+            return [value_to_randint(mix64((key + turn * DRAWS_PER_TURN[DICE_DRAWS] * GOLDEN_GAMMA) & MASK_64),
+                                     1, DICE_FACES) for turn in turns]
+
+        counters = numpy.asarray(turns, dtype=numpy.uint64) * numpy.uint64(DRAWS_PER_TURN[DICE_DRAWS])
+        values = mix64_array(numpy.uint64(key) + counters * numpy.uint64(GOLDEN_GAMMA))
+        return (1 + (((values >> numpy.uint64(32)) * numpy.uint64(DICE_FACES)) >> numpy.uint64(32))).tolist()
+
+
+# Creating the turn metrics of the game.
+
+
+# Phases of a turn and of the main loop whose latencies are measured by TurnMetrics
+DICE_ROLL_PHASE: str = "dice_roll"
+TILE_DISPATCH_PHASE: str = "tile_dispatch"
+SHINY_GENERATION_PHASE: str = "shiny_generation"
+SHOP_TRANSACTION_PHASE: str = "shop_transaction"
+PLACE_TRANSACTION_PHASE: str = "place_transaction"
+INCOME_ACCRUAL_PHASE: str = "income_accrual"
+RENDERING_PHASE: str = "rendering"
+SAVE_IO_PHASE: str = "save_io"
+TURN_PHASES: tuple = (DICE_ROLL_PHASE, TILE_DISPATCH_PHASE, SHINY_GENERATION_PHASE, SHOP_TRANSACTION_PHASE,
+                      PLACE_TRANSACTION_PHASE, INCOME_ACCRUAL_PHASE, RENDERING_PHASE, SAVE_IO_PHASE)
+# Upper bounds in seconds of the buckets of the latency histograms, the last bucket being unbounded
+LATENCY_BUCKETS: tuple = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 5e-3, 1e-2,
+                          2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0, 2.5)
+METRICS_FORMATS: tuple = ("json", "prometheus")
+METRICS_PREFIX: str = "tenzichi_"  # prefix of the names of the metrics in the Prometheus text format
+PROMETHEUS_FILE_EXTENSION: str = ".prom"
+
+
+def get_metrics_format(file_name):
+    # type: (str or None) -> str
+    # Metrics files whose names end with PROMETHEUS_FILE_EXTENSION are in the Prometheus text format.
+    return "prometheus" if file_name is not None and file_name.endswith(PROMETHEUS_FILE_EXTENSION) else "json"
+
+
+class TurnMetrics:
+    """
+    This class contains attributes of the counters and latency histograms of the phases of the turns of a game.
+    A game only measures its turns while its 'metrics' are set, so that games without metrics pay for nothing more
+    than checking that they have none.
+    """
+
+    def __init__(self, file_name=None, export_format=None, export_interval=0):
+        # type: (str or None, str or None, int) -> None
+        if export_format is None:
+            export_format = get_metrics_format(file_name)
+        if export_format not in METRICS_FORMATS:
+            raise ValueError("Unknown metrics format: " + str(export_format))
+
+        self.file_name: str or None = file_name  # file the metrics are exported into
+        self.export_format: str = export_format
+        self.export_interval: int = export_interval  # number of turns between exports, or 0 for none
+        self.next_export_turn: int = export_interval  # the metrics are exported after the first turn from this one
+        self.counters: dict = {"turns": 0, "fast_forwarded_turns": 0, "shinies": 0, "upgrades_bought": 0,
+                               "place_transactions": 0, "saves": 0}
+        # Number of latencies in every bucket of LATENCY_BUCKETS and the unbounded last bucket of every phase
+        self.bucket_counts: dict = {phase: [0] * (len(LATENCY_BUCKETS) + 1) for phase in TURN_PHASES}
+        self.latency_sums: dict = {phase: 0.0 for phase in TURN_PHASES}
+
+    def __str__(self):
+        # type: () -> str
+        res: str = ""  # initial value
+        for name, value in self.counters.items():
+            res += name + ": " + str(value) + "\n"
+
+        for phase in TURN_PHASES:
+            count: int = sum(self.bucket_counts[phase])
+            if count > 0:
+                res += phase + ": " + str(count) + " times, " + str(self.latency_sums[phase] / count) + \
+                    " seconds on average\n"
+
+        return res
+
+    def record(self, phase, start_time):
+        # type: (str, float) -> float
+        # Records that 'phase' ran from 'start_time' until now and returns now, which is when the next phase starts.
+        end_time: float = time.perf_counter()
+        latency: float = end_time - start_time
+        self.bucket_counts[phase][bisect.bisect_left(LATENCY_BUCKETS, latency)] += 1
+        self.latency_sums[phase] += latency
+        return end_time
+
+    def increment(self, counter, amount=1):
+        # type: (str, int) -> None
+        self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    def end_turn(self, game):
+        # type: (Game) -> None
+        # Turns rolled in bulk by Game.fast_forward() do not end one by one, so an export can come a few turns late.
+        self.counters["turns"] += 1
+        if 0 < self.export_interval and self.next_export_turn <= game.turn:
+            self.export()
+            self.next_export_turn = (game.turn // self.export_interval + 1) * self.export_interval
+
+    def to_dict(self):
+        # type: () -> dict
+        res: dict = {"counters": dict(self.counters), "phases": {}}
+        for phase in TURN_PHASES:
+            cumulative_count: int = 0  # initial value
+            buckets: dict = {}  # initial value
+            for upper_bound, bucket_count in zip(LATENCY_BUCKETS + ("+Inf",), self.bucket_counts[phase]):
+                cumulative_count += bucket_count
+                buckets[str(upper_bound)] = cumulative_count
+            res["phases"][phase] = {"count": cumulative_count, "sum_seconds": self.latency_sums[phase],
+                                    "buckets": buckets}
+
+        return res
+
+    def to_prometheus(self):
+        # type: () -> str
+        # Returns the metrics in the Prometheus text exposition format, with cumulative histogram buckets.
+        res: str = ""  # initial value
+        for name, value in self.counters.items():
+            res += "# TYPE " + METRICS_PREFIX + name + "_total counter\n"
+            res += METRICS_PREFIX + name + "_total " + str(value) + "\n"
+
+        res += "# HELP " + METRICS_PREFIX + "phase_seconds Latency of each phase of a turn.\n"
+        res += "# TYPE " + METRICS_PREFIX + "phase_seconds histogram\n"
+        for phase, phase_metrics in self.to_dict()["phases"].items():
+            for upper_bound, cumulative_count in phase_metrics["buckets"].items():
+                res += METRICS_PREFIX + "phase_seconds_bucket{phase=\"" + phase + "\",le=\"" + upper_bound + \
+                    "\"} " + str(cumulative_count) + "\n"
+            res += METRICS_PREFIX + "phase_seconds_sum{phase=\"" + phase + "\"} " + \
+                repr(phase_metrics["sum_seconds"]) + "\n"
+            res += METRICS_PREFIX + "phase_seconds_count{phase=\"" + phase + "\"} " + \
+                str(phase_metrics["count"]) + "\n"
+
+        return res
+
+    def export(self, file_name=None):
+        # type: (str or None) -> None
+        # Replaces the file of the metrics at once, so that a reader never sees it half written.
+        file_name = self.file_name if file_name is None else file_name
+        if file_name is None:
+            return
+
+        if self.export_format == "prometheus":
+            text: str = self.to_prometheus()
+        else:
+            import json
+            text: str = json.dumps(self.to_dict(), indent=4) + "\n"
+
+        with open(file_name + ".tmp", "w") as file:
+            file.write(text)
+        os.replace(file_name + ".tmp", file_name)
+
+    def export_at_exit(self):
+        # type: () -> None
+        import atexit
+        atexit.register(self.export)
+
+
+# Creating necessary classes
+
+
+class Upgrade:
+    """
+    This class contains attributes of upgrades in this game.
+    """
+
+    def __init__(self, name, coin_cost, coin_gain_multiplier, exp_gain_multiplier):
+        # type: (str, mpf, int, int) -> None
+        self.name: str = name
+        self.coin_cost: mpf = coin_cost
+        self.coin_gain_multiplier: int = coin_gain_multiplier
+        self.exp_gain_multiplier: int = exp_gain_multiplier
+
+    def __str__(self):
+        # type: () -> str
+        res: str = ""  # initial value
+        res += "Name: " + str(self.name) + "\n"
+        res += "Coin cost: " + str(self.coin_cost) + "\n"
+        res += "Coin gain multiplier: " + str(self.coin_gain_multiplier) + "\n"
+        res += "EXP gain multiplier: " + str(self.exp_gain_multiplier) + "\n"
+        return res
+
+    def clone(self):
+        # type: () -> Upgrade
+        return copy.deepcopy(self)
+
+
+class Player:
+    """
+    This class contains attributes of the player in this game.
+    """
+
+    def __init__(self, name, numeric_backend=None):
+        # type: (str, NumericBackend) -> None
+        self.player_id: str = generate_player_id()  # randomly generate player ID
+        self.name: str = name
+        self.numeric_backend: NumericBackend = MPF_BACKEND if numeric_backend is None else numeric_backend
+        self.__level: int = 1
+        self.__exp: mpf = self.numeric_backend.number("0")
+        self.__required_exp: mpf = self.numeric_backend.number("1e6")
+        self.__coins: mpf = self.numeric_backend.number("0")
+        self.__accrued_turns: int = 0  # turns of income earned at the current rates but not paid yet
+        self.position: int = 0
+        self.__owned_places: dict = {}  # owned places in order of ownership, used as an ordered set
+        self.__upgrade_list: list = []  # initial value
+        # The upgrades as nested pairs of the last upgrade and the ones before it, so that game snapshots share them
+        self.__upgrade_chain: tuple or None = None
+        self.__recompute_income_aggregates()
+
+    def __str__(self):
+        # type: () -> str
+        res: str = ""  # initial value
+        res += "Player ID: " + str(self.player_id) + "\n"
+        res += "Name: " + str(self.name) + "\n"
+        res += "Level: " + str(self.level) + "\n"
+        res += "EXP: " + str(self.exp) + "\n"
+        res += "Required EXP: " + str(self.required_exp) + "\n"
+        res += "Coins: " + str(self.coins) + "\n"
+        res += "Position: " + str(self.position) + "\n"
+        res += "Below is a list of places owned by this player:\n"
+        for place in self.__owned_places:
+            res += str(place) + "\n"
+
+        res += "Below is a list of upgrades owned by this player:\n"
+        for upgrade in self.__upgrade_list:
+            res += str(upgrade) + "\n"
+
+        return res
+
+    # Income is accrued lazily: each turn only counts the turns of income earned, and the coins and EXP earned are
+    # paid in one go when the level, EXP, required EXP or coins of this player are next read or written.
+
+    @property
+    def level(self):
+        # type: () -> int
+        self.settle_income()
+        return self.__level
+
+    @level.setter
+    def level(self, value):
+        # type: (int) -> None
+        self.settle_income()
+        self.__level = value
+
+    @property
+    def exp(self):
+        # type: () -> mpf
+        self.settle_income()
+        return self.__exp
+
+    @exp.setter
+    def exp(self, value):
+        # type: (mpf) -> None
+        self.settle_income()
+        self.__exp = value
+
+    @property
+    def required_exp(self):
+        # type: () -> mpf
+        self.settle_income()
+        return self.__required_exp
+
+    @required_exp.setter
+    def required_exp(self, value):
+        # type: (mpf) -> None
+        self.settle_income()
+        self.__required_exp = value
+
+    @property
+    def coins(self):
+        # type: () -> mpf
+        self.settle_income()
+        return self.__coins
+
+    @coins.setter
+    def coins(self, value):
+        # type: (mpf) -> None
+        self.settle_income()
+        self.__coins = value
+
+    def get_paid_level(self):
+        # type: () -> int
+        # Returns the level of this player without paying the income accrued, which is at most the current level.
+        return self.__level
+
+    def accrue_income(self, n_turns):
+        # type: (int) -> None
+        self.__accrued_turns += n_turns
+
+    def settle_income(self):
+        # type: () -> None
+        """
+        This method pays the income of the turns accrued since it was last called, all at the current rates, and
+        levels this player up accordingly.
+        :return: None
+        """
+
+        n_turns: int = self.__accrued_turns
+        if n_turns == 0:
+            return
+
+        self.__accrued_turns = 0
+        self.__coins += self.get_coins_per_turn() * n_turns
+        self.__exp += self.get_exp_per_turn() * n_turns
+        self.level_up()
+
+    def __recompute_income_aggregates(self):
+        # type: () -> None
+        # The incomes of owned places are summed and the multipliers of upgrades are multiplied once here and then
+        # kept up to date by the methods which change them, so that income is not recomputed every turn.
+        self.__coins_per_turn_sum: mpf = \
+            self.numeric_backend.sum_of_list([place.coins_per_turn for place in self.__owned_places])
+        self.__exp_per_turn_sum: mpf = \
+            self.numeric_backend.sum_of_list([place.exp_per_turn for place in self.__owned_places])
+        self.__coin_gain_multiplier: mpf = \
+            self.numeric_backend.product_of_list([upgrade.coin_gain_multiplier for upgrade in self.__upgrade_list])
+        self.__exp_gain_multiplier: mpf = \
+            self.numeric_backend.product_of_list([upgrade.exp_gain_multiplier for upgrade in self.__upgrade_list])
+
+    def __release_place(self, place, coins_per_turn, exp_per_turn):
+        # type: (Place, mpf, mpf) -> None
+        self.settle_income()  # the income accrued so far was earned with this place
+        del self.__owned_places[place]
+        # Subtracting an income which makes up most of the sum would cancel away the smaller incomes in it.
+        if coins_per_turn * 2 >= self.__coins_per_turn_sum or exp_per_turn * 2 >= self.__exp_per_turn_sum:
+            self.__recompute_income_aggregates()
+        else:
+            self.__coins_per_turn_sum -= coins_per_turn
+            self.__exp_per_turn_sum -= exp_per_turn
+
+    def verify_income_aggregates(self):
+        # type: () -> None
+        """
+        This method checks the incomes kept up to date by this player against recomputing them from the owned places
+        and upgrades.
+        :return: None
+        """
+
+        coins_per_turn: mpf = self.get_coins_per_turn()
+        exp_per_turn: mpf = self.get_exp_per_turn()
+        self.__recompute_income_aggregates()
+        if abs(coins_per_turn - self.get_coins_per_turn()) > abs(self.get_coins_per_turn()) * 1e-9 or \
+                abs(exp_per_turn - self.get_exp_per_turn()) > abs(self.get_exp_per_turn()) * 1e-9:
+            raise RuntimeError("Income aggregates of " + str(self.name) + " are out of date: " +
+                               str(coins_per_turn) + " coins and " + str(exp_per_turn) + " EXP per turn instead of " +
+                               str(self.get_coins_per_turn()) + " coins and " + str(self.get_exp_per_turn()) +
+                               " EXP per turn.")
+
+    def get_coins_per_turn(self):
+        # type: () -> mpf
+        return self.__coins_per_turn_sum * self.__coin_gain_multiplier
+
+    def get_exp_per_turn(self):
+        # type: () -> mpf
+        return self.__exp_per_turn_sum * self.__exp_gain_multiplier
+
+    def level_up(self):
+        # type: () -> None
+        """
+        This method levels this player up as many times as his/her EXP allows. Levelling up from level l to l + 1
+        multiplies the required EXP by 10 ** (l + 1), so levelling up k times from level l multiplies it by
+        10 ** (k * l + k * (k + 1) / 2). The number of levels gained is the smallest k for which the EXP is below
+        that, which is estimated by solving the quadratic equation and then corrected with exact comparisons.
+        :return: None
+        """
+
+        if self.exp < self.__required_exp:
+            return
+
+        backend: NumericBackend = self.numeric_backend
+        log10_gap: float = max(0.0, backend.log10(self.__exp) - backend.log10(self.__required_exp))
+        b: int = 2 * self.__level + 1
+        levels_gained: int = max(1, int((math.sqrt(b * b + 8 * log10_gap) - b) / 2) + 1)
+        while levels_gained > 1 and self.__exp < self.__get_required_exp_after(levels_gained - 1):
+            levels_gained -= 1
+        while self.__exp >= self.__get_required_exp_after(levels_gained):
+            levels_gained += 1
+
+        self.__required_exp = self.__get_required_exp_after(levels_gained)
+        self.__level += levels_gained
+
+    def __get_required_exp_after(self, levels_gained):
+        # type: (int) -> mpf
+        return self.__required_exp * self.numeric_backend.power_of_ten(
+            levels_gained * self.__level + levels_gained * (levels_gained + 1) // 2)
+
+    def roll_dice(self, dice, game):
+        # type: (Dice, Game) -> bool
+        # Returns whether this player passed START.
+        self.position, passed_start = game.board.get_compiled_board().move(self.position, dice.value)
+        if passed_start:
+            self.coins += game.start_coin_bonus
+        return passed_start
+
+    def buy_upgrade(self, upgrade):
+        # type: (Upgrade) -> bool
+        if self.coins >= upgrade.coin_cost:
+            self.coins -= upgrade.coin_cost
+            self.__upgrade_list.append(upgrade)
+            self.__upgrade_chain = (upgrade, self.__upgrade_chain)
+            self.__coin_gain_multiplier *= upgrade.coin_gain_multiplier
+            self.__exp_gain_multiplier *= upgrade.exp_gain_multiplier
+            return True
+        return False
+
+    def purchase_place(self, place):
+        # type: (Place) -> bool
+        if self.coins >= place.coin_cost and place.owner_id is None:
+            self.coins -= place.coin_cost
+            place.coin_cost *= self.numeric_backend.power_of_ten(self.level)
+            self.__owned_places[place] = None
+            place.set_owner(self.player_id)
+            self.__coins_per_turn_sum += place.coins_per_turn
+            self.__exp_per_turn_sum += place.exp_per_turn
+            return True
+        return False
+
+    def upgrade_place(self, place):
+        # type: (Place) -> bool
+        if self.coins >= place.coin_cost and place.owner_id == self.player_id:
+            self.coins -= place.coin_cost
+            self.level += 1
+            place.mark_changed()
+            old_coins_per_turn: mpf = place.coins_per_turn
+            old_exp_per_turn: mpf = place.exp_per_turn
+            place.coin_cost *= self.numeric_backend.power_of_ten(self.level)
+            place.coins_per_turn *= self.numeric_backend.power_of_ten(self.level)
+            place.exp_per_turn *= self.numeric_backend.power_of_ten(self.level)
+            self.__coins_per_turn_sum += place.coins_per_turn - old_coins_per_turn
+            self.__exp_per_turn_sum += place.exp_per_turn - old_exp_per_turn
+            return True
+        return False
+
+    def acquire_place(self, place, other):
+        # type: (Place, Player) -> bool
+        if self.coins >= place.coin_cost and place.owner_id == other.player_id and other is not self:
+            self.coins -= place.coin_cost
+            self.level += 1
+            other.__release_place(place, place.coins_per_turn, place.exp_per_turn)
+            place.coin_cost *= self.numeric_backend.power_of_ten(self.level)
+            place.coins_per_turn *= self.numeric_backend.power_of_ten(self.level)
+            place.exp_per_turn *= self.numeric_backend.power_of_ten(self.level)
+            self.__owned_places[place] = None
+            place.set_owner(self.player_id)
+            self.__coins_per_turn_sum += place.coins_per_turn
+            self.__exp_per_turn_sum += place.exp_per_turn
+            return True
+        return False
+
+    def get_owned_list(self):
+        # type: () -> list
+        return list(self.__owned_places)
+
+    def count_owned(self):
+        # type: () -> int
+        return len(self.__owned_places)
+
+    def get_upgrade_list(self):
+        # type: () -> list
+        return self.__upgrade_list
+
+    def restore_state(self, level, exp, required_exp, coins, position, owned_places, upgrades):
+        # type: (int, mpf, mpf, mpf, int, list, list) -> None
+        """
+        This method replaces the state of this player, e.g. when loading a saved game. It takes ownership of
+        'owned_places' without paying for them.
+        :return: None
+        """
+
+        self.__accrued_turns = 0
+        self.__level = level
+        self.__exp = exp
+        self.__required_exp = required_exp
+        self.__coins = coins
+        self.position = position
+        self.__owned_places = dict.fromkeys(owned_places)
+        for place in owned_places:
+            place.set_owner(self.player_id)
+
+        self.__upgrade_list = list(upgrades)
+        self.__upgrade_chain = None
+        for upgrade in upgrades:
+            self.__upgrade_chain = (upgrade, self.__upgrade_chain)
+        self.__recompute_income_aggregates()
+
+    def owns_all_places(self, game):
+        # type: (Game) -> bool
+        return len(self.__owned_places) == len(game.board.get_places())
+
+    def get_state(self, previous=None):
+        # type: (PlayerState or None) -> PlayerState
+        """
+        This method captures the state of this player which changes during a game. Parts of it which are unchanged
+        since 'previous' are shared with it, and 'previous' itself is returned if nothing changed.
+        :return: the state of this player
+        """
+
+        owned_places: tuple = tuple(self.__owned_places)
+        if previous is not None and owned_places == previous.owned_places:
+            owned_places = previous.owned_places
+
+        state: PlayerState = PlayerState(self.__level, self.__exp, self.__required_exp, self.__coins,
+                                         self.__accrued_turns, self.position, owned_places, self.__upgrade_chain,
+                                         self.__coins_per_turn_sum, self.__exp_per_turn_sum,
+                                         self.__coin_gain_multiplier, self.__exp_gain_multiplier)
+        return previous if previous is not None and previous.matches(state) else state
+
+    def set_state(self, state):
+        # type: (PlayerState) -> None
+        # The owners of the places in 'state' are restored by the board.
+        self.__level = state.level
+        self.__exp = state.exp
+        self.__required_exp = state.required_exp
+        self.__coins = state.coins
+        self.__accrued_turns = state.accrued_turns
+        self.position = state.position
+        self.__owned_places = dict.fromkeys(state.owned_places)
+        self.__upgrade_chain = state.upgrades
+        self.__upgrade_list = []
+        upgrade_chain: tuple or None = state.upgrades
+        while upgrade_chain is not None:
+            self.__upgrade_list.append(upgrade_chain[0])
+            upgrade_chain = upgrade_chain[1]
+        self.__upgrade_list.reverse()
+        self.__coins_per_turn_sum = state.coins_per_turn_sum
+        self.__exp_per_turn_sum = state.exp_per_turn_sum
+        self.__coin_gain_multiplier = state.coin_gain_multiplier
+        self.__exp_gain_multiplier = state.exp_gain_multiplier
+
+    def __getstate__(self):
+        # type: () -> dict
+        # The upgrade chain is rebuilt from the upgrade list, since copying its nesting could exceed the recursion
+        # limit.
+        state: dict = self.__dict__.copy()
+        del state["_Player__upgrade_chain"]
+        return state
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        self.__dict__.update(state)
+        if "numeric_backend" not in state:
+            # Saved by the first version of the game, which pickled the whole game
+            self.numeric_backend = MPF_BACKEND
+            self.__owned_places = dict.fromkeys(self.__dict__.pop("_Player__owned_list"))
+            for name in ("level", "exp", "required_exp", "coins"):
+                self.__dict__["_Player__" + name] = self.__dict__.pop(name)
+            self.__accrued_turns = 0
+            self.__recompute_income_aggregates()
+        self.__upgrade_chain = None
+        for upgrade in self.__upgrade_list:
+            self.__upgrade_chain = (upgrade, self.__upgrade_chain)
+
+    def clone(self):
+        # type: () -> Player
+        return copy.deepcopy(self)
+
+
+class CPU(Player):
+    """
+    This class contains attributes of player's CPU controlled
+    """
+
+    def __init__(self, numeric_backend=None):
+        # type: (NumericBackend) -> None
+        Player.__init__(self, "CPU PLAYER", numeric_backend)
+
+
+class OwnershipIndex:
+    """
+    This class contains attributes of which participant owns each place on a board.
+    Places are identified by their ordinal, i.e. their index among the places of the board. Only owned places are
+    stored, so that boards with millions of places need no memory for the places nobody owns.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self.__owners: dict = {}  # owner IDs keyed by the ordinals of owned places
+        self.__owned: dict = {}  # ordinals of owned places keyed by owner ID, each used as an ordered set
+        self.changed_ordinals: set = set()  # ordinals of places changed since the last game snapshot
+
+    def assign(self, ordinal, owner_id):
+        # type: (int, str or None) -> None
+        self.changed_ordinals.add(ordinal)
+        previous_owner_id: str or None = self.__owners.pop(ordinal, None)
+        if previous_owner_id is not None:
+            del self.__owned[previous_owner_id][ordinal]
+        if owner_id is not None:
+            self.__owned.setdefault(owner_id, {})[ordinal] = None
+            self.__owners[ordinal] = owner_id
+
+    def owner_of(self, ordinal):
+        # type: (int) -> str or None
+        return self.__owners.get(ordinal)
+
+    def places_owned_by(self, owner_id):
+        # type: (str) -> list
+        return list(self.__owned.get(owner_id, ()))
+
+    def count_owned(self, owner_id):
+        # type: (str) -> int
+        return len(self.__owned.get(owner_id, ()))
+
+
+class CompiledBoard:
+    """
+    This class contains attributes of a board compiled into tables, so that moving and finding out the type of the tile
+    landed on are table lookups. Boards with more than MAX_TRANSITION_TABLE_TILES tiles compute moves instead of
+    looking them up, since their table would hold DICE_FACES entries per tile.
+    """
+
+    def __init__(self, tile_codes, place_positions):
+        # type: (list or memoryview, list or memoryview) -> None
+        self.size: int = len(tile_codes)
+        self.tile_codes: list or memoryview = tile_codes  # code of the type of the tile on each position
+        self.place_positions: list or memoryview = place_positions  # position of each place in ascending order
+
+        # The destination and whether START is passed for every position and dice value, at index
+        # position * DICE_FACES + dice value - 1
+        self.transitions: list or None = None  # initial value
+        if self.size <= MAX_TRANSITION_TABLE_TILES:
+            self.transitions = [((position + value) % self.size, position + value >= self.size)
+                                for position in range(self.size) for value in range(1, DICE_FACES + 1)]
+
+    def __deepcopy__(self, memo):
+        # type: (dict) -> CompiledBoard
+        # The tables never change, so copies of a board share them.
+        return self
+
+    def move(self, position, dice_value):
+        # type: (int, int) -> tuple
+        if self.transitions is None:
+            destination: int = position + dice_value
+            return destination % self.size, destination >= self.size
+        return self.transitions[position * DICE_FACES + dice_value - 1]
+
+
+class Board:
+    """
+    This class contains attributes of the board, whose upgrades, places and shinies follow its economy.
+    """
+
+    def __init__(self, tiles, economy=None):
+        # type: (list, Economy or None) -> None
+        self.__tiles: list = tiles
+        self.economy: Economy = DEFAULT_ECONOMY if economy is None else economy
+        self.__places: list = [tile for tile in tiles if isinstance(tile, Place)]
+        self.__ownership: OwnershipIndex = OwnershipIndex()
+        for ordinal, place in enumerate(self.__places):
+            self.adopt_place(ordinal, place)
+
+        self.__compiled: CompiledBoard or None = None  # compiled when first needed
+
+    def __str__(self):
+        # type: () -> str
+        res: str = "Below is a list of tiles on the board:\n"
+        for tile in self.__tiles:
+            res += str(tile) + "\n"
+
+        return res
+
+    def get_tiles(self):
+        # type: () -> list
+        return self.__tiles
+
+    def get_places(self):
+        # type: () -> list
+        return self.__places
+
+    def get_place(self, ordinal):
+        # type: (int) -> Place
+        return self.__places[ordinal]
+
+    def get_loaded_places(self):
+        # type: () -> list
+        # Returns the places which exist as objects, which are all places of a board created from a list of tiles.
+        return self.__places
+
+    def adopt_place(self, ordinal, place):
+        # type: (int, Place) -> None
+        # Makes 'place' the place with 'ordinal' on this board, whose owner is kept in the ownership index.
+        place.ordinal = ordinal
+        place.ownership = self.__ownership
+        if place.owner_id is not None:
+            self.__ownership.assign(ordinal, place.owner_id)
+
+    def get_modified_places(self):
+        # type: () -> list
+        # Returns the places which may not be in their initial state, which are all places of a board created from a
+        # list of tiles.
+        return self.__places
+
+    def get_initial_place_state(self, ordinal):
+        # type: (int) -> PlaceState
+        # Only generated boards load places after a game has started, so only they keep the initial states of places.
+        raise ValueError("The initial states of the places of a board created from a list of tiles are not kept.")
+
+    def get_upgrade_catalog(self):
+        # type: () -> list
+        # Returns the upgrades sold on the upgrade shops of this board.
+        for tile in self.__tiles:
+            if isinstance(tile, UpgradeShop):
+                return tile.get_upgrades_sold()
+        return []
+
+    def get_compiled_board(self):
+        # type: () -> CompiledBoard
+        if self.__compiled is None:
+            tile_codes: tuple = tuple(get_tile_code(tile) for tile in self.__tiles)
+            if tile_codes not in COMPILED_BOARDS:
+                COMPILED_BOARDS[tile_codes] = CompiledBoard(list(tile_codes), [
+                    position for position, tile_code in enumerate(tile_codes) if tile_code == PLACE_CODE])
+            self.__compiled = COMPILED_BOARDS[tile_codes]
+        return self.__compiled
+
+    def owner_of(self, ordinal):
+        # type: (int) -> str or None
+        return self.__ownership.owner_of(ordinal)
+
+    def get_changed_ordinals(self):
+        # type: () -> set
+        return self.__ownership.changed_ordinals
+
+    def places_owned_by(self, owner_id):
+        # type: (str) -> list
+        return [self.get_place(ordinal) for ordinal in self.__ownership.places_owned_by(owner_id)]
+
+    def count_owned(self, owner_id):
+        # type: (str) -> int
+        return self.__ownership.count_owned(owner_id)
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        if "_Board__ownership" not in state:
+            # Saved by the first version of the game, which pickled the whole game
+            self.__init__(state["_Board__tiles"])
+        else:
+            self.__dict__.update(state)
+
+    def clone(self):
+        # type: () -> Board
+        return copy.deepcopy(self)
+
+
+class Tile:
+    """
+    This class contains attributes of a tile on the board.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self.name: str = ""  # initial value
+        self.description: str = ""  # initial value
+
+    def __str__(self):
+        # type: () -> str
+        res: str = ""  # initial value
+        res += "Name: " + str(self.name) + "\n"
+        res += "Description: " + str(self.description) + "\n"
+        return res
+
+    def clone(self):
+        # type: () -> Tile
+        return copy.deepcopy(self)
+
+
+class Place(Tile):
+    """
+    This class contains attributes of a place which the player and CPU can purchase.
+    """
+
+    def __init__(self, name, description, coin_cost, coins_per_turn, exp_per_turn):
+        # type: (str, str, mpf, mpf, mpf) -> None
+        Tile.__init__(self)
+        self.name = name.upper()
+        self.level: int = 1  # initial value
+        self.description = description
+        self.coin_cost: mpf = coin_cost
+        self.coins_per_turn: mpf = coins_per_turn
+        self.exp_per_turn: mpf = exp_per_turn
+        self.owner_id: str or None = None  # initial value
+        self.ordinal: int = -1  # index among the places of the board, set by the board
+        self.ownership: OwnershipIndex or None = None  # ownership index of the board, set by the board
+
+    def __str__(self):
+        # type: () -> str
+        res: str = Tile.__str__(self)
+        res += "Level: " + str(self.level) + "\n"
+        res += "Coin cost: " + str(self.coin_cost) + "\n"
+        res += "Coins per turn: " + str(self.coins_per_turn) + "\n"
+        res += "EXP per turn: " + str(self.exp_per_turn) + "\n"
+        return res
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        self.__dict__.update(state)
+        if "owner_id" not in state:
+            # Saved by the first version of the game, which pickled the whole game
+            self.owner_id = None
+            self.ordinal = -1
+            self.ownership = None
+
+    def set_owner(self, owner_id):
+        # type: (str or None) -> None
+        self.owner_id = owner_id
+        if self.ownership is not None:
+            self.ownership.assign(self.ordinal, owner_id)
+
+    def mark_changed(self):
+        # type: () -> None
+        if self.ownership is not None:
+            self.ownership.changed_ordinals.add(self.ordinal)
+
+    def get_state(self):
+        # type: () -> PlaceState
+        return PlaceState(self.coin_cost, self.coins_per_turn, self.exp_per_turn, self.owner_id)
+
+    def set_state(self, state):
+        # type: (PlaceState) -> None
+        self.coin_cost = state.coin_cost
+        self.coins_per_turn = state.coins_per_turn
+        self.exp_per_turn = state.exp_per_turn
+        if self.owner_id != state.owner_id:
+            self.set_owner(state.owner_id)
+
+
+class StartTile(Tile):
+    """
+    This class contains attributes of the start tile where the player and CPU gains bonus for landing at or passing it.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        Tile.__init__(self)
+        self.name = "START"
+        self.description: str = "A tile where the player and CPU gains bonus for passing it."
+
+
+class EmptySpace(Tile):
+    """
+    This class contains attributes of empty spaces on the board.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        Tile.__init__(self)
+        self.name = "EMPTY SPACE"
+        self.description = "An empty space."
+
+
+class ShinyZone(Tile):
+    """
+    This class contains attributes of shiny zones on the board where the player and CPU can gain random rewards.
+    """
+
+    def __init__(self, exponent_range=SHINY_EXPONENT_RANGE):
+        # type: (tuple) -> None
+        Tile.__init__(self)
+        self.name = "SHINY ZONE"
+        self.description = "A tile where the player and CPU can gain random rewards."
+        self.exponent_range: tuple = exponent_range  # smallest and largest N of the rewards 10 ** N of the shinies
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        self.__dict__.update(state)
+        if "exponent_range" not in state:
+            self.exponent_range = SHINY_EXPONENT_RANGE  # saved by the first version of the game
+
+    def generate_shiny(self, rng=None, numeric_backend=None):
+        # type: (CounterRandomStream, NumericBackend) -> Shiny
+        return Shiny(rng, numeric_backend, self.exponent_range)
+
+
+class UpgradeShop(Tile):
+    """
+    This class contains attributes of an upgrade shop for the player and CPU to buy upgrades.
+    """
+
+    def __init__(self, upgrades_sold):
+        # type: (list) -> None
+        Tile.__init__(self)
+        self.name = "UPGRADE SHOP"
+        self.description = "A shop selling upgrades."
+        self.__upgrades_sold: list = upgrades_sold
+
+    def __str__(self):
+        # type: () -> str
+        res: str = Tile.__str__(self)
+        res += "Below is a list of upgrades sold on this tile:\n"
+        for upgrade_sold in self.__upgrades_sold:
+            res += str(upgrade_sold) + "\n"
+
+        return res
+
+    def get_upgrades_sold(self):
+        # type: () -> list
+        return self.__upgrades_sold
+
+
+class Shiny:
+    """
+    This class contains attributes of shinies which the player and CPU can gain when landing on shiny zones.
+    """
+
+    def __init__(self, rng=None, numeric_backend=None, exponent_range=SHINY_EXPONENT_RANGE):
+        # type: (CounterRandomStream, NumericBackend, tuple) -> None
+        rng = random if rng is None else rng  # the module-level random functions are used by default
+        numeric_backend = MPF_BACKEND if numeric_backend is None else numeric_backend
+        self.coin_exponent: int = rng.randint(exponent_range[0], exponent_range[1])
+        self.exp_exponent: int = rng.randint(exponent_range[0], exponent_range[1])
+        self.coin_reward: mpf = numeric_backend.power_of_ten(self.coin_exponent)
+        self.exp_reward: mpf = numeric_backend.power_of_ten(self.exp_exponent)
+
+    def __str__(self):
+        # type: () -> str
+        res: str = ""  # initial value
+        res += "Coin reward: " + str(self.coin_reward) + "\n"
+        res += "EXP reward: " + str(self.exp_reward) + "\n"
+        return res
+
+    def clone(self):
+        # type: () -> Shiny
+        return copy.deepcopy(self)
+
+
+class Dice:
+    """
+    This class contains attributes of the dice to be rolled.
+    """
+
+    def __init__(self, rng=None):
+        # type: (CounterRandomStream) -> None
+        rng = random if rng is None else rng  # the module-level random functions are used by default
+        self.value: int = rng.randint(1, DICE_FACES)
+
+    def __str__(self):
+        # type: () -> str
+        return str(self.value)
+
+    def clone(self):
+        # type: () -> Dice
+        return copy.deepcopy(self)
+
+
+class PlaceState:
+    """
+    This class contains attributes of the state of a place which changes during a game.
+    """
+
+    __slots__ = ("coin_cost", "coins_per_turn", "exp_per_turn", "owner_id")
+
+    def __init__(self, coin_cost, coins_per_turn, exp_per_turn, owner_id):
+        # type: (mpf, mpf, mpf, str or None) -> None
+        self.coin_cost: mpf = coin_cost
+        self.coins_per_turn: mpf = coins_per_turn
+        self.exp_per_turn: mpf = exp_per_turn
+        self.owner_id: str or None = owner_id
+
+    def matches(self, place):
+        # type: (Place) -> bool
+        # Numbers are replaced rather than changed in place, so a place whose numbers are the same objects as in
+        # this state is unchanged.
+        return self.coin_cost is place.coin_cost and self.coins_per_turn is place.coins_per_turn and \
+            self.exp_per_turn is place.exp_per_turn and self.owner_id == place.owner_id
+
+
+class PlayerState:
+    """
+    This class contains attributes of the state of a player which changes during a game.
+    """
+
+    __slots__ = ("level", "exp", "required_exp", "coins", "accrued_turns", "position", "owned_places", "upgrades",
+                 "coins_per_turn_sum", "exp_per_turn_sum", "coin_gain_multiplier", "exp_gain_multiplier")
+
+    def __init__(self, level, exp, required_exp, coins, accrued_turns, position, owned_places, upgrades,
+                 coins_per_turn_sum, exp_per_turn_sum, coin_gain_multiplier, exp_gain_multiplier):
+        # type: (int, mpf, mpf, mpf, int, int, tuple, tuple or None, mpf, mpf, mpf, mpf) -> None
+        self.level: int = level
+        self.exp: mpf = exp
+        self.required_exp: mpf = required_exp
+        self.coins: mpf = coins
+        self.accrued_turns: int = accrued_turns
+        self.position: int = position
+        self.owned_places: tuple = owned_places
+        self.upgrades: tuple or None = upgrades  # nested pairs of the last upgrade and the ones before it
+        self.coins_per_turn_sum: mpf = coins_per_turn_sum
+        self.exp_per_turn_sum: mpf = exp_per_turn_sum
+        self.coin_gain_multiplier: mpf = coin_gain_multiplier
+        self.exp_gain_multiplier: mpf = exp_gain_multiplier
+
+    def matches(self, other):
+        # type: (PlayerState) -> bool
+        return self.position == other.position and self.level == other.level and \
+            self.accrued_turns == other.accrued_turns and self.coins is other.coins and self.exp is other.exp and \
+            self.required_exp is other.required_exp and self.owned_places is other.owned_places and \
+            self.upgrades is other.upgrades and self.coins_per_turn_sum is other.coins_per_turn_sum and \
+            self.exp_per_turn_sum is other.exp_per_turn_sum and \
+            self.coin_gain_multiplier is other.coin_gain_multiplier and \
+            self.exp_gain_multiplier is other.exp_gain_multiplier
+
+
+class GameSnapshot:
+    """
+    This class contains attributes of the state of a game at one moment, which can be restored by the game it was
+    taken from. Place states are shared with earlier snapshots wherever they are unchanged: a snapshot either holds
+    the states of all loaded places or only those which changed since its parent snapshot. Places of a generated
+    board which were not loaded yet when the snapshot was taken are in their initial state.
+    """
+
+    __slots__ = ("turn", "game_level", "start_coin_bonus", "participant_states", "parent", "place_states",
+                 "changed_places", "depth")
+
+    def __init__(self, turn, game_level, start_coin_bonus, participant_states, parent, place_states, changed_places):
+        # type: (int, int, mpf, tuple, GameSnapshot or None, dict or None, tuple) -> None
+        self.turn: int = turn
+        self.game_level: int = game_level
+        self.start_coin_bonus: mpf = start_coin_bonus
+        self.participant_states: tuple = participant_states  # states of the participants in the order of their seats
+        self.parent: GameSnapshot or None = parent
+        self.place_states: dict or None = place_states  # states of all loaded places keyed by ordinal if no parent
+        self.changed_places: tuple = changed_places  # pairs of ordinal and state of places changed since the parent
+        self.depth: int = 0 if parent is None else parent.depth + 1
+
+    def get_place_states(self):
+        # type: () -> dict
+        # Returns the states of all loaded places keyed by their ordinals, applying the changes since the last
+        # snapshot holding all of them.
+        chain: list = []  # initial value
+        snapshot: GameSnapshot = self
+        while snapshot.parent is not None:
+            chain.append(snapshot)
+            snapshot = snapshot.parent
+
+        place_states: dict = dict(snapshot.place_states)
+        for snapshot in reversed(chain):
+            place_states.update(snapshot.changed_places)
+
+        return place_states
+
+
+class TurnScheduler:
+    """
+    This class contains attributes of the seats of the participants of a game, who take their turns in the order of
+    their seats: of n participants, the one in seat s plays turns s + 1, s + 1 + n, s + 1 + 2 * n and so on. Finding
+    whose turn it is, the seat of a participant or the owner of a place takes the same time for any number of
+    participants.
+    """
+
+    def __init__(self, participants):
+        # type: (list) -> None
+        self.participants: list = []  # participants in the order of their seats
+        self.__seats: dict = {}  # seats keyed by player ID
+        for participant in participants:
+            self.add(participant)
+
+    def add(self, participant):
+        # type: (Player) -> int
+        # Seats 'participant' after the participants already seated and returns his/her seat.
+        if participant.player_id in self.__seats:
+            raise ValueError("Participant " + str(participant.name) + " is already seated.")
+
+        self.__seats[participant.player_id] = len(self.participants)
+        self.participants.append(participant)
+        return len(self.participants) - 1
+
+    def get_seat_for_turn(self, turn):
+        # type: (int) -> int
+        return (turn - 1) % len(self.participants)
+
+    def get_participant_for_turn(self, turn):
+        # type: (int) -> Player
+        return self.participants[(turn - 1) % len(self.participants)]
+
+    def get_seat(self, participant):
+        # type: (Player) -> int
+        return self.__seats[participant.player_id]
+
+    def get_participant_by_id(self, player_id):
+        # type: (str) -> Player or None
+        seat: int or None = self.__seats.get(player_id)
+        return None if seat is None else self.participants[seat]
+
+
+class Game:
+    """
+    This class contains attributes of saved game data in this game. The player and the CPU sit in the first two
+    seats, and more participants can be seated after them with add_participant() before the first turn. A game
+    follows the economy of its board.
+    """
+
+    def __init__(self, player, cpu, board, seed=None, game_index=0, economy=None):
+        # type: (Player, Player, Board, int or None, int, Economy or None) -> None
+        self.game_level: int = 1
+        self.rng: RandomService = RandomService(seed, game_index)  # all random draws of this game come from here
+        self.turn: int = 0  # initial value
+        self.scheduler: TurnScheduler = TurnScheduler([player, cpu])
+        self.board: Board = board
+        self.numeric_backend: NumericBackend = player.numeric_backend
+        if economy is not None and economy != board.economy:
+            raise ValueError("The economy of a game must be the economy its board was created with.")
+        self.economy: Economy = board.economy
+        self.start_coin_bonus: mpf = self.numeric_backend.power_of_ten(self.economy.start_coin_bonus_exponent)
+        # Pairs of a level and a seat, one per seat, where the level is at most the current level of the participant
+        # in that seat. Levels only go up during a game, so the lowest level is found by refreshing stale pairs.
+        self.__level_heap: list = []  # initial value
+        self.__last_snapshot: GameSnapshot or None = None  # snapshot last taken or restored
+        self.__place_states: dict = {}  # states of the loaded places as of the last snapshot keyed by their ordinals
+        self.__undo_stack: list = []  # snapshots taken by do()
+        self.metrics: TurnMetrics or None = None  # the turns are only measured while this is set
+        # Reports of the turns completed by complete_turn() are appended to this list while it is set. Turns rolled in
+        # bulk by fast_forward() change nothing but positions, coins and EXP and have no reports.
+        self.reports: list or None = None
+        self.__rebuild_level_heap()
+
+    def __str__(self):
+        # type: () -> str
+        res: str = ""  # initial value
+        res += "Game level: " + str(self.game_level) + "\n"
+        res += "Turn: " + str(self.turn) + "\n"
+        res += "Player in this game:\n" + str(self.player) + "\n"
+        res += "CPU controlled opponent in this game:\n" + str(self.cpu) + "\n"
+        for participant in self.participants[2:]:
+            res += "Other opponent in this game:\n" + str(participant) + "\n"
+        res += "Board representation:\n" + str(self.board) + "\n"
+        res += "Start coin bonus: " + str(self.start_coin_bonus) + "\n"
+        return res
+
+    def __getstate__(self):
+        # type: () -> dict
+        # Snapshots are only kept in memory, so copies of a game start without any snapshots to undo.
+        state: dict = self.__dict__.copy()
+        state["_Game__last_snapshot"] = None
+        state["_Game__place_states"] = {}
+        state["_Game__undo_stack"] = []
+        state["metrics"] = None
+        state["reports"] = None
+        return state
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        self.__dict__.update(state)
+        if "scheduler" not in state:
+            # Saved by the first version of the game, which pickled the whole game
+            self.scheduler = TurnScheduler([self.__dict__.pop("player"), self.__dict__.pop("cpu")])
+            self.rng = RandomService()
+            self.numeric_backend = MPF_BACKEND
+            self.economy = self.board.economy
+            for participant in self.participants:
+                for place in participant.get_owned_list():
+                    place.set_owner(participant.player_id)
+            self.__last_snapshot = None
+            self.__place_states = {}
+            self.__undo_stack = []
+            self.metrics = None
+            self.reports = None
+            self.__rebuild_level_heap()
+
+    @property
+    def participants(self):
+        # type: () -> list
+        return self.scheduler.participants
+
+    @property
+    def player(self):
+        # type: () -> Player
+        return self.scheduler.participants[0]
+
+    @property
+    def cpu(self):
+        # type: () -> Player
+        return self.scheduler.participants[1]
+
+    def add_participant(self, participant):
+        # type: (Player) -> int
+        # Seats 'participant' after the participants already seated and returns his/her seat.
+        if self.turn > 0:
+            raise ValueError("Participants can only be added to a game before its first turn.")
+
+        seat: int = self.scheduler.add(participant)
+        self.rng.set_seat_count(len(self.participants))
+        heapq.heappush(self.__level_heap, (participant.get_paid_level(), seat))
+        return seat
+
+    def __rebuild_level_heap(self, levels=None):
+        # type: (list or None) -> None
+        # Levels read without paying accrued income, so that rebuilding the heap changes nothing else in this game.
+        if levels is None:
+            levels = [participant.get_paid_level() for participant in self.participants]
+        self.__level_heap = [(level, seat) for seat, level in enumerate(levels)]
+        heapq.heapify(self.__level_heap)
+
+    def get_min_level(self):
+        # type: () -> int
+        # Returns the lowest level of all participants, refreshing only the pairs of those who levelled up.
+        while True:
+            level, seat = self.__level_heap[0]
+            current_level: int = self.participants[seat].level
+            if current_level == level:
+                return level
+            heapq.heapreplace(self.__level_heap, (current_level, seat))
+
+    def update_game_level(self):
+        # type: () -> None
+        self.game_level = 1 + self.get_min_level() // 10
+        self.start_coin_bonus = self.numeric_backend.power_of_ten(self.economy.start_coin_bonus_exponent *
+                                                                  self.game_level)
+
+    def get_participant_for_turn(self, turn):
+        # type: (int) -> Player
+        # With one player and one CPU, the player plays odd turns and the CPU plays even turns.
+        return self.scheduler.get_participant_for_turn(turn)
+
+    def get_seat(self, participant):
+        # type: (Player) -> int
+        return self.scheduler.get_seat(participant)
+
+    def get_owner(self, place):
+        # type: (Place) -> Player or None
+        return self.scheduler.get_participant_by_id(place.owner_id)
+
+    def get_opponent(self, participant):
+        # type: (Player) -> Player
+        # Returns the participant seated after 'participant', who is his/her only opponent in a game of two.
+        participants: list = self.participants
+        return participants[(self.get_seat(participant) + 1) % len(participants)]
+
+    def get_opponents(self, participant):
+        # type: (Player) -> list
+        return [opponent for opponent in self.participants if opponent is not participant]
+
+    def begin_turn(self):
+        # type: () -> TurnReport
+        """
+        This method starts the next turn by rolling the dice for the participant whose turn it is and applying
+        the effects of the tile landed on which do not need a decision.
+        :return: a report of the turn whose 'decision' is the decision the participant still has to make
+        """
+
+        metrics: TurnMetrics or None = self.metrics
+        start_time: float = time.perf_counter() if metrics is not None else 0.0
+        self.turn += 1
+        seat: int = self.scheduler.get_seat_for_turn(self.turn)
+        participant: Player = self.participants[seat]
+        self.rng.begin_turn(self.turn, seat)
+        dice: Dice = Dice(self.rng.draws(DICE_DRAWS))
+        passed_start: bool = participant.roll_dice(dice, self)
+        if metrics is not None:
+            start_time = metrics.record(DICE_ROLL_PHASE, start_time)
+
+        tile: Tile = self.board.get_tiles()[participant.position]
+        tile_code: int = self.board.get_compiled_board().tile_codes[participant.position]
+        report: TurnReport = TurnReport(self.turn, participant, dice.value, passed_start, tile)
+
+        # Checking what type of tile the participant lands on
+        if tile_code == SHINY_ZONE_CODE:
+            # Randomly generate a shiny
+            shiny: Shiny = tile.generate_shiny(self.rng.draws(SHINY_DRAWS), participant.numeric_backend)
+            participant.coins += shiny.coin_reward
+            participant.exp += shiny.exp_reward
+            participant.level_up()
+            report.shiny = shiny
+        elif tile_code == UPGRADE_SHOP_CODE:
+            report.decision = BUY_UPGRADE
+        elif tile_code == PLACE_CODE:
+            # 1. If the place does not have an owner
+            if tile.owner_id is None:
+                report.decision = PURCHASE_PLACE
+            # 2. If the place is owned by the participant
+            elif tile.owner_id == participant.player_id:
+                report.decision = UPGRADE_PLACE
+            # 3. If the place is owned by an opponent
+            else:
+                report.decision = ACQUIRE_PLACE
+                report.owner = self.get_owner(tile)
+
+        if metrics is not None:
+            metrics.record(TILE_DISPATCH_PHASE if report.shiny is None else SHINY_GENERATION_PHASE, start_time)
+            if report.shiny is not None:
+                metrics.increment("shinies")
+        return report
+
+    def complete_turn(self, report, policy):
+        # type: (TurnReport, DecisionPolicy) -> TurnReport
+        """
+        This method finishes a turn started by 'begin_turn()' by asking 'policy' for the pending decision,
+        carrying it out and paying the participant's income for the turn.
+        :return: the completed report
+        """
+
+        metrics: TurnMetrics or None = self.metrics
+        start_time: float = time.perf_counter() if metrics is not None else 0.0
+        participant: Player = report.participant
+        if report.decision == BUY_UPGRADE:
+            upgrade_index: int or None = policy.choose_upgrade(self, participant, report.tile)
+            if upgrade_index is not None:
+                report.accepted = True
+                report.target = report.tile.get_upgrades_sold()[upgrade_index]
+                report.succeeded = participant.buy_upgrade(report.target)
+        elif report.decision == PURCHASE_PLACE:
+            report.target = report.tile
+            if policy.should_purchase_place(self, participant, report.tile):
+                report.accepted = True
+                report.succeeded = participant.purchase_place(report.tile)
+        elif report.decision == UPGRADE_PLACE:
+            report.target = report.tile
+            if policy.should_upgrade_place(self, participant, report.tile):
+                report.accepted = True
+                report.succeeded = participant.upgrade_place(report.tile)
+        elif report.decision == ACQUIRE_PLACE:
+            report.target = report.tile
+            if policy.should_acquire_place(self, participant, report.tile, report.owner):
+                report.accepted = True
+                report.succeeded = participant.acquire_place(report.tile, report.owner)
+
+        if metrics is not None and report.decision is not None:
+            start_time = metrics.record(SHOP_TRANSACTION_PHASE if report.decision == BUY_UPGRADE
+                                        else PLACE_TRANSACTION_PHASE, start_time)
+            if report.succeeded:
+                metrics.increment("upgrades_bought" if report.decision == BUY_UPGRADE else "place_transactions")
+
+        if VERIFY_INCOME_AGGREGATES:
+            participant.verify_income_aggregates()
+
+        participant.accrue_income(1)
+        if metrics is not None:
+            metrics.record(INCOME_ACCRUAL_PHASE, start_time)
+            metrics.end_turn(self)
+        if self.reports is not None:
+            self.reports.append(report)
+        return report
+
+    def step(self, policy):
+        # type: (DecisionPolicy) -> TurnReport
+        """
+        This method plays one whole turn without any input or output.
+        :return: a report of the turn
+        """
+
+        return self.complete_turn(self.begin_turn(), policy)
+
+    def snapshot(self):
+        # type: () -> GameSnapshot
+        """
+        This method captures the state of this game which changes during the game. Only the places marked as
+        changed in the ownership index of the board since the last snapshot taken or restored are stored again,
+        except every SNAPSHOT_CHAIN_LENGTH snapshots when the states of all loaded places are stored so that
+        restoring stays cheap. All loaded places are only checked by the first snapshot, since places may have been
+        changed without being marked before it, e.g. when the game was loaded.
+        :return: the snapshot
+        """
+
+        changed_ordinals: set = self.board.get_changed_ordinals()
+        parent: GameSnapshot or None = self.__last_snapshot
+        place_states: dict or None = None  # initial value
+        changed_places: list = []  # initial value
+        if parent is None:
+            for place in self.board.get_loaded_places():
+                place_state: PlaceState or None = self.__place_states.get(place.ordinal)
+                if place_state is None or not place_state.matches(place):
+                    self.__place_states[place.ordinal] = place.get_state()
+        else:
+            for ordinal in sorted(changed_ordinals):
+                place: Place = self.board.get_place(ordinal)
+                place_state: PlaceState or None = self.__place_states.get(ordinal)
+                if place_state is None or not place_state.matches(place):
+                    self.__place_states[ordinal] = place.get_state()
+                    changed_places.append((ordinal, self.__place_states[ordinal]))
+
+        if parent is None or parent.depth + 1 >= SNAPSHOT_CHAIN_LENGTH:
+            parent = None
+            place_states = dict(self.__place_states)
+            changed_places = []
+        changed_ordinals.clear()
+
+        previous: GameSnapshot or None = self.__last_snapshot
+        if previous is None or len(previous.participant_states) != len(self.participants):
+            participant_states: tuple = tuple(participant.get_state() for participant in self.participants)
+        else:
+            participant_states: tuple = tuple(participant.get_state(previous_state) for participant, previous_state
+                                              in zip(self.participants, previous.participant_states))
+        snapshot: GameSnapshot = GameSnapshot(self.turn, self.game_level, self.start_coin_bonus, participant_states,
+                                              parent, place_states, tuple(changed_places))
+        self.__last_snapshot = snapshot
+        return snapshot
+
+    def restore(self, snapshot):
+        # type: (GameSnapshot) -> None
+        # Puts this game back into the state captured by 'snapshot', which must have been taken from this game.
+        place_states: dict = snapshot.get_place_states()
+        for place in self.board.get_loaded_places():
+            place_state: PlaceState or None = place_states.get(place.ordinal)
+            if place_state is None:
+                # Loaded after the snapshot was taken, when the place was still in its initial state
+                place_state = self.board.get_initial_place_state(place.ordinal)
+            if not place_state.matches(place):
+                place.set_state(place_state)
+
+        self.turn = snapshot.turn
+        self.game_level = snapshot.game_level
+        self.start_coin_bonus = snapshot.start_coin_bonus
+        for participant, participant_state in zip(self.participants, snapshot.participant_states):
+            participant.set_state(participant_state)
+        self.board.get_changed_ordinals().clear()
+        self.__rebuild_level_heap([participant_state.level for participant_state in snapshot.participant_states])
+        self.__place_states = place_states
+        self.__last_snapshot = snapshot
+
+    def do(self, policy):
+        # type: (DecisionPolicy) -> TurnReport
+        # Plays one whole turn like step() does, which can be taken back with undo().
+        self.__undo_stack.append(self.snapshot())
+        return self.step(policy)
+
+    def undo(self):
+        # type: () -> None
+        # Takes back the last turn played with do().
+        self.restore(self.__undo_stack.pop())
+
+    def fast_forward(self, n_turns, policy, cpu_policy=None):
+        # type: (int, DecisionPolicy, DecisionPolicy or None) -> Player or None
+        """
+        This method plays the next 'n_turns' turns like step() does, with 'policy' making the decisions of the
+        player and 'cpu_policy' (same as 'policy' by default) making those of all other participants. Landing on an
+        empty space or START changes nothing but the position, coins and EXP of the participant, so runs of such
+        turns are rolled in bulk and applied in one go, and only the other turns are played in full. It stops early
+        after a turn which leaves the participant playing it owning all places.
+        :return: the participant owning all places, or None
+        """
+
+        cpu_policy = policy if cpu_policy is None else cpu_policy
+        compiled_board: CompiledBoard = self.board.get_compiled_board()
+        n_seats: int = len(self.participants)
+        policies: list = [policy] + [cpu_policy] * (n_seats - 1)
+        positions: list = [participant.position for participant in self.participants]
+        quiet_turns: list = [0] * n_seats
+        start_passes: list = [0] * n_seats
+        quiet_seats: list = []  # seats with quiet turns not applied yet
+        last_turn: int = self.turn + n_turns
+        while self.turn < last_turn:
+            turns: range = range(self.turn + 1, min(self.turn + FAST_FORWARD_BLOCK_SIZE * n_seats, last_turn) + 1)
+            first_seat: int = self.scheduler.get_seat_for_turn(turns[0])
+            dice_values: list = [iter(self.rng.pregenerate_dice(seat, turns[(seat - first_seat) % n_seats::n_seats]))
+                                 for seat in range(n_seats)]
+            for turn in turns:
+                seat: int = (turn - 1) % n_seats
+                destination, passed_start = compiled_board.move(positions[seat], next(dice_values[seat]))
+                if compiled_board.tile_codes[destination] in QUIET_TILE_CODES:
+                    positions[seat] = destination
+                    if quiet_turns[seat] == 0:
+                        quiet_seats.append(seat)
+                    quiet_turns[seat] += 1
+                    start_passes[seat] += passed_start
+                    continue
+
+                # Playing the turn in full, which rolls the same dice value again
+                self.__apply_quiet_turns(positions, quiet_turns, start_passes, quiet_seats)
+                self.turn = turn - 1
+                report: TurnReport = self.step(policies[seat])
+                positions[seat] = report.participant.position
+                if report.participant.owns_all_places(self):
+                    return report.participant
+
+            self.__apply_quiet_turns(positions, quiet_turns, start_passes, quiet_seats)
+            self.turn = turns[-1]
+
+        return None
+
+    def __apply_quiet_turns(self, positions, quiet_turns, start_passes, quiet_seats):
+        # type: (list, list, list, list) -> None
+        # Only the seats in 'quiet_seats' are visited, so that this takes the same time for any number of seats.
+        metrics: TurnMetrics or None = self.metrics
+        start_time: float = time.perf_counter() if metrics is not None else 0.0
+        for seat in quiet_seats:
+            participant: Player = self.participants[seat]
+            participant.position = positions[seat]
+            if start_passes[seat] > 0:
+                participant.coins += self.start_coin_bonus * start_passes[seat]
+            participant.accrue_income(quiet_turns[seat])
+            if metrics is not None:
+                metrics.increment("turns", quiet_turns[seat])
+                metrics.increment("fast_forwarded_turns", quiet_turns[seat])
+            quiet_turns[seat] = 0
+            start_passes[seat] = 0
+
+        quiet_seats.clear()
+        if metrics is not None:
+            metrics.record(INCOME_ACCRUAL_PHASE, start_time)
+
+    def clone(self):
+        # type: () -> Game
+        return copy.deepcopy(self)
+
+
+# Creating classes used by the headless turn engine.
+
+
+# Kinds of decisions a participant can be asked to make after landing on a tile
+BUY_UPGRADE: str = "BUY UPGRADE"
+PURCHASE_PLACE: str = "PURCHASE PLACE"
+UPGRADE_PLACE: str = "UPGRADE PLACE"
+ACQUIRE_PLACE: str = "ACQUIRE PLACE"
+
+
+class TurnReport:
+    """
+    This class contains attributes of what happened during a turn in this game.
+    """
+
+    def __init__(self, turn, participant, dice_value, passed_start, tile):
+        # type: (int, Player, int, bool, Tile) -> None
+        self.turn: int = turn
+        self.participant: Player = participant
+        self.dice_value: int = dice_value
+        self.passed_start: bool = passed_start
+        self.tile: Tile = tile
+        self.shiny: Shiny or None = None  # initial value
+        self.decision: str or None = None  # initial value
+        self.owner: Player or None = None  # initial value
+        self.target: Upgrade or Place or None = None  # initial value
+        self.accepted: bool = False  # initial value
+        self.succeeded: bool = False  # initial value
+
+    def __str__(self):
+        # type: () -> str
+        res: str = ""  # initial value
+        res += "Turn: " + str(self.turn) + "\n"
+        res += "Participant: " + str(self.participant.name) + "\n"
+        res += "Dice value: " + str(self.dice_value) + "\n"
+        res += "Passed START: " + str(self.passed_start) + "\n"
+        res += "Tile:\n" + str(self.tile) + "\n"
+        if self.shiny is not None:
+            res += "Shiny:\n" + str(self.shiny) + "\n"
+
+        if self.decision is not None:
+            res += "Decision: " + str(self.decision) + "\n"
+            res += "Accepted: " + str(self.accepted) + "\n"
+            res += "Succeeded: " + str(self.succeeded) + "\n"
+
+        return res
+
+
+class DecisionPolicy:
+    """
+    This class contains the decisions a participant makes during a turn. This base policy declines everything.
+    """
+
+    def choose_upgrade(self, game, participant, upgrade_shop):
+        # type: (Game, Player, UpgradeShop) -> int or None
+        return None
+
+    def should_purchase_place(self, game, participant, place):
+        # type: (Game, Player, Place) -> bool
+        return False
+
+    def should_upgrade_place(self, game, participant, place):
+        # type: (Game, Player, Place) -> bool
+        return False
+
+    def should_acquire_place(self, game, participant, place, owner):
+        # type: (Game, Player, Place, Player) -> bool
+        return False
+
+
+class RandomCPUPolicy(DecisionPolicy):
+    """
+    This class contains the decisions of the CPU, which accepts every offer with a fixed probability.
+    """
+
+    def __init__(self, probability=CPU_DECISION_PROBABILITY):
+        # type: (float) -> None
+        self.probability: float = probability
+
+    def choose_upgrade(self, game, participant, upgrade_shop):
+        # type: (Game, Player, UpgradeShop) -> int or None
+        draws: CounterRandomStream = game.rng.draws(DECISION_DRAWS)
+        if draws.random() <= self.probability:
+            return draws.randint(0, len(upgrade_shop.get_upgrades_sold()) - 1)
+        return None
+
+    def should_purchase_place(self, game, participant, place):
+        # type: (Game, Player, Place) -> bool
+        return game.rng.draws(DECISION_DRAWS).random() <= self.probability
+
+    def should_upgrade_place(self, game, participant, place):
+        # type: (Game, Player, Place) -> bool
+        return game.rng.draws(DECISION_DRAWS).random() <= self.probability
+
+    def should_acquire_place(self, game, participant, place, owner):
+        # type: (Game, Player, Place, Player) -> bool
+        return game.rng.draws(DECISION_DRAWS).random() <= self.probability
+
+
+class PresetDecisionPolicy(DecisionPolicy):
+    """
+    This class contains a decision made before it is asked for, e.g. by a search or over a network.
+    """
+
+    def __init__(self, accepted=False, upgrade_index=None):
+        # type: (bool, int or None) -> None
+        self.accepted: bool = accepted
+        self.upgrade_index: int or None = upgrade_index
+
+    def choose_upgrade(self, game, participant, upgrade_shop):
+        # type: (Game, Player, UpgradeShop) -> int or None
+        return self.upgrade_index if self.accepted else None
+
+    def should_purchase_place(self, game, participant, place):
+        # type: (Game, Player, Place) -> bool
+        return self.accepted
+
+    def should_upgrade_place(self, game, participant, place):
+        # type: (Game, Player, Place) -> bool
+        return self.accepted
+
+    def should_acquire_place(self, game, participant, place, owner):
+        # type: (Game, Player, Place, Player) -> bool
+        return self.accepted
+
+
+class InteractivePolicy(DecisionPolicy):
+    """
+    This class contains the decisions of the player, which are read from the command line interface.
+    """
+
+    def choose_upgrade(self, game, participant, upgrade_shop):
+        # type: (Game, Player, UpgradeShop) -> int or None
+        # Ask the player whether he/she wants to buy an upgrade or not
+        print("Enter 'Y' for yes.")
+        print("Enter anything else for no.")
+        buy_upgrade: str = input("Do you want to buy an upgrade? ")
+        if buy_upgrade != "Y":
+            return None
+
+        print("Below is a list of upgrades sold:\n")
+        for upgrade in upgrade_shop.get_upgrades_sold():
+            print(str(upgrade) + "\n")
+
+        upgrade_index: int = int(input("Please enter index of upgrade you want to buy: "))
+        while upgrade_index < 0 or upgrade_index >= len(upgrade_shop.get_upgrades_sold()):
+            upgrade_index = int(input("Sorry, invalid input! "
+                                      "Please enter index of upgrade you want to buy: "))
+
+        return upgrade_index
+
+    def should_purchase_place(self, game, participant, place):
+        # type: (Game, Player, Place) -> bool
+        print("Enter 'Y' for yes.")
+        print("Enter anything else for no.")
+        return input("Do you want to buy this place? ") == "Y"
+
+    def should_upgrade_place(self, game, participant, place):
+        # type: (Game, Player, Place) -> bool
+        print("Enter 'Y' for yes.")
+        print("Enter anything else for no.")
+        return input("Do you want to upgrade this place? ") == "Y"
+
+    def should_acquire_place(self, game, participant, place, owner):
+        # type: (Game, Player, Place, Player) -> bool
+        print("Enter 'Y' for yes.")
+        print("Enter anything else for no.")
+        return input("Do you want to acquire this place? ") == "Y"
+
+
+# Creating the board of the game.
+
+
+# The board and the upgrades are defined by the compact tables below and only turned into objects by
+# 'create_board()' when a game needs them. A number N in the tables stands for 10 ** N.
+
+
+# Name, coin cost, coin gain multiplier and EXP gain multiplier of every upgrade sold on the upgrade shops
+UPGRADE_CATALOG: tuple = (
+    ("COIN UPGRADE #1", 10, 10, 1),
+    ("COIN UPGRADE #2", 40, 20, 1),
+    ("COIN UPGRADE #3", 160, 30, 1),
+    ("COIN UPGRADE #4", 640, 40, 1),
+    ("COIN UPGRADE #5", 2560, 50, 1),
+    ("COIN UPGRADE #6", 10240, 60, 1),
+    ("COIN UPGRADE #7", 40960, 70, 1),
+    ("COIN UPGRADE #8", 163840, 80, 1),
+    ("EXP UPGRADE #1", 10, 1, 10),
+    ("EXP UPGRADE #2", 40, 1, 20),
+    ("EXP UPGRADE #3", 160, 1, 30),
+    ("EXP UPGRADE #4", 640, 1, 40),
+    ("EXP UPGRADE #5", 2560, 1, 50),
+    ("EXP UPGRADE #6", 10240, 1, 60),
+    ("EXP UPGRADE #7", 40960, 1, 70),
+    ("EXP UPGRADE #8", 163840, 1, 80)
+)
+# Name, description, coin cost, coins per turn and EXP per turn of every place in the order of the board
+PLACE_CATALOG: tuple = (
+    ("Naivagadi Wild", "A jungle.", 5, 4, 3),
+    ("Cardley Strand", "A beach.", 10, 8, 6),
+    ("Sanctuary Of Serenity", "A temple.", 16, 13, 10),
+    ("Berthierpon Park", "A park.", 23, 19, 15),
+    ("Danpawa Shallows", "A lake.", 31, 26, 21),
+    ("Venroy Tops", "A mountain.", 40, 34, 28),
+    ("The Sunken Tunnels", "A dungeon.", 50, 43, 36),
+    ("The Dragon Shore", "A beach.", 61, 53, 45),
+    ("Monastery Of Muvdall", "A temple.", 73, 64, 55),
+    ("Venneau Hideout", "A cave.", 86, 76, 66),
+    ("Salbridge River", "A river.", 100, 89, 78),
+    ("Stancier Meadows", "A park.", 115, 103, 91),
+    ("The Ellisgonie Tundra", "A snowland.", 131, 118, 105),
+    ("The Grounds Of Hermibriand", "A park.", 148, 134, 120),
+    ("Riverfront Plaza", "A park.", 166, 151, 136),
+    ("The Tranquil Tombs", "A dungeon.", 185, 169, 153),
+    ("The Grave Deep", "A sea.", 205, 188, 171),
+    ("Yorkdiac Point", "A beach.", 226, 208, 190),
+    ("The Dark Desert", "A desert.", 248, 229, 210),
+    ("Celestial Library", "A library.", 271, 251, 231),
+    ("Aptitude Bibliotheca", "A library.", 295, 274, 253),
+    ("The Windless Wilderness", "A jungle.", 320, 298, 276),
+    ("The Wild of Megeisa", "A jungle.", 346, 323, 300),
+    ("The Windy Burrows", "A dungeon.", 373, 349, 325),
+    ("Royal Isle Plaza", "A park.", 401, 376, 351),
+    ("Pleasant View Grounds", "A park.", 430, 404, 378),
+    ("The Shimmering Coast", "A beach.", 460, 433, 406),
+    ("Durnola Shore", "A beach.", 491, 463, 435),
+    ("Merimer Strand", "A beach.", 523, 494, 465),
+    ("Richronto Key", "An island.", 556, 526, 496),
+    ("Meribrook Ait", "An island.", 590, 559, 528),
+    ("Grettrie Rise", "A mountain.", 625, 593, 561),
+    ("Scarscour Volcano", "A volcano.", 661, 628, 595),
+    ("Plasack Hill", "A hill.", 698, 664, 630),
+    ("Kerrokasing Deep", "A sea.", 736, 701, 666),
+    ("Troutriver Mansion", "A mansion.", 775, 739, 703),
+    ("Fullernelly Residence", "A mansion.", 815, 778, 741)
+)
+# One letter per tile: S for START, E for an empty space, Z for a shiny zone, U for an upgrade shop and P for the
+# next place of PLACE_CATALOG
+BOARD_LAYOUT: str = (
+    "SPEEEUEEZEEZEEPPEPEEZEEZEUEPPEEEPEZEEPEEZUEEPEEPPEPEEZEPZEEEUEZPEEPEZEPEUEPEE"
+    "ZEEPEEPEEZEEPUEEEPEZEPEEEEEPZEEUPEUEPEEZEEPPEEUEPEZEPEEEZPEEEEEPPZPEEPUPEEEPP"
+)
+
+
+class Economy:
+    """
+    This class contains attributes of the economy of the game: the upgrades sold in the format of UPGRADE_CATALOG,
+    the exponents of the coin cost, coins per turn and EXP per turn of every place of PLACE_CATALOG, the range of the
+    exponents of the rewards of shinies, the exponent of the start coin bonus per game level and the probability with
+    which the CPU accepts offers. An economy never changes once created, so that games and boards can share it.
+    """
+
+    def __init__(self, upgrades=UPGRADE_CATALOG, place_exponents=None, shiny_exponent_range=SHINY_EXPONENT_RANGE,
+                 start_coin_bonus_exponent=START_COIN_BONUS_EXPONENT, cpu_probability=CPU_DECISION_PROBABILITY):
+        # type: (tuple, tuple or None, tuple, int, float) -> None
+        self.upgrades: tuple = tuple((str(name), int(coin_cost), int(coin_gain_multiplier), int(exp_gain_multiplier))
+                                     for name, coin_cost, coin_gain_multiplier, exp_gain_multiplier in upgrades)
+        if place_exponents is None:
+            place_exponents = [exponents for name, description, *exponents in PLACE_CATALOG]
+        self.place_exponents: tuple = tuple((int(coin_cost), int(coins_per_turn), int(exp_per_turn))
+                                            for coin_cost, coins_per_turn, exp_per_turn in place_exponents)
+        self.shiny_exponent_range: tuple = (int(shiny_exponent_range[0]), int(shiny_exponent_range[1]))
+        self.start_coin_bonus_exponent: int = int(start_coin_bonus_exponent)
+        self.cpu_probability: float = float(cpu_probability)
+        if len(self.place_exponents) != len(PLACE_CATALOG):
+            raise ValueError("An economy needs the exponents of " + str(len(PLACE_CATALOG)) + " places.")
+        if not 1 <= self.shiny_exponent_range[0] <= self.shiny_exponent_range[1] <= MAX_SHINY_EXPONENT:
+            raise ValueError("Invalid range of the exponents of the rewards of shinies: " +
+                             str(self.shiny_exponent_range))
+        if not 0 <= self.cpu_probability <= 1:
+            raise ValueError("Invalid probability of the CPU accepting offers: " + str(self.cpu_probability))
+
+    def __str__(self):
+        # type: () -> str
+        res: str = ""  # initial value
+        res += "Upgrades: " + str(self.upgrades) + "\n"
+        res += "Place exponents: " + str(self.place_exponents) + "\n"
+        res += "Shiny exponent range: " + str(self.shiny_exponent_range) + "\n"
+        res += "Start coin bonus exponent: " + str(self.start_coin_bonus_exponent) + "\n"
+        res += "CPU probability: " + str(self.cpu_probability) + "\n"
+        return res
+
+    def __eq__(self, other):
+        # type: (object) -> bool
+        return isinstance(other, Economy) and self.get_parameters() == other.get_parameters()
+
+    def __hash__(self):
+        # type: () -> int
+        return hash((self.upgrades, self.place_exponents, self.shiny_exponent_range, self.start_coin_bonus_exponent,
+                     self.cpu_probability))
+
+    def __deepcopy__(self, memo):
+        # type: (dict) -> Economy
+        # Economies never change, so copies of a game share them.
+        return self
+
+    def get_parameters(self):
+        # type: () -> dict
+        # Returns the arguments creating this economy in types which JSON can encode.
+        return {"upgrades": [list(upgrade) for upgrade in self.upgrades],
+                "place_exponents": [list(exponents) for exponents in self.place_exponents],
+                "shiny_exponent_range": list(self.shiny_exponent_range),
+                "start_coin_bonus_exponent": self.start_coin_bonus_exponent,
+                "cpu_probability": self.cpu_probability}
+
+    def replace(self, **changes):
+        # type: (...) -> Economy
+        # Returns an economy with the arguments in 'changes' instead of the ones of this economy.
+        parameters: dict = self.get_parameters()
+        for name in changes:
+            if name not in parameters:
+                raise ValueError("Unknown parameter of an economy: " + str(name))
+
+        parameters.update(changes)
+        return Economy(**parameters)
+
+
+DEFAULT_ECONOMY: Economy = Economy()
+
+
+def create_upgrades_sold(numeric_backend=None, economy=None):
+    # type: (NumericBackend, Economy or None) -> list
+    """
+    This function creates the list of upgrades sold on every upgrade shop on the board.
+    :return: a list of upgrades
+    """
+
+    number = (MPF_BACKEND if numeric_backend is None else numeric_backend).number
+    upgrades: tuple = UPGRADE_CATALOG if economy is None else economy.upgrades
+    return [Upgrade(name, number("1e" + str(coin_cost)), coin_gain_multiplier, exp_gain_multiplier)
+            for name, coin_cost, coin_gain_multiplier, exp_gain_multiplier in upgrades]
+
+
+def create_board(numeric_backend=None, economy=None):
+    # type: (NumericBackend, Economy or None) -> Board
+    """
+    This function creates the board of the game from BOARD_LAYOUT and PLACE_CATALOG, with the upgrades, the
+    exponents of the places and the rewards of shinies of 'economy' if it is given.
+    :return: a new board with no owned places
+    """
+
+    economy = DEFAULT_ECONOMY if economy is None else economy
+    number = (MPF_BACKEND if numeric_backend is None else numeric_backend).number
+    upgrades_sold: list = create_upgrades_sold(numeric_backend, economy)
+    places = iter(zip(PLACE_CATALOG, economy.place_exponents))
+    tiles: list = []  # initial value
+    for letter in BOARD_LAYOUT:
+        if letter == "P":
+            (name, description, *_), (coin_cost, coins_per_turn, exp_per_turn) = next(places)
+            tiles.append(Place(name, description, number("1e" + str(coin_cost)), number("1e" + str(coins_per_turn)),
+                               number("1e" + str(exp_per_turn))))
+        elif letter == "U":
+            tiles.append(UpgradeShop(upgrades_sold))
+        elif letter == "Z":
+            tiles.append(ShinyZone(economy.shiny_exponent_range))
+        elif letter == "S":
+            tiles.append(StartTile())
+        else:
+            tiles.append(EmptySpace())
+
+    return Board(tiles, economy)
+
+
+# Creating the generated boards of the game.
+
+
+# A generated board follows the pattern of BOARD_LAYOUT: START comes first, every SHINY_ZONE_PERIOD-th tile is a
+# shiny zone and every UPGRADE_SHOP_PERIOD-th tile is an upgrade shop, and the other tiles are places with
+# probability PLACE_PROBABILITY and empty spaces otherwise. Like in PLACE_CATALOG, the exponent of the coin cost,
+# coins per turn and EXP per turn of the place with ordinal i is first + step * i + i * (i + 1) // 2 with the
+# first exponents and steps below.
+SHINY_ZONE_PERIOD: int = 9
+SHINY_ZONE_OFFSET: int = 8  # position of the first shiny zone
+UPGRADE_SHOP_PERIOD: int = 15
+UPGRADE_SHOP_OFFSET: int = 5  # position of the first upgrade shop, which replaces a shiny zone on the same position
+PLACE_PROBABILITY: float = 0.3
+PLACE_FIRST_EXPONENTS: tuple = (5, 4, 3)  # coin cost, coins per turn and EXP per turn of the first place
+PLACE_EXPONENT_STEPS: tuple = (4, 3, 2)
+# A board file starts with the header below, followed by the code of every tile padded to a multiple of 8 bytes, the
+# position of every place and the coin cost, coins per turn and EXP per turn exponents of every place, which are
+# little-endian 64-bit integers.
+BOARD_FILE_MAGIC: bytes = b"TOTB"
+BOARD_FILE_VERSION: int = 1
+BOARD_FILE_HEADER_STRUCT: struct.Struct = struct.Struct("<4sHxxQQQ")  # magic, version, tiles, places and seed
+# The arrays of a board file are little-endian like its header, so they are only mapped in place on little-endian CPUs.
+NATIVE_LITTLE_ENDIAN: bool = sys.byteorder == "little"
+TILE_ARRAYS: dict = {}  # tile arrays keyed by their number of tiles and seed, shared by all boards using them
+
+
+def get_place_exponents(ordinals, index):
+    # type: (object, int) -> object
+    # Returns the exponents of the numbers of kind 'index' of the places with 'ordinals', which are an int or an array.
+    return PLACE_FIRST_EXPONENTS[index] + PLACE_EXPONENT_STEPS[index] * ordinals + ordinals * (ordinals + 1) // 2
+
+
+def generate_tile_arrays(n_tiles, seed):
+    # type: (int, int) -> TileArrays
+    """
+    This function generates the tiles of a board with 'n_tiles' tiles whose places are chosen by 'seed', with NumPy
+    if it is installed. The same arguments always give the same tiles.
+    :return: the tiles of the board in typed arrays
+    """
+
+    if n_tiles < 1:
+        raise ValueError("A board needs at least one tile.")
+
+    key: int = mix64(seed & MASK_64)
+    place_threshold: int = int(PLACE_PROBABILITY * (1 << 64))
+    numpy = get_numpy()
+    if numpy is None:
+        tile_codes: array.array = array.array("B", bytes(n_tiles))
+        place_positions: array.array = array.array("q")
+        for position in range(n_tiles):
+            if position == 0:
+                tile_codes[position] = START_TILE_CODE
+            elif position % UPGRADE_SHOP_PERIOD == UPGRADE_SHOP_OFFSET:
+                tile_codes[position] = UPGRADE_SHOP_CODE
+            elif position % SHINY_ZONE_PERIOD == SHINY_ZONE_OFFSET:
+                tile_codes[position] = SHINY_ZONE_CODE
+            elif mix64((key + position * GOLDEN_GAMMA) & MASK_64) < place_threshold:
+                tile_codes[position] = PLACE_CODE
+                place_positions.append(position)
+
+        exponents: list = [array.array("q", (get_place_exponents(ordinal, index)
+                                             for ordinal in range(len(place_positions)))) for index in range(3)]
+        return TileArrays(n_tiles, seed, memoryview(tile_codes), memoryview(place_positions),
+                          *[memoryview(array_of_exponents) for array_of_exponents in exponents])
+
+    positions = numpy.arange(n_tiles, dtype=numpy.uint64)
+    codes = numpy.where(mix64_array(numpy.uint64(key) + positions * numpy.uint64(GOLDEN_GAMMA)) <
+                        numpy.uint64(place_threshold), PLACE_CODE, EMPTY_SPACE_CODE).astype(numpy.uint8)
+    codes[SHINY_ZONE_OFFSET::SHINY_ZONE_PERIOD] = SHINY_ZONE_CODE
+    codes[UPGRADE_SHOP_OFFSET::UPGRADE_SHOP_PERIOD] = UPGRADE_SHOP_CODE
+    codes[0] = START_TILE_CODE
+    places = numpy.flatnonzero(codes == PLACE_CODE).astype(numpy.int64)
+    ordinals = numpy.arange(len(places), dtype=numpy.int64)
+    return TileArrays(n_tiles, seed, memoryview(codes), memoryview(places).cast("B").cast("q"),
+                      *[memoryview(get_place_exponents(ordinals, index)).cast("B").cast("q") for index in range(3)])
+
+
+def get_tile_arrays(n_tiles, seed):
+    # type: (int, int) -> TileArrays
+    # Returns the tiles generated by generate_tile_arrays(), generating them only once per process.
+    if (n_tiles, seed) not in TILE_ARRAYS:
+        TILE_ARRAYS[(n_tiles, seed)] = generate_tile_arrays(n_tiles, seed)
+    return TILE_ARRAYS[(n_tiles, seed)]
+
+
+def get_little_endian_bytes(values):
+    # type: (memoryview) -> bytes or memoryview
+    # Returns the 64-bit integers in 'values' as little-endian bytes.
+    if NATIVE_LITTLE_ENDIAN:
+        return values.cast("B")
+    swapped: array.array = array.array("q", values)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+
+def save_tile_arrays(tile_arrays, file_name):
+    # type: (TileArrays, str) -> None
+    write_file_atomically(file_name, b"".join([
+        BOARD_FILE_HEADER_STRUCT.pack(BOARD_FILE_MAGIC, BOARD_FILE_VERSION, tile_arrays.n_tiles, tile_arrays.n_places,
+                                      tile_arrays.seed),
+        tile_arrays.tile_codes,
+        bytes(-tile_arrays.n_tiles % 8)
+    ] + [get_little_endian_bytes(values) for values in (tile_arrays.place_positions, tile_arrays.coin_cost_exponents,
+                                                        tile_arrays.coins_per_turn_exponents,
+                                                        tile_arrays.exp_per_turn_exponents)]))
+
+
+def load_tile_arrays(file_name):
+    # type: (str) -> TileArrays
+    """
+    This function memory-maps the tiles saved by save_tile_arrays() into 'file_name' read-only, so that every process
+    loading the same file shares one copy of them. A process only maps the tiles of a number of tiles and seed once.
+    :return: the tiles of the board in typed arrays
+    """
+
+    with open(file_name, "rb") as file:
+        magic, version, n_tiles, n_places, seed = BOARD_FILE_HEADER_STRUCT.unpack(
+            file.read(BOARD_FILE_HEADER_STRUCT.size))
+        if magic != BOARD_FILE_MAGIC or version != BOARD_FILE_VERSION:
+            raise ValueError("Not a board file of 'Tenzichi Own The Planet - Board Game Edition'.")
+        if (n_tiles, seed) in TILE_ARRAYS:
+            return TILE_ARRAYS[(n_tiles, seed)]
+
+        buffer: memoryview = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+    offset: int = BOARD_FILE_HEADER_STRUCT.size + n_tiles + -n_tiles % 8
+    arrays: list = [buffer[BOARD_FILE_HEADER_STRUCT.size:BOARD_FILE_HEADER_STRUCT.size + n_tiles]]  # initial value
+    for index in range(4):
+        if NATIVE_LITTLE_ENDIAN:
+            arrays.append(buffer[offset:offset + 8 * n_places].cast("q"))
+        else:
+            values: array.array = array.array("q", bytes(buffer[offset:offset + 8 * n_places]))
+            values.byteswap()
+            arrays.append(memoryview(values))
+        offset += 8 * n_places
+
+    tile_arrays: TileArrays = TileArrays(n_tiles, seed, *arrays, file_name=os.path.abspath(file_name))
+    TILE_ARRAYS[(n_tiles, seed)] = tile_arrays
+    return tile_arrays
+
+
+def generate_board(n_tiles, seed=0, numeric_backend=None, economy=None):
+    # type: (int, int, NumericBackend, Economy or None) -> GeneratedBoard
+    """
+    This function creates a board with 'n_tiles' tiles generated like generate_tile_arrays() does, with the
+    upgrades and the rewards of shinies of 'economy' if it is given.
+    :return: a new board with no owned places
+    """
+
+    return GeneratedBoard(get_tile_arrays(n_tiles, seed), numeric_backend, economy)
+
+
+def load_board(file_name, numeric_backend=None, economy=None):
+    # type: (str, NumericBackend, Economy or None) -> GeneratedBoard
+    """
+    This function creates a board from the tiles saved into 'file_name', which are memory-mapped, with the upgrades
+    and the rewards of shinies of 'economy' if it is given.
+    :return: a new board with no owned places
+    """
+
+    return GeneratedBoard(load_tile_arrays(file_name), numeric_backend, economy)
+
+
+class TileArrays:
+    """
+    This class contains attributes of the tiles of a generated board stored in typed arrays, which are never changed.
+    Copies of a game share them, and pickling them only pickles how to get them back: the name of the file they are
+    mapped from, or their number of tiles and seed otherwise.
+    """
+
+    def __init__(self, n_tiles, seed, tile_codes, place_positions, coin_cost_exponents, coins_per_turn_exponents,
+                 exp_per_turn_exponents, file_name=None):
+        # type: (int, int, memoryview, memoryview, memoryview, memoryview, memoryview, str or None) -> None
+        self.n_tiles: int = n_tiles
+        self.n_places: int = len(place_positions)
+        self.seed: int = seed
+        self.tile_codes: memoryview = tile_codes  # code of the type of the tile on each position
+        self.place_positions: memoryview = place_positions  # position of each place in ascending order
+        self.coin_cost_exponents: memoryview = coin_cost_exponents
+        self.coins_per_turn_exponents: memoryview = coins_per_turn_exponents
+        self.exp_per_turn_exponents: memoryview = exp_per_turn_exponents
+        self.file_name: str or None = file_name  # file the tiles are mapped from, if any
+
+    def __reduce__(self):
+        # type: () -> tuple
+        if self.file_name is not None:
+            return load_tile_arrays, (self.file_name,)
+        return get_tile_arrays, (self.n_tiles, self.seed)
+
+    def __deepcopy__(self, memo):
+        # type: (dict) -> TileArrays
+        return self
+
+
+class LazySequence:
+    """
+    This class contains attributes of a read-only sequence whose items are only created when they are accessed.
+    """
+
+    def __init__(self, length, get_item):
+        # type: (int, callable) -> None
+        self.__length: int = length
+        self.__get_item: callable = get_item
+
+    def __len__(self):
+        # type: () -> int
+        return self.__length
+
+    def __getitem__(self, index):
+        # type: (int) -> object
+        if index < 0:
+            index += self.__length
+        if index < 0 or index >= self.__length:
+            raise IndexError("Index out of range: " + str(index))
+        return self.__get_item(index)
+
+    def __iter__(self):
+        # type: () -> iter
+        for index in range(self.__length):
+            yield self.__get_item(index)
+
+
+class GeneratedBoard(Board):
+    """
+    This class contains attributes of a board whose tiles are stored in typed arrays. Places are only created as
+    objects when they are first needed, and all other tiles of the same type are one shared object, so that a board
+    with millions of tiles takes little more memory than its arrays. The exponents of its places come from its arrays
+    rather than from the place exponents of its economy.
+    """
+
+    def __init__(self, tile_arrays, numeric_backend=None, economy=None):
+        # type: (TileArrays, NumericBackend, Economy or None) -> None
+        Board.__init__(self, [], economy)
+        self.tile_arrays: TileArrays = tile_arrays
+        self.numeric_backend: NumericBackend = MPF_BACKEND if numeric_backend is None else numeric_backend
+        self.__shared_tiles: dict = {
+            EMPTY_SPACE_CODE: EmptySpace(),
+            START_TILE_CODE: StartTile(),
+            SHINY_ZONE_CODE: ShinyZone(self.economy.shiny_exponent_range),
+            UPGRADE_SHOP_CODE: UpgradeShop(create_upgrades_sold(numeric_backend, self.economy))
+        }
+        self.__places: dict = {}  # loaded places keyed by their ordinals
+        self.__initial_states: dict = {}  # states of the loaded places when they were loaded keyed by their ordinals
+        self.__compiled: CompiledBoard or None = None  # compiled when first needed
+
+    def __str__(self):
+        # type: () -> str
+        res: str = "Generated board:\n"
+        res += "Tiles: " + str(self.tile_arrays.n_tiles) + "\n"
+        res += "Places: " + str(self.tile_arrays.n_places) + "\n"
+        res += "Loaded places: " + str(len(self.__places)) + "\n"
+        res += "Seed: " + str(self.tile_arrays.seed) + "\n"
+        return res
+
+    def get_tiles(self):
+        # type: () -> LazySequence
+        return LazySequence(self.tile_arrays.n_tiles, self.get_tile)
+
+    def get_tile(self, position):
+        # type: (int) -> Tile
+        tile_code: int = self.tile_arrays.tile_codes[position]
+        if tile_code == PLACE_CODE:
+            return self.get_place(bisect.bisect_left(self.tile_arrays.place_positions, position))
+        return self.__shared_tiles[tile_code]
+
+    def get_places(self):
+        # type: () -> LazySequence
+        return LazySequence(self.tile_arrays.n_places, self.get_place)
+
+    def get_place(self, ordinal):
+        # type: (int) -> Place
+        place: Place or None = self.__places.get(ordinal)
+        if place is None:
+            name, description = PLACE_CATALOG[ordinal % len(PLACE_CATALOG)][:2]
+            if ordinal >= len(PLACE_CATALOG):
+                name += " #" + str(ordinal // len(PLACE_CATALOG) + 1)
+            power_of_ten = self.numeric_backend.power_of_ten
+            place = Place(name, description, power_of_ten(self.tile_arrays.coin_cost_exponents[ordinal]),
+                          power_of_ten(self.tile_arrays.coins_per_turn_exponents[ordinal]),
+                          power_of_ten(self.tile_arrays.exp_per_turn_exponents[ordinal]))
+            self.adopt_place(ordinal, place)
+            self.__places[ordinal] = place
+            self.__initial_states[ordinal] = place.get_state()
+        return place
+
+    def get_loaded_places(self):
+        # type: () -> list
+        return list(self.__places.values())
+
+    def get_modified_places(self):
+        # type: () -> list
+        # Returns the places which are not in their initial state in the order of the board, whatever order they were
+        # loaded in.
+        return [self.__places[ordinal] for ordinal in sorted(self.__places)
+                if not self.__initial_states[ordinal].matches(self.__places[ordinal])]
+
+    def get_initial_place_state(self, ordinal):
+        # type: (int) -> PlaceState
+        return self.__initial_states[ordinal]
+
+    def get_upgrade_catalog(self):
+        # type: () -> list
+        return self.__shared_tiles[UPGRADE_SHOP_CODE].get_upgrades_sold()
+
+    def get_compiled_board(self):
+        # type: () -> CompiledBoard
+        if self.__compiled is None:
+            self.__compiled = CompiledBoard(self.tile_arrays.tile_codes, self.tile_arrays.place_positions)
+        return self.__compiled
+
+    def __getstate__(self):
+        # type: () -> dict
+        state: dict = self.__dict__.copy()
+        state["_GeneratedBoard__compiled"] = None
+        return state
+
+
+# Creating the save format of the game.
+
+
+# A saved game starts with SAVE_FORMAT_MAGIC followed by the version of its format. Only the state which changes
+# during a game is saved besides the economy of the game. The board and the upgrades are recreated with that economy
+# by 'create_board()' or 'generate_board()' when loading the game, and only the places which are not in their
+# initial state are saved.
+SAVE_FORMAT_MAGIC: bytes = b"TOTP"
+SAVE_FORMAT_VERSION: int = 1
+SAVE_HEADER_STRUCT: struct.Struct = struct.Struct("<4sH")
+GAME_STRUCT: struct.Struct = struct.Struct("<IQQH")  # game level, turn, number of places and number of upgrades
+BOARD_STRUCT: struct.Struct = struct.Struct("<QQ")  # tiles and seed of a generated board, or 0 tiles for create_board()
+# Smallest and largest exponents of the rewards of shinies, exponent of the start coin bonus and probability with which
+# the CPU accepts offers of an economy, which are followed by its upgrades and the exponents of its places
+ECONOMY_STRUCT: struct.Struct = struct.Struct("<IIqd")
+EXPONENTS_STRUCT: struct.Struct = struct.Struct("<qqq")  # exponents or multipliers of an upgrade or a place
+RNG_STRUCT: struct.Struct = struct.Struct("<QQ")  # seed and index of the game
+# Is CPU, level, position and the number of turns of income earned but not paid yet of a participant
+PARTICIPANT_STRUCT: struct.Struct = struct.Struct("<?QQQ")
+# Ordinal, level and owner (0 for none, otherwise the seat of the owner + 1) of a place
+PLACE_STRUCT: struct.Struct = struct.Struct("<QQH")
+COUNT_STRUCT: struct.Struct = struct.Struct("<Q")
+LENGTH_STRUCT: struct.Struct = struct.Struct("<H")
+
+
+class SaveReader:
+    """
+    This class contains attributes of a position in a buffer holding a saved game.
+    """
+
+    def __init__(self, buffer):
+        # type: (bytes or mmap.mmap) -> None
+        self.buffer: bytes or mmap.mmap = buffer
+        self.offset: int = 0  # initial value
+
+    def read(self, a_struct):
+        # type: (struct.Struct) -> tuple
+        values: tuple = a_struct.unpack_from(self.buffer, self.offset)
+        self.offset += a_struct.size
+        return values
+
+    def read_string(self):
+        # type: () -> str
+        length: int = self.read(LENGTH_STRUCT)[0]
+        string: str = bytes(self.buffer[self.offset:self.offset + length]).decode("utf-8")
+        self.offset += length
+        return string
+
+    def read_economy(self):
+        # type: () -> Economy
+        shiny_low, shiny_high, start_coin_bonus_exponent, cpu_probability = self.read(ECONOMY_STRUCT)
+        upgrades: list = [(self.read_string(),) + self.read(EXPONENTS_STRUCT)
+                          for index in range(self.read(LENGTH_STRUCT)[0])]
+        place_exponents: list = [self.read(EXPONENTS_STRUCT) for index in range(self.read(LENGTH_STRUCT)[0])]
+        return Economy(upgrades, place_exponents, (shiny_low, shiny_high), start_coin_bonus_exponent, cpu_probability)
+
+    def read_number(self, numeric_backend):
+        # type: (NumericBackend) -> mpf
+        number: mpf = numeric_backend.decode_number(self.buffer, self.offset)
+        self.offset += NUMBER_STRUCT.size
+        return number
+
+
+def encode_string(string):
+    # type: (str) -> bytes
+    encoded: bytes = string.encode("utf-8")
+    return LENGTH_STRUCT.pack(len(encoded)) + encoded
+
+
+def encode_economy(economy):
+    # type: (Economy) -> bytes
+    chunks: list = [ECONOMY_STRUCT.pack(*economy.shiny_exponent_range, economy.start_coin_bonus_exponent,
+                                        economy.cpu_probability), LENGTH_STRUCT.pack(len(economy.upgrades))]
+    for name, coin_cost, coin_gain_multiplier, exp_gain_multiplier in economy.upgrades:
+        chunks += [encode_string(name), EXPONENTS_STRUCT.pack(coin_cost, coin_gain_multiplier, exp_gain_multiplier)]
+    chunks.append(LENGTH_STRUCT.pack(len(economy.place_exponents)))
+    chunks += [EXPONENTS_STRUCT.pack(*exponents) for exponents in economy.place_exponents]
+    return b"".join(chunks)
+
+
+def encode_game(game):
+    # type: (Game) -> bytes
+    """
+    This function encodes the state of 'game' which changes during the game into the save format.
+    :return: the saved game
+    """
+
+    state: GameSnapshot = GameSnapshot(game.turn, game.game_level, game.start_coin_bonus,
+                                       tuple(participant.get_state() for participant in game.participants), None,
+                                       None, ())
+    return encode_snapshot(game, state, [(place.ordinal, place.get_state())
+                                         for place in game.board.get_modified_places()])
+
+
+def encode_snapshot(game, snapshot, place_states):
+    # type: (Game, GameSnapshot, list) -> bytes
+    """
+    This function encodes the state of 'game' captured by 'snapshot' into the save format, saving the places in
+    'place_states', which are pairs of ordinal and state. Only the parts of 'game' which never change during a game
+    are read from the game itself, so that a snapshot can be encoded by another thread while the game goes on.
+    :return: the saved game
+    """
+
+    backend: NumericBackend = game.numeric_backend
+    board: Board = game.board
+    upgrade_indices: dict = {upgrade.name: index for index, upgrade in enumerate(board.get_upgrade_catalog())}
+
+    chunks: list = [
+        SAVE_HEADER_STRUCT.pack(SAVE_FORMAT_MAGIC, SAVE_FORMAT_VERSION),
+        encode_string(backend.name),
+        GAME_STRUCT.pack(snapshot.game_level, snapshot.turn, len(board.get_places()), len(upgrade_indices)),
+        BOARD_STRUCT.pack(board.tile_arrays.n_tiles, board.tile_arrays.seed) if isinstance(board, GeneratedBoard)
+        else BOARD_STRUCT.pack(0, 0),
+        encode_economy(board.economy),
+        RNG_STRUCT.pack(game.rng.seed, game.rng.game_index),
+        backend.encode_number(snapshot.start_coin_bonus),
+        LENGTH_STRUCT.pack(len(snapshot.participant_states))
+    ]
+    participants: list = game.participants
+    for participant, participant_state in zip(participants, snapshot.participant_states):
+        upgrade_counts: list = [0] * len(upgrade_indices)
+        upgrade_chain: tuple or None = participant_state.upgrades
+        while upgrade_chain is not None:
+            upgrade_counts[upgrade_indices[upgrade_chain[0].name]] += 1
+            upgrade_chain = upgrade_chain[1]
+
+        chunks += [
+            encode_string(participant.player_id),
+            encode_string(participant.name),
+            PARTICIPANT_STRUCT.pack(isinstance(participant, CPU), participant_state.level,
+                                    participant_state.position, participant_state.accrued_turns),
+            backend.encode_number(participant_state.exp),
+            backend.encode_number(participant_state.required_exp),
+            backend.encode_number(participant_state.coins)
+        ] + [COUNT_STRUCT.pack(count) for count in upgrade_counts]
+
+    owners: dict = {participant.player_id: seat + 1 for seat, participant in enumerate(participants)}
+    chunks.append(COUNT_STRUCT.pack(len(place_states)))
+    for ordinal, place_state in place_states:
+        chunks += [
+            PLACE_STRUCT.pack(ordinal, board.get_place(ordinal).level, owners.get(place_state.owner_id, 0)),
+            backend.encode_number(place_state.coin_cost),
+            backend.encode_number(place_state.coins_per_turn),
+            backend.encode_number(place_state.exp_per_turn)
+        ]
+
+    return b"".join(chunks)
+
+
+def decode_game(buffer, board=None):
+    # type: (bytes or mmap.mmap, Board or None) -> Game
+    """
+    This function decodes a game saved by 'encode_game()', reading the buffer in place. If 'board' is given, e.g.
+    the board of the game a delta was saved against, the saved places are decoded onto it and its other places keep
+    their states. Otherwise, a new board is created.
+    :return: the saved game
+    """
+
+    reader: SaveReader = SaveReader(buffer)
+    magic, version = reader.read(SAVE_HEADER_STRUCT)
+    if magic != SAVE_FORMAT_MAGIC:
+        raise ValueError("Not a saved game of 'Tenzichi Own The Planet - Board Game Edition'.")
+    if version != SAVE_FORMAT_VERSION:
+        raise ValueError("Unsupported save format version: " + str(version))
+
+    backend: NumericBackend = get_numeric_backend(reader.read_string())
+    game_level, turn, n_places, n_upgrades = reader.read(GAME_STRUCT)
+    n_tiles, board_seed = reader.read(BOARD_STRUCT)
+    economy: Economy = reader.read_economy()
+    if board is None:
+        board = create_board(backend, economy) if n_tiles == 0 else \
+            generate_board(n_tiles, board_seed, backend, economy)
+    catalog: list = board.get_upgrade_catalog()
+    if n_places != len(board.get_places()) or n_upgrades != len(catalog):
+        raise ValueError("The saved game was played on a different board.")
+
+    seed, game_index = reader.read(RNG_STRUCT)
+    start_coin_bonus: mpf = reader.read_number(backend)
+    n_participants: int = reader.read(LENGTH_STRUCT)[0]
+    participants: list = []  # initial value
+    participant_states: list = []  # initial value
+    for seat in range(n_participants):
+        player_id: str = reader.read_string()
+        name: str = reader.read_string()
+        is_cpu, level, position, accrued_turns = reader.read(PARTICIPANT_STRUCT)
+        participant: Player = CPU(backend) if is_cpu else Player(name, backend)
+        participant.player_id = player_id
+        participant.name = name
+        exp: mpf = reader.read_number(backend)
+        required_exp: mpf = reader.read_number(backend)
+        coins: mpf = reader.read_number(backend)
+        upgrades: list = []  # initial value
+        for upgrade in catalog:
+            upgrades += [upgrade] * reader.read(COUNT_STRUCT)[0]
+
+        participants.append(participant)
+        participant_states.append((level, exp, required_exp, coins, accrued_turns, position, upgrades))
+
+    seats: dict = {participant.player_id: seat for seat, participant in enumerate(participants)}
+    owners: dict = {place.ordinal: seats[place.owner_id] for place in board.get_loaded_places()
+                    if place.owner_id in seats}  # seats of the owners of the places keyed by their ordinals
+    n_saved_places: int = reader.read(COUNT_STRUCT)[0]
+    for index in range(n_saved_places):
+        ordinal, level, owner = reader.read(PLACE_STRUCT)
+        place: Place = board.get_place(ordinal)
+        place.level = level
+        place.coin_cost = reader.read_number(backend)
+        place.coins_per_turn = reader.read_number(backend)
+        place.exp_per_turn = reader.read_number(backend)
+        if owner > 0:
+            owners[ordinal] = owner - 1
+        elif place.owner_id is not None:
+            owners.pop(ordinal, None)
+            place.set_owner(None)
+
+    owned_places: list = [[] for seat in range(n_participants)]
+    for ordinal in sorted(owners):
+        owned_places[owners[ordinal]].append(board.get_place(ordinal))
+
+    for participant, state, owned in zip(participants, participant_states, owned_places):
+        level, exp, required_exp, coins, accrued_turns, position, upgrades = state
+        participant.restore_state(level, exp, required_exp, coins, position, owned, upgrades)
+
+    game: Game = Game(participants[0], participants[1], board, seed, game_index, economy)
+    for participant in participants[2:]:
+        game.add_participant(participant)
+    game.game_level = game_level
+    game.turn = turn
+    game.start_coin_bonus = start_coin_bonus
+    # The income not paid yet is restored last, since creating the game reads the levels of the participants, which
+    # would pay it. It is paid at the rates of the restored places and upgrades.
+    for participant, state in zip(participants, participant_states):
+        participant.accrue_income(state[4])
+    return game
+
+
+# Creating the autosave of the game.
+
+
+# A delta is a game saved like by 'encode_game()' in which only the places changed since the last full save are saved.
+# Its file starts with DELTA_HEADER_STRUCT holding the CRC-32 and the length of the full save it was saved against,
+# and it is ignored once that full save has been replaced.
+DELTA_FILE_SUFFIX: str = ".delta"
+DELTA_MAGIC: bytes = b"TOTD"
+DELTA_VERSION: int = 1
+DELTA_HEADER_STRUCT: struct.Struct = struct.Struct("<4sHIQ")
+AUTOSAVE_TURNS: int = 50  # default number of turns between autosaves
+AUTOSAVE_INTERVAL: float = 60.0  # default number of seconds after which the game is autosaved at the end of a turn
+AUTOSAVE_FULL_INTERVAL: int = 10  # default number of autosaves per full save, the others saving deltas
+
+
+def get_delta_file_name(file_name):
+    # type: (str) -> str
+    return file_name + DELTA_FILE_SUFFIX
+
+
+def remove_delta_file(file_name):
+    # type: (str) -> None
+    try:
+        os.remove(get_delta_file_name(file_name))
+    except FileNotFoundError:
+        pass
+
+
+def read_delta_file(file_name, saved_game):
+    # type: (str, bytes or mmap.mmap) -> bytes or None
+    """
+    This function reads the delta autosaved against 'saved_game', which is the game saved into the file called
+    'file_name'.
+    :return: the delta in the save format, or None if there is no delta saved against 'saved_game'
+    """
+
+    import zlib
+    try:
+        with open(get_delta_file_name(file_name), "rb") as file:
+            delta: bytes = file.read()
+    except FileNotFoundError:
+        return None
+
+    if len(delta) < DELTA_HEADER_STRUCT.size:
+        return None  # the game was quit before the delta was written
+    magic, version, checksum, length = DELTA_HEADER_STRUCT.unpack_from(delta)
+    if magic != DELTA_MAGIC:
+        raise ValueError("Not a delta of 'Tenzichi Own The Planet - Board Game Edition'.")
+    if version != DELTA_VERSION:
+        raise ValueError("Unsupported delta version: " + str(version))
+    if length != len(saved_game) or checksum != zlib.crc32(saved_game):
+        return None  # saved against a full save which was replaced since
+
+    return delta[DELTA_HEADER_STRUCT.size:]
+
+
+class AutoSaver:
+    """
+    This class contains attributes of the autosave of a game into a file every 'turn_interval' turns or
+    'time_interval' seconds. At the end of a turn, the game only takes a snapshot of itself, which shares everything
+    unchanged with its previous snapshot, and a writer thread encodes the snapshot and writes it with
+    write_file_atomically(), so that autosaving adds no visible latency to a turn. Every 'full_interval'-th
+    autosave saves the whole game into the file and the others save a delta next to it holding only the places
+    changed since. A snapshot taken while the writer thread is busy replaces the one waiting for it, so a slow disk
+    makes autosaves less frequent rather than turns slower.
+    """
+
+    def __init__(self, file_name, turn_interval=AUTOSAVE_TURNS, time_interval=AUTOSAVE_INTERVAL,
+                 full_interval=AUTOSAVE_FULL_INTERVAL):
+        # type: (str, int, float, int) -> None
+        self.file_name: str = file_name
+        self.turn_interval: int = turn_interval  # number of turns between autosaves, or 0 for none
+        self.time_interval: float = time_interval  # number of seconds between autosaves, or 0 for none
+        self.full_interval: int = full_interval
+        self.saves: int = 0  # number of autosaves written
+        self.error: Exception or None = None  # last error of the writer thread, e.g. a full disk
+        self.__last_turn: int or None = None  # turn of the last autosave, or of the first turn checked
+        self.__last_time: float = time.monotonic()
+        self.__condition: object = None  # condition of the writer thread, created with it
+        self.__thread: object = None  # writer thread, started by the first autosave
+        self.__pending: tuple or None = None  # game and snapshot waiting for the writer thread
+        self.__writing: bool = False  # initial value
+        self.__closed: bool = False  # initial value
+        # Place states keyed by ordinal, CRC-32 and length of the last full save, used by the writer thread only
+        self.__saved_place_states: dict or None = None
+        self.__saved_checksum: int = 0
+        self.__saved_length: int = 0
+        self.__deltas: int = 0  # number of deltas saved since the last full save
+
+    def maybe_save(self, game):
+        # type: (Game) -> bool
+        # Autosaves 'game' if it is due, which is checked at the end of every turn, and returns whether it did.
+        if self.__last_turn is None:
+            self.__last_turn = game.turn
+        if (0 < self.turn_interval <= game.turn - self.__last_turn) or \
+                (0 < self.time_interval <= time.monotonic() - self.__last_time):
+            self.save(game)
+            return True
+        return False
+
+    def save(self, game):
+        # type: (Game) -> None
+        # Takes a snapshot of 'game' for the writer thread to save.
+        metrics: TurnMetrics or None = game.metrics
+        start_time: float = time.perf_counter() if metrics is not None else 0.0
+        if self.__thread is None:
+            import threading
+            self.__condition = threading.Condition()
+            self.__thread = threading.Thread(target=self.__write_snapshots, name="autosave", daemon=True)
+            self.__thread.start()
+
+        snapshot: GameSnapshot = game.snapshot()
+        with self.__condition:
+            self.__pending = (game, snapshot)
+            self.__condition.notify_all()
+        self.__last_turn = game.turn
+        self.__last_time = time.monotonic()
+
+        if metrics is not None:
+            metrics.record(SAVE_IO_PHASE, start_time)
+            metrics.increment("saves")
+
+    def flush(self):
+        # type: () -> None
+        # Waits until the writer thread has written every snapshot taken so far.
+        if self.__thread is not None:
+            with self.__condition:
+                while self.__pending is not None or self.__writing:
+                    self.__condition.wait()
+
+    def close(self):
+        # type: () -> None
+        # Writes the snapshot waiting for the writer thread, if any, and stops the thread.
+        if self.__thread is not None:
+            with self.__condition:
+                self.__closed = True
+                self.__condition.notify_all()
+            self.__thread.join()
+            self.__thread = None
+
+    def __write_snapshots(self):
+        # type: () -> None
+        while True:
+            with self.__condition:
+                while self.__pending is None and not self.__closed:
+                    self.__condition.wait()
+                if self.__pending is None:
+                    return
+                game, snapshot = self.__pending
+                self.__pending = None
+                self.__writing = True
+
+            try:
+                self.write(game, snapshot)
+            except Exception as error:
+                self.error = error  # the game goes on, and the next autosave tries again
+            with self.__condition:
+                self.__writing = False
+                self.__condition.notify_all()
+
+    def write(self, game, snapshot):
+        # type: (Game, GameSnapshot) -> None
+        """
+        This method saves 'game' as captured by 'snapshot', either wholly into the file of this autosave or as a
+        delta against the last full save, as the writer thread does.
+        :return: None
+        """
+
+        import zlib
+        place_states: dict = snapshot.get_place_states()
+        initial_states: dict = {}  # initial value
+        if isinstance(game.board, GeneratedBoard):
+            # Places of a generated board in their initial state need not be saved.
+            initial_states = {ordinal: game.board.get_initial_place_state(ordinal) for ordinal in place_states}
+
+        if self.__saved_place_states is None or self.__deltas + 1 >= self.full_interval:
+            saved_game: bytes = encode_snapshot(game, snapshot, [
+                (ordinal, place_state) for ordinal, place_state in sorted(place_states.items())
+                if ordinal not in initial_states or not initial_states[ordinal].matches(place_state)])
+            write_file_atomically(self.file_name, saved_game)
+            remove_delta_file(self.file_name)
+            self.__saved_place_states = place_states
+            self.__saved_checksum = zlib.crc32(saved_game)
+            self.__saved_length = len(saved_game)
+            self.__deltas = 0
+        else:
+            # Place states are shared by snapshots for as long as the places are unchanged.
+            changed_places: list = []  # initial value
+            for ordinal, place_state in sorted(place_states.items()):
+                saved_place_state: PlaceState or None = self.__saved_place_states.get(ordinal)
+                if saved_place_state is None and ordinal in initial_states:
+                    saved_place_state = initial_states[ordinal]  # loaded since the last full save
+                if saved_place_state is None or not saved_place_state.matches(place_state):
+                    changed_places.append((ordinal, place_state))
+
+            write_file_atomically(get_delta_file_name(self.file_name), DELTA_HEADER_STRUCT.pack(
+                DELTA_MAGIC, DELTA_VERSION, self.__saved_checksum, self.__saved_length) +
+                encode_snapshot(game, snapshot, changed_places))
+            self.__deltas += 1
+
+        self.saves += 1
+
+
+# Creating the batch simulation entry point of the game.
+
+
+class SimulationReport:
+    """
+    This class contains attributes of the results of a batch of simulated games.
+    """
+
+    def __init__(self, n_games, total_turns, elapsed_seconds, player_wins, cpu_wins):
+        # type: (int, int, float, int, int) -> None
+        self.n_games: int = n_games
+        self.total_turns: int = total_turns
+        self.elapsed_seconds: float = elapsed_seconds
+        self.player_wins: int = player_wins
+        self.cpu_wins: int = cpu_wins
+
+    def __str__(self):
+        # type: () -> str
+        res: str = ""  # initial value
+        res += "Games played: " + str(self.n_games) + "\n"
+        res += "Turns played: " + str(self.total_turns) + "\n"
+        res += "Elapsed seconds: " + str(self.elapsed_seconds) + "\n"
+        res += "Games per second: " + str(self.get_games_per_second()) + "\n"
+        res += "Turns per second: " + str(self.get_turns_per_second()) + "\n"
+        res += "Player wins: " + str(self.player_wins) + "\n"
+        res += "CPU wins: " + str(self.cpu_wins) + "\n"
+        res += "Unfinished games: " + str(self.get_unfinished_games()) + "\n"
+        return res
+
+    def get_games_per_second(self):
+        # type: () -> float
+        return self.n_games / self.elapsed_seconds if self.elapsed_seconds > 0 else float("inf")
+
+    def get_turns_per_second(self):
+        # type: () -> float
+        return self.total_turns / self.elapsed_seconds if self.elapsed_seconds > 0 else float("inf")
+
+    def get_unfinished_games(self):
+        # type: () -> int
+        return self.n_games - self.player_wins - self.cpu_wins
+
+
+def play_game(game, player_policy, cpu_policy, max_turns):
+    # type: (Game, DecisionPolicy, DecisionPolicy, int) -> Player or None
+    """
+    This function plays a game without any input or output until a participant owns all places or
+    'max_turns' turns have been played.
+    :return: the winner of the game or None if the game is unfinished
+    """
+
+    return game.fast_forward(max_turns - game.turn, player_policy, cpu_policy)
+
+
+def simulate(n_games, max_turns, seed=None, numeric_backend=None, metrics=None, n_participants=2):
+    # type: (int, int, int, NumericBackend, TurnMetrics or None, int) -> SimulationReport
+    """
+    This function plays 'n_games' games of 'n_participants' CPUs of at most 'max_turns' turns each, measuring their
+    turns into 'metrics' if given. Wins of the participant in the first seat count as wins of the player.
+    :return: a report of the results and speed of the simulation
+    """
+
+    seed = random.getrandbits(64) if seed is None else seed
+    policy: RandomCPUPolicy = RandomCPUPolicy()
+    total_turns: int = 0  # initial value
+    player_wins: int = 0  # initial value
+    cpu_wins: int = 0  # initial value
+    start_time: float = time.perf_counter()
+    for i in range(n_games):
+        game: Game = Game(CPU(numeric_backend), CPU(numeric_backend), create_board(numeric_backend), seed, i)
+        for seat in range(2, n_participants):
+            game.add_participant(CPU(numeric_backend))
+        game.metrics = metrics
+        winner: Player or None = play_game(game, policy, policy, max_turns)
+        total_turns += game.turn
+        if winner is game.player:
+            player_wins += 1
+        elif winner is not None:
+            cpu_wins += 1
+
+    return SimulationReport(n_games, total_turns, time.perf_counter() - start_time, player_wins, cpu_wins)
+
+
+# Creating main method of the game.
+
+
+SAVE_FILE_NAME: str = "SAVED TENZICHI OWN THE PLANET - BOARD GAME EDITION GAME PROGRESS"  # default save slot
+
+
+def render(metrics, *parts):
+    # type: (TurnMetrics or None, object) -> None
+    # Prints 'parts' one after the other, measuring how long turning them into text and printing it takes.
+    start_time: float = time.perf_counter() if metrics is not None else 0.0
+    print("".join(str(part) for part in parts))
+    if metrics is not None:
+        metrics.record(RENDERING_PHASE, start_time)
+
+
+def main(cpu_policy=None, metrics=None, n_cpus=1, file_name=SAVE_FILE_NAME):
+    # type: (DecisionPolicy or None, TurnMetrics or None, int, str) -> None
+    """
+    This main method is used to run the game. A new game is played against 'n_cpus' CPUs, which make their
+    decisions with 'cpu_policy', which accepts every offer with a fixed probability by default. If 'metrics' are
+    given, the phases of the turns are measured into them and they are exported when the game is quit. The game is
+    autosaved in the background every AUTOSAVE_TURNS turns or AUTOSAVE_INTERVAL seconds and saved into the file
+    called 'file_name' when it is quit, and the game saved into that file is continued if there is one.
+    :return: None
+    """
+
+    print("Welcome to 'Tenzichi Own The Planet - Board Game Edition' by 'DtjiSoftwareDeveloper'.")
+    print("This game is a board game where the player needs to own the planet by purchasing and upgrading places.")
+
+    # Automatically load saved game data
+    new_game: Game
+    try:
+        new_game = load_game_data(file_name)
+        render(metrics, "Current game progress:\n ", new_game)
+    except FileNotFoundError:
+        name: str = input("Please enter your name: ")
+        player: Player = Player(name)
+        new_game = Game(player, CPU(), create_board())
+        for i in range(1, n_cpus):
+            new_game.add_participant(CPU())
+
+    if metrics is not None:
+        new_game.metrics = metrics
+        metrics.export_at_exit()
+
+    player_policy: InteractivePolicy = InteractivePolicy()
+    cpu_policy = RandomCPUPolicy() if cpu_policy is None else cpu_policy
+    autosaver: AutoSaver = AutoSaver(file_name)
+    print("Enter 'Y' for yes.")
+    print("Enter anything else for no.")
+    continue_playing: str = input("Do you want to continue playing 'Tenzichi Own The Planet - Board Game Edition'? ")
+    while continue_playing == "Y":
+        # Printing your stats and your opponent's stats
+        render(metrics, "Your current stats:\n", new_game.player)
+        for opponent in new_game.get_opponents(new_game.player):
+            print("\n")
+            render(metrics, "Your opponent's stats:\n", opponent)
+        # Checking whether it is player's turn or CPU's turn
+        if new_game.get_participant_for_turn(new_game.turn + 1) is new_game.player:
+            # It is player's turn
+            print("It is your turn.")
+            print("Enter 'Y' for yes.")
+            print("Enter anything else for no.")
+            roll_dice: str = input("Do you want to roll the dice? ")
+            if roll_dice == "Y":
+                report: TurnReport = new_game.begin_turn()
+                render(metrics, "You are now at:\n", report.tile)
+                if report.shiny is not None:
+                    print("You earn " + str(report.shiny.coin_reward) + " coins and " +
+                          str(report.shiny.exp_reward) + " EXP.")
+
+                new_game.complete_turn(report, player_policy)
+                if report.accepted:
+                    if not report.succeeded:
+                        print("Sorry, insufficient coins!")
+                    elif report.decision == ACQUIRE_PLACE:
+                        print("Congratulations! You have successfully acquired " + str(report.target.name))
+                    elif report.decision == UPGRADE_PLACE:
+                        print("Congratulations! You have successfully upgraded " + str(report.target.name))
+                    else:
+                        print("Congratulations! You have successfully bought " + str(report.target.name))
+            else:
+                # Save game data and quit the game
+                autosaver.close()
+                save_game_data(new_game, file_name)
+                sys.exit()
+        else:
+            # It is CPU's turn
+            print("It is CPU's turn.")
+
+            report: TurnReport = new_game.begin_turn()
+            render(metrics, "Your opponent is now at:\n", report.tile)
+            if report.shiny is not None:
+                print("Your opponent earns " + str(report.shiny.coin_reward) + " coins and " +
+                      str(report.shiny.exp_reward) + " EXP.")
+
+            new_game.complete_turn(report, cpu_policy)
+            if report.accepted:
+                if not report.succeeded:
+                    print("Your opponent has insufficient coins!")
+                elif report.decision == ACQUIRE_PLACE:
+                    print("Your opponent has successfully acquired " + str(report.target.name))
+                elif report.decision == UPGRADE_PLACE:
+                    print("Your opponent has successfully upgraded " + str(report.target.name))
+                else:
+                    print("Your opponent has successfully bought " + str(report.target.name))
+        autosaver.maybe_save(new_game)
+        print("Enter 'Y' for yes.")
+        print("Enter anything else for no.")
+        continue_playing = input(
+            "Do you want to continue playing 'Tenzichi Own The Planet - Board Game Edition'? ")
+
+    # Save game data and quit the game
+    autosaver.close()
+    save_game_data(new_game, file_name)
+    sys.exit()
+
+
+if __name__ == '__main__':
+    if len(sys.argv) in (4, 5, 6) and sys.argv[1] == "simulate":
+        print(str(simulate(int(sys.argv[2]), int(sys.argv[3]), None,
+                           get_numeric_backend(sys.argv[4]) if len(sys.argv) >= 5 else None, None,
+                           int(sys.argv[5]) if len(sys.argv) == 6 else 2)))
+    elif len(sys.argv) in (3, 4) and sys.argv[1] == "metrics":
+        main(None, TurnMetrics(sys.argv[2], None, int(sys.argv[3]) if len(sys.argv) == 4 else 0))
+    elif len(sys.argv) == 3 and sys.argv[1] == "play":
+        main(file_name=sys.argv[2])
+    elif len(sys.argv) in (4, 5) and sys.argv[1] == "board":
+        save_tile_arrays(generate_tile_arrays(int(sys.argv[2]), int(sys.argv[4]) if len(sys.argv) == 5 else 0),
+                         sys.argv[3])
+    else:
+        main()
@@ -0,0 +1,88 @@
+"""
+This file contains tests of the balance sweep of the game "Tenzichi Own The Planet - Board Game Edition".
+Author: DtjiSoftwareDeveloper
+"""
+
+
+# Importing necessary libraries
+
+import os
+import tempfile
+import unittest
+from balance_sweep import BalanceCache, SweepReport, create_economy, evaluate_games, generate_grid, get_blocks, \
+    get_cache_key, run_sweep, sample_search_space
+from tenzichi_own_the_planet_board_game_edition import DEFAULT_ECONOMY, Economy
+
+
+class BalanceSweepTest(unittest.TestCase):
+    """
+    This class contains tests of sweeping economies and caching the results of their games.
+    """
+
+    def setUp(self):
+        # type: () -> None
+        self.directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        # type: () -> None
+        self.directory.cleanup()
+
+    def test_cached_results_are_reused(self):
+        # type: () -> None
+        parameter_sets: list = generate_grid({"cpu_probability": [0.5, 0.9]})
+        report: SweepReport = run_sweep(parameter_sets, 20, 200, 3, self.directory.name, 2, 10)
+        self.assertEqual((report.blocks_played, report.blocks_cached), (4, 0))
+        self.assertEqual([parameters for parameters, result in report.results], parameter_sets)
+        self.assertEqual(report.results[1][1].to_dict(),
+                         evaluate_games(create_economy(parameter_sets[1]), 0, 20, 200, 3).to_dict())
+        self.assertNotEqual(report.results[0][1].to_dict(), report.results[1][1].to_dict())
+
+        cached_report: SweepReport = run_sweep(parameter_sets, 20, 200, 3, self.directory.name, 2, 10)
+        self.assertEqual((cached_report.blocks_played, cached_report.blocks_cached), (0, 4))
+        self.assertEqual([result.to_dict() for parameters, result in cached_report.results],
+                         [result.to_dict() for parameters, result in report.results])
+
+        # An overlapping sweep only plays the blocks no sweep has played yet, and another seed plays them all.
+        overlapping_report: SweepReport = run_sweep(parameter_sets[:1], 20, 200, 3, self.directory.name, 2, 10,
+                                                    first_game_index=10)
+        self.assertEqual((overlapping_report.blocks_played, overlapping_report.blocks_cached), (1, 1))
+        self.assertEqual(overlapping_report.results[0][1].to_dict(),
+                         evaluate_games(create_economy(parameter_sets[0]), 10, 30, 200, 3).to_dict())
+        other_seed_report: SweepReport = run_sweep(parameter_sets, 20, 200, 4, self.directory.name, 2, 10)
+        self.assertEqual((other_seed_report.blocks_played, other_seed_report.blocks_cached), (4, 0))
+
+    def test_unreadable_cache_entries_are_replayed(self):
+        # type: () -> None
+        cache: BalanceCache = BalanceCache(self.directory.name)
+        key: str = get_cache_key(DEFAULT_ECONOMY, 0, 5, 100, 3, "mpf", 2)
+        with open(cache.get_file_name(key), "w") as file:
+            file.write("{")
+        self.assertIsNone(cache.get(key))
+        report: SweepReport = run_sweep([{}], 5, 100, 3, self.directory.name, 1, 10)
+        self.assertEqual((report.blocks_played, report.blocks_cached), (1, 0))
+        self.assertEqual(cache.get(key).to_dict(), report.results[0][1].to_dict())
+
+    def test_configs(self):
+        # type: () -> None
+        self.assertEqual(generate_grid({"b": [1, 2], "a": [3]}), [{"a": 3, "b": 1}, {"a": 3, "b": 2}])
+        space: dict = {"cpu_probability": {"low": 0.25, "high": 0.75}, "start_coin_bonus_exponent": [2, 4, 6],
+                       "place_cost_scale": {"low": 1, "high": 3}}
+        configs: list = sample_search_space(space, 20, 7)
+        self.assertEqual(sample_search_space(space, 20, 7), configs)
+        for config in configs:
+            self.assertTrue(0.25 <= config["cpu_probability"] <= 0.75)
+            self.assertIn(config["start_coin_bonus_exponent"], (2, 4, 6))
+            self.assertIn(config["place_cost_scale"], (1, 2, 3))
+        self.assertEqual(get_blocks(5, 32, 10), [(5, 10), (10, 20), (20, 30), (30, 32)])
+
+        economy: Economy = create_economy({"place_cost_scale": 2, "cpu_probability": 0.5})
+        self.assertEqual(economy.cpu_probability, 0.5)
+        self.assertEqual([exponents[0] for exponents in economy.place_exponents],
+                         [2 * exponents[0] for exponents in DEFAULT_ECONOMY.place_exponents])
+        self.assertEqual(economy.upgrades, DEFAULT_ECONOMY.upgrades)
+        self.assertNotEqual(get_cache_key(economy, 0, 10, 100, 3, "mpf", 2),
+                            get_cache_key(DEFAULT_ECONOMY, 0, 10, 100, 3, "mpf", 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
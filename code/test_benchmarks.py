@@ -0,0 +1,49 @@
+"""
+This file contains tests of the benchmark suite of the game "Tenzichi Own The Planet - Board Game Edition".
+Author: DtjiSoftwareDeveloper
+"""
+
+
+# Importing necessary libraries
+
+import os
+import tempfile
+import unittest
+from benchmarks import BENCHMARKS, find_regressions, load_baseline, run_benchmarks, save_baseline
+
+
+class BenchmarksTest(unittest.TestCase):
+    """
+    This class contains tests of running benchmarks and comparing them with their baseline.
+    """
+
+    def test_baseline_covers_every_benchmark(self):
+        # type: () -> None
+        self.assertEqual(set(load_baseline()), set(BENCHMARKS))
+
+    def test_run_benchmarks(self):
+        # type: () -> None
+        results: dict = run_benchmarks(["roll_dice", "purchase_place"])
+        self.assertEqual(list(results), ["roll_dice", "purchase_place"])
+        for seconds in results.values():
+            self.assertGreater(seconds, 0)
+        self.assertRaises(ValueError, run_benchmarks, ["roll_dice", "fly"])
+
+    def test_find_regressions(self):
+        # type: () -> None
+        baseline: dict = {"roll_dice": 1.0, "purchase_place": 2.0}
+        self.assertEqual(find_regressions({"roll_dice": 1.5, "purchase_place": 3.5, "clone_long_game": 9.0},
+                                          baseline), ["purchase_place"])
+        self.assertEqual(find_regressions({"roll_dice": 1.5}, baseline, 1.2), ["roll_dice"])
+
+    def test_save_baseline(self):
+        # type: () -> None
+        directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        file_name: str = os.path.join(directory.name, "baseline.json")
+        save_baseline({"roll_dice": 1e-6}, file_name)
+        self.assertEqual(load_baseline(file_name), {"roll_dice": 1e-6})
+
+
+if __name__ == '__main__':
+    unittest.main()
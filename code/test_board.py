@@ -0,0 +1,81 @@
+"""
+This file contains tests of the board of the game "Tenzichi Own The Planet - Board Game Edition".
+Author: DtjiSoftwareDeveloper
+"""
+
+
+# Importing necessary libraries
+
+import unittest
+from tenzichi_own_the_planet_board_game_edition import CPU, DICE_FACES, MPF_BACKEND, PLACE_CODE, Board, \
+    CompiledBoard, Game, Player, create_board, get_tile_code
+
+
+class OwnershipTest(unittest.TestCase):
+    """
+    This class contains tests of the ownership index of a board.
+    """
+
+    def test_ownership_follows_purchases_and_acquisitions(self):
+        # type: () -> None
+        game: Game = Game(Player("PLAYER"), CPU(), create_board())
+        player: Player = game.player
+        cpu: CPU = game.cpu
+        player.coins = MPF_BACKEND.number("1e100000")
+        cpu.coins = MPF_BACKEND.number("1e100000")
+        board: Board = game.board
+        places: list = board.get_places()
+        for place in places[:5]:
+            self.assertTrue(player.purchase_place(place))
+            self.assertFalse(cpu.purchase_place(place))
+        self.assertEqual([board.owner_of(ordinal) for ordinal in range(6)], [player.player_id] * 5 + [None])
+        self.assertEqual(board.places_owned_by(player.player_id), places[:5])
+        self.assertEqual(board.count_owned(player.player_id), 5)
+        self.assertEqual(board.count_owned(cpu.player_id), 0)
+
+        self.assertTrue(cpu.acquire_place(places[2], player))
+        self.assertFalse(player.upgrade_place(places[2]))
+        self.assertEqual(board.owner_of(2), cpu.player_id)
+        self.assertEqual(board.places_owned_by(player.player_id), places[:2] + places[3:5])
+        self.assertEqual(board.places_owned_by(cpu.player_id), [places[2]])
+        self.assertEqual(player.count_owned(), 4)
+        self.assertEqual(player.get_owned_list(), places[:2] + places[3:5])
+        self.assertFalse(cpu.owns_all_places(game))
+
+        for place in places[5:]:
+            self.assertTrue(cpu.purchase_place(place))
+        for place in places[:2] + places[3:5]:
+            self.assertTrue(cpu.acquire_place(place, player))
+        self.assertTrue(cpu.owns_all_places(game))
+        self.assertFalse(player.owns_all_places(game))
+        self.assertEqual(player.get_owned_list(), [])
+
+
+class CompiledBoardTest(unittest.TestCase):
+    """
+    This class contains tests of boards compiled into tables.
+    """
+
+    def test_compiled_board_matches_tiles(self):
+        # type: () -> None
+        board: Board = create_board()
+        tiles: list = board.get_tiles()
+        compiled_board: CompiledBoard = board.get_compiled_board()
+        self.assertIs(board.get_compiled_board(), compiled_board)
+        self.assertEqual(compiled_board.size, len(tiles))
+        self.assertEqual(list(compiled_board.tile_codes), [get_tile_code(tile) for tile in tiles])
+        self.assertEqual([tiles[position] for position, tile_code in enumerate(compiled_board.tile_codes)
+                          if tile_code == PLACE_CODE], board.get_places())
+
+    def test_moves_wrap_around(self):
+        # type: () -> None
+        compiled_board: CompiledBoard = create_board().get_compiled_board()
+        for position in range(compiled_board.size):
+            for dice_value in range(1, DICE_FACES + 1):
+                self.assertEqual(compiled_board.move(position, dice_value),
+                                 ((position + dice_value) % compiled_board.size,
+                                  position + dice_value >= compiled_board.size))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+"""
+This file contains tests of the board analytics of the game "Tenzichi Own The Planet - Board Game Edition".
+Author: DtjiSoftwareDeveloper
+"""
+
+
+# Importing necessary libraries
+
+import unittest
+from board_analytics import BoardAnalysis, analyze_board, get_payback_turns
+from tenzichi_own_the_planet_board_game_edition import DICE_FACES, MPF_BACKEND, PLACE_CODE, SHINY_ZONE_CODE, \
+    UPGRADE_SHOP_CODE, Board, Player, create_board
+
+
+class BoardAnalyticsTest(unittest.TestCase):
+    """
+    This class contains tests of the analysis of boards as Markov chains.
+    """
+
+    def test_landing_probabilities(self):
+        # type: () -> None
+        # Every position is reached from DICE_FACES positions with the same probability, so all are equally likely.
+        board: Board = create_board()
+        analysis: BoardAnalysis = analyze_board(board)
+        size: int = len(board.get_tiles())
+        self.assertEqual(analysis.size, size)
+        self.assertAlmostEqual(float(analysis.landing_probabilities.sum()), 1.0)
+        for probability in analysis.landing_probabilities:
+            self.assertAlmostEqual(float(probability), 1.0 / size, 9)
+        self.assertAlmostEqual(analysis.start_passes_per_turn, (DICE_FACES + 1) / 2 / size, 9)
+        for tile_code, visits_per_turn in ((SHINY_ZONE_CODE, analysis.shiny_zone_visits_per_turn),
+                                           (UPGRADE_SHOP_CODE, analysis.upgrade_shop_visits_per_turn),
+                                           (PLACE_CODE, analysis.place_visits_per_turn)):
+            self.assertAlmostEqual(visits_per_turn, list(analysis.tile_codes).count(tile_code) / size, 9)
+        self.assertAlmostEqual(analysis.get_expected_turns_to_land(0), size, 6)
+        self.assertIs(analyze_board(create_board()), analysis)
+
+    def test_payback_turns(self):
+        # type: () -> None
+        board: Board = create_board()
+        size: int = len(board.get_tiles())
+        places: list = board.get_places()
+        player: Player = Player("PLAYER")
+        player.coins = MPF_BACKEND.number("1e100000")
+        self.assertTrue(player.purchase_place(places[1]))
+
+        payback_turns: list = get_payback_turns(board, 3, 2)
+        self.assertEqual(len(payback_turns), len(places))
+        self.assertAlmostEqual(payback_turns[0], size + float(places[0].coin_cost / places[0].coins_per_turn) / 2,
+                               4)
+        self.assertAlmostEqual(payback_turns[1], size + float(places[1].coin_cost / places[1].coins_per_turn) /
+                               2 / 10 ** 4, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,221 @@
+"""
+This file contains tests of the headless turn engine of the game "Tenzichi Own The Planet - Board Game Edition".
+Author: DtjiSoftwareDeveloper
+"""
+
+
+# Importing necessary libraries
+
+import unittest
+from tenzichi_own_the_planet_board_game_edition import CPU, MPF_BACKEND, PURCHASE_PLACE, SCIENTIFIC_BACKEND, \
+    DecisionPolicy, Game, GameSnapshot, Place, Player, RandomCPUPolicy, SimulationReport, TurnReport, UpgradeShop, \
+    create_board, encode_game, simulate
+
+
+def encode_paid_game(game):
+    # type: (Game) -> bytes
+    # Saves 'game' after paying all income its participants earned.
+    for participant in game.participants:
+        participant.settle_income()
+    return encode_game(game)
+
+
+class AcceptingPolicy(DecisionPolicy):
+    """
+    This class contains the decisions of a participant who accepts every offer and buys the first upgrade sold.
+    """
+
+    def choose_upgrade(self, game, participant, upgrade_shop):
+        # type: (Game, Player, UpgradeShop) -> int
+        return 0
+
+    def should_purchase_place(self, game, participant, place):
+        # type: (Game, Player, Place) -> bool
+        return True
+
+    def should_upgrade_place(self, game, participant, place):
+        # type: (Game, Player, Place) -> bool
+        return True
+
+    def should_acquire_place(self, game, participant, place, owner):
+        # type: (Game, Player, Place, Player) -> bool
+        return True
+
+
+class TurnEngineTest(unittest.TestCase):
+    """
+    This class contains tests of playing turns without any input or output.
+    """
+
+    def test_turns_alternate(self):
+        # type: () -> None
+        game: Game = Game(Player("PLAYER"), CPU(), create_board())
+        policy: RandomCPUPolicy = RandomCPUPolicy()
+        for turn in range(1, 101):
+            report: TurnReport = game.step(policy)
+            self.assertEqual(report.turn, turn)
+            self.assertEqual(game.turn, turn)
+            self.assertIs(report.participant, game.player if turn % 2 == 1 else game.cpu)
+            self.assertIn(report.dice_value, range(1, 21))
+            self.assertIs(report.tile, game.board.get_tiles()[report.participant.position])
+
+    def test_accepted_purchases_succeed(self):
+        # type: () -> None
+        game: Game = Game(Player("PLAYER"), CPU(), create_board())
+        game.player.coins = game.player.coins + 10 ** 100000
+        policy: AcceptingPolicy = AcceptingPolicy()
+        n_purchases: int = 0  # initial value
+        while game.turn < 100:
+            report: TurnReport = game.step(policy if game.turn % 2 == 0 else RandomCPUPolicy(0))
+            if report.participant is game.player and report.decision == PURCHASE_PLACE:
+                self.assertTrue(report.accepted)
+                self.assertTrue(report.succeeded)
+                self.assertIn(report.tile, game.player.get_owned_list())
+                n_purchases += 1
+
+        self.assertGreater(n_purchases, 0)
+
+    def test_simulate(self):
+        # type: () -> None
+        simulation_report: SimulationReport = simulate(3, 100)
+        self.assertEqual(simulation_report.n_games, 3)
+        self.assertGreater(simulation_report.total_turns, 0)
+        self.assertLessEqual(simulation_report.total_turns, 300)
+        self.assertEqual(simulation_report.player_wins + simulation_report.cpu_wins +
+                         simulation_report.get_unfinished_games(), 3)
+
+
+class FastForwardTest(unittest.TestCase):
+    """
+    This class contains tests of playing many turns at once.
+    """
+
+    def test_fast_forward_matches_step(self):
+        # type: () -> None
+        policy: RandomCPUPolicy = RandomCPUPolicy()
+        for backend in (MPF_BACKEND, SCIENTIFIC_BACKEND):
+            game: Game = Game(Player("PLAYER", backend), CPU(backend), create_board(backend), 5)
+            stepped_game: Game = game.clone()
+            for n_turns in (1, 2, 97, 600, 1500):
+                self.assertIsNone(game.fast_forward(n_turns, policy))
+                while stepped_game.turn < game.turn:
+                    stepped_game.step(policy)
+                self.assertEqual(encode_paid_game(game), encode_paid_game(stepped_game))
+
+    def test_fast_forward_stops_at_winner(self):
+        # type: () -> None
+        game: Game = Game(Player("PLAYER"), CPU(), create_board(), 7)
+        game.cpu.coins = MPF_BACKEND.number("1e100000")
+        for place in game.board.get_places()[:-1]:
+            self.assertTrue(game.cpu.purchase_place(place))
+
+        self.assertIs(game.fast_forward(10000, RandomCPUPolicy(0), RandomCPUPolicy(1)), game.cpu)
+        self.assertTrue(game.cpu.owns_all_places(game))
+        self.assertLess(game.turn, 10000)
+        self.assertIs(game.get_participant_for_turn(game.turn), game.cpu)
+
+
+class SnapshotTest(unittest.TestCase):
+    """
+    This class contains tests of taking games back to earlier states.
+    """
+
+    def test_undo_every_turn(self):
+        # type: () -> None
+        game: Game = Game(Player("PLAYER"), CPU(), create_board(), 5)
+        policy: RandomCPUPolicy = RandomCPUPolicy()
+        saved_games: list = []  # initial value
+        while game.turn < 300:
+            saved_games.append(encode_game(game))
+            game.do(policy)
+
+        while saved_games:
+            game.undo()
+            self.assertEqual(encode_game(game), saved_games.pop())
+
+    def test_restore_snapshot(self):
+        # type: () -> None
+        game: Game = Game(Player("PLAYER"), CPU(), create_board(), 5)
+        game.player.coins = MPF_BACKEND.number("1e10")
+        self.assertTrue(game.player.purchase_place(game.board.get_place(0)))
+        game.player.accrue_income(3)
+        saved_game: bytes = encode_game(game)
+        game.restore(game.snapshot())
+        self.assertEqual(encode_game(game), saved_game)
+
+        snapshot: GameSnapshot = game.snapshot()
+        policy: RandomCPUPolicy = RandomCPUPolicy()
+        while game.turn < 200:
+            game.step(policy)
+        game.restore(snapshot)
+        self.assertEqual(encode_game(game), saved_game)
+
+    def test_clone_is_independent(self):
+        # type: () -> None
+        game: Game = Game(Player("PLAYER"), CPU(), create_board(), 5)
+        policy: RandomCPUPolicy = RandomCPUPolicy()
+        while game.turn < 100:
+            game.step(policy)
+
+        saved_game: bytes = encode_game(game)
+        clone: Game = game.clone()
+        while clone.turn < 300:
+            clone.step(policy)
+        self.assertEqual(encode_game(game), saved_game)
+        while game.turn < 300:
+            game.step(policy)
+        self.assertEqual(encode_game(game), encode_game(clone))
+
+
+class TurnSchedulerTest(unittest.TestCase):
+    """
+    This class contains tests of games of any number of participants.
+    """
+
+    def create_game(self, n_participants):
+        # type: (int) -> Game
+        game: Game = Game(Player("PLAYER"), CPU(), create_board(), 5)
+        for seat in range(2, n_participants):
+            self.assertEqual(game.add_participant(CPU()), seat)
+        return game
+
+    def test_turn_order(self):
+        # type: () -> None
+        game: Game = self.create_game(5)
+        policy: RandomCPUPolicy = RandomCPUPolicy()
+        for turn in range(1, 201):
+            report: TurnReport = game.step(policy)
+            self.assertIs(report.participant, game.participants[(turn - 1) % 5])
+            self.assertEqual(game.get_seat(report.participant), (turn - 1) % 5)
+            self.assertEqual(game.get_min_level(), min(participant.level for participant in game.participants))
+
+        game.update_game_level()
+        self.assertEqual(game.game_level, 1 + min(participant.level for participant in game.participants) // 10)
+        self.assertRaises(ValueError, game.add_participant, CPU())
+
+    def test_seat_participant_once(self):
+        # type: () -> None
+        game: Game = self.create_game(2)
+        self.assertRaises(ValueError, game.add_participant, game.cpu)
+        self.assertEqual(len(game.participants), 2)
+
+    def test_fast_forward_with_many_participants(self):
+        # type: () -> None
+        policy: RandomCPUPolicy = RandomCPUPolicy()
+        for n_participants in (3, 4, 7):
+            game: Game = self.create_game(n_participants)
+            stepped_game: Game = game.clone()
+            self.assertIsNone(game.fast_forward(1000, policy))
+            while stepped_game.turn < game.turn:
+                stepped_game.step(policy)
+            self.assertEqual(encode_paid_game(game), encode_paid_game(stepped_game))
+
+    def test_simulate_many_participants(self):
+        # type: () -> None
+        simulation_report: SimulationReport = simulate(2, 200, 1, None, None, 4)
+        self.assertEqual(simulation_report.n_games, 2)
+        self.assertGreater(simulation_report.total_turns, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+"""
+This file contains tests of the game server of the game "Tenzichi Own The Planet - Board Game Edition".
+Author: DtjiSoftwareDeveloper
+"""
+
+
+# Importing necessary libraries
+
+import os
+import tempfile
+import unittest
+from game_server import OK, GameServer, Session, connect_unix
+from tenzichi_own_the_planet_board_game_edition import CPU, MPF_BACKEND, Game, Player, RandomCPUPolicy, \
+    create_board
+
+
+class SessionTest(unittest.TestCase):
+    """
+    This class contains tests of sessions played without a connection.
+    """
+
+    def test_roll_stops_at_winner(self):
+        # type: () -> None
+        # The player declines every decision, so only the CPU buys places.
+        game: Game = Game(Player("PLAYER"), CPU(), create_board(), 7)
+        game.cpu.coins = MPF_BACKEND.number("1e100000")
+        for place in game.board.get_places()[:-1]:
+            self.assertTrue(game.cpu.purchase_place(place))
+
+        session: Session = Session("00", game, RandomCPUPolicy(1.0))
+        lines: list = []  # initial value
+        while session.winner is None:
+            lines = session.roll()
+            if session.pending_report is not None:
+                session.decide(False)
+
+        self.assertIs(session.winner, game.cpu)
+        self.assertEqual(lines[-1], "WINNER " + session.winner.name)
+        self.assertIs(game.get_participant_for_turn(game.turn), session.winner)
+        self.assertIsNone(session.pending_report)
+        self.assertRaises(ValueError, session.roll)
+
+    def test_resumed_finished_session(self):
+        # type: () -> None
+        game: Game = Game(Player("PLAYER"), CPU(), create_board(), 7)
+        game.cpu.coins = MPF_BACKEND.number("1e100000")
+        for place in game.board.get_places():
+            self.assertTrue(game.cpu.purchase_place(place))
+
+        session: Session = Session("00", game, RandomCPUPolicy())
+        self.assertIs(session.winner, game.cpu)
+        self.assertRaises(ValueError, session.roll)
+
+
+class GameServerTest(unittest.IsolatedAsyncioTestCase):
+    """
+    This class contains tests of the game server over a loopback Unix socket connection.
+    """
+
+    async def asyncSetUp(self):
+        # type: () -> None
+        self.directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.game_server: GameServer = GameServer(os.path.join(self.directory.name, "sessions"))
+        self.socket_path: str = os.path.join(self.directory.name, "server.sock")
+        self.server = await self.game_server.start_unix(self.socket_path)
+
+    async def asyncTearDown(self):
+        # type: () -> None
+        self.server.close()
+        await self.server.wait_closed()
+        self.directory.cleanup()
+
+    async def test_new_roll_save_resume(self):
+        # type: () -> None
+        client = await connect_unix(self.socket_path)
+        lines: list = await client.request("NEW ALICE")
+        self.assertEqual(lines[-1], OK)
+        session_id: str = lines[0].split(" ")[1]
+        for i in range(5):
+            lines = await client.request("ROLL")
+            self.assertEqual(lines[-1], OK)
+            if any(line.startswith("DECISION") for line in lines):
+                self.assertEqual(await client.request("NO"), [OK])
+        self.assertEqual(await client.request("SAVE"), [OK])
+        state: list = await client.request("STATE")
+        self.assertEqual(state[0], "TURN 9")
+
+        # The session cannot be resumed while it is being played.
+        other_client = await connect_unix(self.socket_path)
+        self.assertEqual(await other_client.request("RESUME " + session_id),
+                         ["ERROR The session is being played by another connection."])
+        await client.close()
+
+        self.assertEqual(await other_client.request("RESUME " + session_id), ["SESSION " + session_id, OK])
+        self.assertEqual(await other_client.request("STATE"), state)
+        self.assertEqual((await other_client.request("ROLL"))[-1], OK)
+        await other_client.close()
+
+    async def test_quit_when_save_fails(self):
+        # type: () -> None
+        client = await connect_unix(self.socket_path)
+        session_id: str = (await client.request("NEW ALICE"))[0].split(" ")[1]
+        os.mkdir(self.game_server.get_save_file_name(session_id))  # the save file cannot replace a directory
+        with self.assertLogs("game_server", "ERROR"):
+            self.assertEqual(await client.request("QUIT"), ["ERROR The session could not be saved."])
+        self.assertEqual(self.game_server.active_session_ids, set())
+        self.assertEqual(self.game_server.n_connections, 0)
+        client.writer.close()
+        await client.writer.wait_closed()
+
+    async def test_resume_corrupt_save(self):
+        # type: () -> None
+        session_id: str = "0123456789abcdef"
+        with open(self.game_server.get_save_file_name(session_id), "wb") as file:
+            file.write(b"TOTP\x01\x00\xff")
+
+        client = await connect_unix(self.socket_path)
+        self.assertEqual(await client.request("RESUME " + session_id), ["ERROR Corrupt save."])
+        self.assertEqual(await client.request("RESUME ffff"), ["ERROR Unknown session ID."])
+        self.assertEqual(self.game_server.active_session_ids, set())
+        await client.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+"""
+This file contains tests of the game store of the game "Tenzichi Own The Planet - Board Game Edition".
+Author: DtjiSoftwareDeveloper
+"""
+
+
+# Importing necessary libraries
+
+import os
+import sqlite3
+import tempfile
+import unittest
+from game_store import GameStore, SavedGameSummary, import_save_files
+from tenzichi_own_the_planet_board_game_edition import CPU, Game, Player, RandomCPUPolicy, create_board, \
+    encode_game, save_game_data
+
+
+# Game saved by the first version of the game, which pickled the whole game
+FIRST_VERSION_SAVE_FILE_NAME: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_data",
+                                                 "first_version.save")
+
+
+def play_game(name, n_turns):
+    # type: (str, int) -> Game
+    # Returns a game of a player called 'name' after 'n_turns' turns.
+    game: Game = Game(Player(name), CPU(), create_board(), n_turns)
+    policy: RandomCPUPolicy = RandomCPUPolicy()
+    while game.turn < n_turns:
+        game.step(policy)
+    return game
+
+
+class GameStoreTest(unittest.TestCase):
+    """
+    This class contains tests of saving games into a game store and querying them.
+    """
+
+    def setUp(self):
+        # type: () -> None
+        self.directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.file_name: str = os.path.join(self.directory.name, "games.db")
+
+    def tearDown(self):
+        # type: () -> None
+        self.directory.cleanup()
+
+    def count_written(self):
+        # type: () -> int
+        # Returns the number of games written into the database, as another process would see them.
+        connection: sqlite3.Connection = sqlite3.connect(self.file_name)
+        try:
+            return connection.execute("SELECT COUNT(*) FROM games").fetchone()[0]
+        finally:
+            connection.close()
+
+    def test_batches_and_lookups(self):
+        # type: () -> None
+        store: GameStore = GameStore(self.file_name, 3)
+        games: list = [play_game("PLAYER " + str(index), 10 * (index + 1)) for index in range(5)]
+        store.put(games[0])
+        store.put(games[1])
+        self.assertEqual(self.count_written(), 0)
+        self.assertEqual(encode_game(store.load(games[1].player.player_id)), encode_game(games[1]))
+        self.assertEqual(store.get_summary(games[1].player.player_id).turn, 20)
+        store.put(games[2])
+        self.assertEqual(self.count_written(), 3)
+
+        store.put(games[3])
+        store.put(games[4])
+        summary: SavedGameSummary = store.get_summary(games[4].player.player_id)
+        self.assertEqual((summary.name, summary.level, summary.turn, summary.game_level, summary.places_owned),
+                         ("PLAYER 4", games[4].player.level, 50, games[4].game_level,
+                          games[4].player.count_owned()))
+        self.assertEqual([summary.turn for summary in store.get_leaderboard("turn", 3)], [50, 40, 30])
+        self.assertEqual(self.count_written(), 5)
+        self.assertEqual([summary.player_id for summary in store.find_by_name("PLAYER 3")],
+                         [games[3].player.player_id])
+        self.assertIsNone(store.load("NO PLAYER"))
+        self.assertRaises(ValueError, store.get_leaderboard, "coins")
+
+        # A game put again replaces the game saved under the same player ID.
+        while games[0].turn < 100:
+            games[0].step(RandomCPUPolicy())
+        store.put(games[0])
+        self.assertTrue(store.delete(games[1].player.player_id))
+        self.assertFalse(store.delete(games[1].player.player_id))
+        store.close()
+
+        store = GameStore(self.file_name, 3)
+        self.assertEqual(store.count(), 4)
+        self.assertEqual(encode_game(store.load(games[0].player.player_id)), encode_game(games[0]))
+        self.assertEqual(store.get_leaderboard("turn", 1)[0].player_id, games[0].player.player_id)
+        store.close()
+
+    def test_import_save_files(self):
+        # type: () -> None
+        game: Game = play_game("PLAYER", 40)
+        file_name: str = os.path.join(self.directory.name, "game.save")
+        save_game_data(game, file_name)
+        store: GameStore = GameStore(self.file_name)
+        self.assertEqual(import_save_files(store, [file_name, FIRST_VERSION_SAVE_FILE_NAME]), 2)
+        self.assertEqual(self.count_written(), 2)
+        summary: SavedGameSummary = store.get_summary(game.player.player_id)
+        self.assertEqual((summary.name, summary.level, summary.turn, summary.places_owned),
+                         ("PLAYER", game.player.level, 40, game.player.count_owned()))
+        self.assertEqual([(summary.name, summary.turn) for summary in store.find_by_name("ALICE")], [("ALICE", 12)])
+        store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+"""
+This file contains tests of the generated boards of the game "Tenzichi Own The Planet - Board Game Edition".
+Author: DtjiSoftwareDeveloper
+"""
+
+
+# Importing necessary libraries
+
+import os
+import struct
+import tempfile
+import unittest
+from unittest import mock
+import tenzichi_own_the_planet_board_game_edition
+from tenzichi_own_the_planet_board_game_edition import BOARD_FILE_HEADER_STRUCT, CPU, DICE_FACES, \
+    MAX_TRANSITION_TABLE_TILES, PLACE_CODE, SHINY_ZONE_CODE, SHINY_ZONE_OFFSET, SHINY_ZONE_PERIOD, START_TILE_CODE, \
+    TILE_ARRAYS, UPGRADE_SHOP_CODE, UPGRADE_SHOP_OFFSET, UPGRADE_SHOP_PERIOD, CompiledBoard, Game, GeneratedBoard, \
+    RandomCPUPolicy, TileArrays, decode_game, encode_game, generate_board, generate_tile_arrays, \
+    get_place_exponents, load_board, load_tile_arrays, save_tile_arrays
+
+
+def get_arrays(tile_arrays):
+    # type: (TileArrays) -> list
+    # Returns the arrays of 'tile_arrays' as lists.
+    return [list(values) for values in (tile_arrays.tile_codes, tile_arrays.place_positions,
+                                        tile_arrays.coin_cost_exponents, tile_arrays.coins_per_turn_exponents,
+                                        tile_arrays.exp_per_turn_exponents)]
+
+
+class GeneratedBoardTest(unittest.TestCase):
+    """
+    This class contains tests of generating boards and saving them into board files.
+    """
+
+    def setUp(self):
+        # type: () -> None
+        self.directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        # type: () -> None
+        self.directory.cleanup()
+
+    def test_generation_is_reproducible(self):
+        # type: () -> None
+        arrays: list = get_arrays(generate_tile_arrays(5000, 3))
+        self.assertEqual(get_arrays(generate_tile_arrays(5000, 3)), arrays)
+        self.assertNotEqual(get_arrays(generate_tile_arrays(5000, 4)), arrays)
+        with mock.patch.object(tenzichi_own_the_planet_board_game_edition, "NUMPY", None):
+            self.assertEqual(get_arrays(generate_tile_arrays(5000, 3)), arrays)
+        self.assertRaises(ValueError, generate_tile_arrays, 0, 3)
+
+    def test_layout(self):
+        # type: () -> None
+        tile_codes, place_positions, coin_cost_exponents, coins_per_turn_exponents, exp_per_turn_exponents = \
+            get_arrays(generate_tile_arrays(5000, 3))
+        self.assertEqual(tile_codes[0], START_TILE_CODE)
+        for position in range(1, 5000):
+            if position % UPGRADE_SHOP_PERIOD == UPGRADE_SHOP_OFFSET:
+                self.assertEqual(tile_codes[position], UPGRADE_SHOP_CODE)
+            elif position % SHINY_ZONE_PERIOD == SHINY_ZONE_OFFSET:
+                self.assertEqual(tile_codes[position], SHINY_ZONE_CODE)
+        self.assertEqual(place_positions, [position for position, tile_code in enumerate(tile_codes)
+                                           if tile_code == PLACE_CODE])
+        self.assertGreater(len(place_positions), 1000)
+        for index, exponents in enumerate((coin_cost_exponents, coins_per_turn_exponents, exp_per_turn_exponents)):
+            self.assertEqual(exponents, [get_place_exponents(ordinal, index) for ordinal in range(len(exponents))])
+
+    def test_board_file(self):
+        # type: () -> None
+        file_name: str = os.path.join(self.directory.name, "board.totb")
+        tile_arrays: TileArrays = generate_tile_arrays(1001, 12345)
+        save_tile_arrays(tile_arrays, file_name)
+        self.addCleanup(TILE_ARRAYS.pop, (1001, 12345), None)
+        with open(file_name, "rb") as file:
+            contents: bytes = file.read()
+        # The arrays are little-endian whichever machine wrote the file.
+        offset: int = BOARD_FILE_HEADER_STRUCT.size + 1001 + 7
+        self.assertEqual(len(contents), offset + 4 * 8 * tile_arrays.n_places)
+        self.assertEqual(struct.unpack_from("<q", contents, offset)[0], tile_arrays.place_positions[0])
+        self.assertEqual(struct.unpack_from("<q", contents, len(contents) - 8)[0],
+                         tile_arrays.exp_per_turn_exponents[-1])
+
+        loaded: TileArrays = load_tile_arrays(file_name)
+        self.assertEqual(get_arrays(loaded), get_arrays(tile_arrays))
+        self.assertEqual((loaded.n_tiles, loaded.seed), (1001, 12345))
+        self.assertIs(load_tile_arrays(file_name), loaded)
+
+        bad_file_name: str = os.path.join(self.directory.name, "bad.totb")
+        with open(bad_file_name, "wb") as file:
+            file.write(b"TOTP" + contents[4:])
+        self.assertRaises(ValueError, load_tile_arrays, bad_file_name)
+
+    def test_game_on_loaded_board(self):
+        # type: () -> None
+        file_name: str = os.path.join(self.directory.name, "board.totb")
+        save_tile_arrays(generate_tile_arrays(3000, 54321), file_name)
+        self.addCleanup(TILE_ARRAYS.pop, (3000, 54321), None)
+        game: Game = Game(CPU(), CPU(), load_board(file_name), 2)
+        policy: RandomCPUPolicy = RandomCPUPolicy()
+        while game.turn < 300:
+            game.step(policy)
+
+        loaded: Game = decode_game(encode_game(game))
+        self.assertEqual(encode_game(loaded), encode_game(game))
+        while game.turn < 500:
+            game.step(policy)
+            loaded.step(policy)
+        self.assertEqual(encode_game(loaded), encode_game(game))
+
+    def test_places_are_lazy(self):
+        # type: () -> None
+        board: GeneratedBoard = generate_board(10 ** 6, 5)
+        self.assertEqual(len(board.get_tiles()), 10 ** 6)
+        self.assertEqual(board.get_loaded_places(), [])
+        position: int = board.tile_arrays.place_positions[1234]
+        self.assertIs(board.get_tile(position), board.get_places()[1234])
+        self.assertIs(board.get_tiles()[SHINY_ZONE_OFFSET], board.get_tiles()[SHINY_ZONE_OFFSET + SHINY_ZONE_PERIOD])
+        self.assertEqual(len(board.get_loaded_places()), 1)
+
+        game: Game = Game(CPU(), CPU(), board, 5)
+        policy: RandomCPUPolicy = RandomCPUPolicy()
+        while game.turn < 300:
+            game.step(policy)
+        self.assertLess(len(board.get_loaded_places()), 300)
+
+    def test_large_boards_compute_moves(self):
+        # type: () -> None
+        compiled: CompiledBoard = generate_board(MAX_TRANSITION_TABLE_TILES + 1, 5).get_compiled_board()
+        self.assertIsNone(compiled.transitions)
+        self.assertEqual(compiled.move(MAX_TRANSITION_TABLE_TILES, DICE_FACES), (DICE_FACES - 1, True))
+        self.assertEqual(compiled.move(0, DICE_FACES), (DICE_FACES, False))
+        self.assertIsNotNone(generate_board(MAX_TRANSITION_TABLE_TILES, 5).get_compiled_board().transitions)
+
+
+if __name__ == '__main__':
+    unittest.main()
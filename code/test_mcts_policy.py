@@ -0,0 +1,91 @@
+"""
+This file contains tests of the Monte Carlo tree search CPU of the game "Tenzichi Own The Planet - Board Game Edition".
+Author: DtjiSoftwareDeveloper
+"""
+
+
+# Importing necessary libraries
+
+import os
+import tempfile
+import unittest
+from mcts_policy import MCTSPolicy
+from tenzichi_own_the_planet_board_game_edition import CPU, MPF_BACKEND, AutoSaver, Game, Player, RandomCPUPolicy, \
+    TurnMetrics, create_board, encode_game, generate_board, load_game_data
+
+
+def create_game_waiting_on_place():
+    # type: () -> Game
+    # Creates a game whose player stands on the first place with enough coins to buy it.
+    game: Game = Game(Player("PLAYER"), CPU(), create_board(), 5)
+    game.player.coins = MPF_BACKEND.number("1e10")
+    game.player.position = game.board.get_compiled_board().place_positions[0]
+    return game
+
+
+class MCTSPolicyTest(unittest.TestCase):
+    """
+    This class contains tests of the decisions of the Monte Carlo tree search CPU.
+    """
+
+    def test_decisions_keep_undo_and_autosave(self):
+        # type: () -> None
+        directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        for board in (create_board(), generate_board(500, 2)):
+            game: Game = Game(CPU(), CPU(), board, 5)
+            random_policy: RandomCPUPolicy = RandomCPUPolicy()
+            while game.turn < 40:
+                game.do(random_policy)
+            file_name: str = os.path.join(directory.name, "game.save")
+            autosaver: AutoSaver = AutoSaver(file_name, 0, 0, 100)
+            autosaver.save(game)  # a full save
+
+            policy: MCTSPolicy = MCTSPolicy(0.002, seed=1)
+            saved_games: list = []  # initial value
+            while game.turn < 100:
+                saved_games.append(encode_game(game))
+                game.do(policy)
+            autosaver.save(game)  # a delta
+            autosaver.close()
+            self.assertTrue(os.path.exists(file_name + ".delta"))
+            self.assertEqual(encode_game(load_game_data(file_name)), encode_game(game))
+            while saved_games:
+                game.undo()
+                self.assertEqual(encode_game(game), saved_games.pop())
+
+    def test_search_is_not_reported_or_measured(self):
+        # type: () -> None
+        game: Game = Game(Player("PLAYER"), CPU(), create_board(), 3)
+        game.reports = []
+        game.metrics = TurnMetrics()
+        policy: MCTSPolicy = MCTSPolicy(0.002, seed=1)
+        while game.turn < 30:
+            game.step(policy)
+
+        self.assertEqual(len(game.reports), 30)
+        self.assertEqual(game.metrics.counters["turns"], 30)
+
+    def test_decision_searches(self):
+        # type: () -> None
+        game: Game = create_game_waiting_on_place()
+        policy: MCTSPolicy = MCTSPolicy(0.02, seed=1)
+        self.assertIsInstance(policy.should_purchase_place(game, game.player, game.board.get_place(0)), bool)
+        self.assertGreater(policy.last_simulations, 0)
+        self.assertEqual(game.player.coins, MPF_BACKEND.number("1e10"))
+
+    def test_workers_until_closed(self):
+        # type: () -> None
+        game: Game = create_game_waiting_on_place()
+        with MCTSPolicy(1.0, 1, seed=1) as policy:
+            policy.should_purchase_place(game, game.player, game.board.get_place(0))
+            self.assertGreater(policy.last_worker_simulations, 0)
+
+        policy.time_budget = 0.02
+        policy.should_purchase_place(game, game.player, game.board.get_place(0))
+        self.assertGreater(policy.last_simulations, 0)
+        self.assertEqual(policy.last_worker_simulations, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+This file contains tests of the numeric backends of the game "Tenzichi Own The Planet - Board Game Edition".
+Author: DtjiSoftwareDeveloper
+"""
+
+
+# Importing necessary libraries
+
+import unittest
+from mpmath import mpf
+from tenzichi_own_the_planet_board_game_edition import MPF_BACKEND, SCIENTIFIC_BACKEND, ScientificNumber, \
+    get_numeric_backend
+
+
+# Values of coins, EXP and costs met during games, as strings both backends read
+VALUES: tuple = ("0", "1", "-2.5", "7.25e3", "1e6", "3.5e-4", "9.99e99", "1e815", "-4e100000", "1.5e123456")
+
+
+def to_mpf(number):
+    # type: (ScientificNumber) -> mpf
+    return mpf(number.mantissa) * mpf(10) ** number.exponent
+
+
+class ScientificNumberTest(unittest.TestCase):
+    """
+    This class contains tests of scientific numbers against mpf numbers.
+    """
+
+    def assert_close(self, number, expected):
+        # type: (ScientificNumber, mpf) -> None
+        self.assertIsInstance(number, ScientificNumber)
+        self.assertLessEqual(abs(to_mpf(number) - expected), abs(expected) * mpf("1e-12"),
+                             str(number) + " != " + str(expected))
+
+    def test_arithmetic(self):
+        # type: () -> None
+        for a_string in VALUES:
+            a: ScientificNumber = SCIENTIFIC_BACKEND.number(a_string)
+            self.assert_close(a, mpf(a_string))
+            self.assert_close(-a, -mpf(a_string))
+            self.assert_close(a * 3, mpf(a_string) * 3)
+            self.assert_close(a ** 3, mpf(a_string) ** 3)
+            for b_string in VALUES:
+                b: ScientificNumber = SCIENTIFIC_BACKEND.number(b_string)
+                self.assert_close(a + b, mpf(a_string) + mpf(b_string))
+                self.assert_close(a - b, mpf(a_string) - mpf(b_string))
+                self.assert_close(a * b, mpf(a_string) * mpf(b_string))
+                if b:
+                    self.assert_close(a / b, mpf(a_string) / mpf(b_string))
+                self.assertEqual(a < b, mpf(a_string) < mpf(b_string))
+                self.assertEqual(a >= b, mpf(a_string) >= mpf(b_string))
+                self.assertEqual(a == b, mpf(a_string) == mpf(b_string))
+
+    def test_mixed_arithmetic(self):
+        # type: () -> None
+        a: ScientificNumber = SCIENTIFIC_BACKEND.number("2.5e3")
+        self.assertEqual(a + 500, 3000)
+        self.assertEqual(1000 - a, -1500)
+        self.assertEqual(5000 / a, 2)
+        self.assertEqual(a * 0.5, 1250.0)
+        self.assert_close(a * 10 ** 400, mpf("2.5e403"))
+        self.assert_close(a * -10 ** 400, mpf("-2.5e403"))
+        self.assertTrue(a > 2499.5)
+
+    def test_powers_and_lists(self):
+        # type: () -> None
+        self.assertEqual(SCIENTIFIC_BACKEND.power_of_ten(100000), SCIENTIFIC_BACKEND.number("1e100000"))
+        self.assertEqual(MPF_BACKEND.power_of_ten(100000), MPF_BACKEND.number("1e100000"))
+        numbers: list = [SCIENTIFIC_BACKEND.number(value) for value in VALUES[1:]]
+        self.assert_close(SCIENTIFIC_BACKEND.sum_of_list(numbers), MPF_BACKEND.sum_of_list(
+            [MPF_BACKEND.number(value) for value in VALUES[1:]]))
+        self.assert_close(SCIENTIFIC_BACKEND.product_of_list(numbers), MPF_BACKEND.product_of_list(
+            [MPF_BACKEND.number(value) for value in VALUES[1:]]))
+        self.assertEqual(SCIENTIFIC_BACKEND.sum_of_list([]), 0)
+        self.assertEqual(SCIENTIFIC_BACKEND.product_of_list([]), 1)
+
+    def test_unhashable(self):
+        # type: () -> None
+        self.assertRaises(TypeError, hash, ScientificNumber(1.0))
+        self.assertEqual(ScientificNumber(1.0), 1)
+        self.assertEqual(ScientificNumber(1.0), 1.0)
+
+    def test_get_numeric_backend(self):
+        # type: () -> None
+        self.assertIs(get_numeric_backend(MPF_BACKEND.name), MPF_BACKEND)
+        self.assertIs(get_numeric_backend(SCIENTIFIC_BACKEND.name), SCIENTIFIC_BACKEND)
+        self.assertRaises(ValueError, get_numeric_backend, "decimal")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+This file contains tests of the players of the game "Tenzichi Own The Planet - Board Game Edition".
+Author: DtjiSoftwareDeveloper
+"""
+
+
+# Importing necessary libraries
+
+import unittest
+from tenzichi_own_the_planet_board_game_edition import CPU, MPF_BACKEND, SCIENTIFIC_BACKEND, Board, Game, \
+    NumericBackend, Player, RandomCPUPolicy, UpgradeShop, create_board
+
+
+def get_income(player):
+    # type: (Player) -> tuple
+    # Returns the coins and EXP per turn of 'player' computed from scratch from his/her places and upgrades.
+    backend: NumericBackend = player.numeric_backend
+    return (backend.sum_of_list([place.coins_per_turn for place in player.get_owned_list()]) *
+            backend.product_of_list([upgrade.coin_gain_multiplier for upgrade in player.get_upgrade_list()]),
+            backend.sum_of_list([place.exp_per_turn for place in player.get_owned_list()]) *
+            backend.product_of_list([upgrade.exp_gain_multiplier for upgrade in player.get_upgrade_list()]))
+
+
+class IncomeAggregatesTest(unittest.TestCase):
+    """
+    This class contains tests of the incomes kept up to date by players.
+    """
+
+    def assert_income_up_to_date(self, player):
+        # type: (Player) -> None
+        coins_per_turn, exp_per_turn = get_income(player)
+        self.assertLessEqual(abs(player.get_coins_per_turn() - coins_per_turn), abs(coins_per_turn) * 1e-9)
+        self.assertLessEqual(abs(player.get_exp_per_turn() - exp_per_turn), abs(exp_per_turn) * 1e-9)
+        player.verify_income_aggregates()
+
+    def test_income_follows_places_and_upgrades(self):
+        # type: () -> None
+        for backend in (MPF_BACKEND, SCIENTIFIC_BACKEND):
+            board: Board = create_board(backend)
+            player: Player = Player("PLAYER", backend)
+            cpu: CPU = CPU(backend)
+            player.coins = backend.number("1e100000")
+            cpu.coins = backend.number("1e100000")
+            places: list = board.get_places()
+            upgrade_shop: UpgradeShop = [tile for tile in board.get_tiles() if isinstance(tile, UpgradeShop)][0]
+            for place in places[:10]:
+                self.assertTrue(player.purchase_place(place))
+                self.assert_income_up_to_date(player)
+            for upgrade in upgrade_shop.get_upgrades_sold()[:3]:
+                self.assertTrue(player.buy_upgrade(upgrade))
+                self.assert_income_up_to_date(player)
+            for place in places[:10:2]:
+                self.assertTrue(player.upgrade_place(place))
+                self.assert_income_up_to_date(player)
+            for place in places[:10:3]:
+                self.assertTrue(cpu.acquire_place(place, player))
+                self.assert_income_up_to_date(player)
+                self.assert_income_up_to_date(cpu)
+            self.assertEqual(len(player.get_owned_list()) + len(cpu.get_owned_list()), 10)
+
+    def test_income_during_games(self):
+        # type: () -> None
+        for backend in (MPF_BACKEND, SCIENTIFIC_BACKEND):
+            game: Game = Game(CPU(backend), CPU(backend), create_board(backend))
+            policy: RandomCPUPolicy = RandomCPUPolicy()
+            while game.turn < 300:
+                game.step(policy)
+                self.assert_income_up_to_date(game.player)
+                self.assert_income_up_to_date(game.cpu)
+
+
+class LevelUpTest(unittest.TestCase):
+    """
+    This class contains tests of levelling up in closed form against levelling up one level at a time.
+    """
+
+    def test_level_up_matches_loop(self):
+        # type: () -> None
+        for backend in (MPF_BACKEND, SCIENTIFIC_BACKEND):
+            for level in (1, 2, 10, 300):
+                for exp in ("0", "9.99e5", "1e6", "1e8", "1e9", "3e20", "1e1000", "1e100000", "5e123456"):
+                    player: Player = Player("PLAYER", backend)
+                    player.level = level
+                    player.required_exp = backend.power_of_ten(6 + level * (level + 1) // 2 - 1)
+                    player.exp = backend.number(exp)
+
+                    # Levelling up one level at a time
+                    expected_level: int = player.level
+                    expected_required_exp: object = player.required_exp
+                    while player.exp >= expected_required_exp:
+                        expected_level += 1
+                        expected_required_exp *= backend.power_of_ten(expected_level)
+
+                    player.level_up()
+                    self.assertEqual(player.level, expected_level, exp)
+                    self.assertLessEqual(abs(player.required_exp - expected_required_exp),
+                                         expected_required_exp * 1e-9, exp)
+                    self.assertLess(player.exp, player.required_exp)
+
+
+if __name__ == '__main__':
+    unittest.main()
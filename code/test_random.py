@@ -0,0 +1,84 @@
+"""
+This file contains tests of the random number generators of the game "Tenzichi Own The Planet - Board Game Edition".
+Author: DtjiSoftwareDeveloper
+"""
+
+
+# Importing necessary libraries
+
+import unittest
+from unittest import mock
+import tenzichi_own_the_planet_board_game_edition
+from tenzichi_own_the_planet_board_game_edition import CPU, DICE_DRAWS, DICE_FACES, GOLDEN_GAMMA, MASK_64, \
+    CounterRandomStream, Game, RandomCPUPolicy, RandomService, create_board, get_stream_key, mix64, \
+    value_to_randint
+
+
+def play(game, n_turns):
+    # type: (Game, int) -> list
+    # Plays 'n_turns' turns of 'game' and returns the level, EXP, coins, position and places of every participant.
+    policy: RandomCPUPolicy = RandomCPUPolicy()
+    while game.turn < n_turns:
+        game.step(policy)
+    return [(participant.level, participant.exp, participant.coins, participant.position,
+             [place.ordinal for place in participant.get_owned_list()]) for participant in game.participants]
+
+
+class CounterRandomStreamTest(unittest.TestCase):
+    """
+    This class contains tests of the counter-based streams of random draws.
+    """
+
+    def test_values_follow_counters(self):
+        # type: () -> None
+        key: int = get_stream_key(5, 0, 1, DICE_DRAWS)
+        for turn_stride in (1, 3):
+            for block_size in (1, 8, 4096):
+                stream: CounterRandomStream = CounterRandomStream(key, 2, turn_stride, block_size)
+                for turn in list(range(0, 90, turn_stride)) + [30, 0, 60]:
+                    stream.seek(turn)
+                    self.assertEqual([stream.next_value(), stream.next_value()],
+                                     [mix64((key + (turn * 2 + draw) * GOLDEN_GAMMA) & MASK_64) for draw in (0, 1)])
+
+    def test_values_without_numpy(self):
+        # type: () -> None
+        key: int = get_stream_key(5, 0, 1, DICE_DRAWS)
+        streams: list = [CounterRandomStream(key, 2), CounterRandomStream(key, 2)]
+        with mock.patch.object(tenzichi_own_the_planet_board_game_edition, "NUMPY", None):
+            values: list = [streams[0].next_value() for i in range(100)]
+        self.assertEqual([streams[1].next_value() for i in range(100)], values)
+
+    def test_pregenerated_dice(self):
+        # type: () -> None
+        rng: RandomService = RandomService(5)
+        turns: list = list(range(1, 400, 2))
+        dice_values: list = rng.pregenerate_dice(0, turns)
+        with mock.patch.object(tenzichi_own_the_planet_board_game_edition, "NUMPY", None):
+            self.assertEqual(rng.pregenerate_dice(0, turns), dice_values)
+        self.assertEqual(dice_values, [value_to_randint(mix64((rng.get_stream(0, DICE_DRAWS).key + turn *
+                                                               GOLDEN_GAMMA) & MASK_64), 1, DICE_FACES)
+                                       for turn in turns])
+        self.assertEqual(set(dice_values), set(range(1, DICE_FACES + 1)))
+
+
+class RandomServiceTest(unittest.TestCase):
+    """
+    This class contains tests of the random number generators of games.
+    """
+
+    def test_games_are_reproducible(self):
+        # type: () -> None
+        state: list = play(Game(CPU(), CPU(), create_board(), 5, 3), 300)
+        self.assertEqual(play(Game(CPU(), CPU(), create_board(), 5, 3), 300), state)
+        self.assertNotEqual(play(Game(CPU(), CPU(), create_board(), 5, 4), 300), state)
+        self.assertNotEqual(play(Game(CPU(), CPU(), create_board(), 6, 3), 300), state)
+
+    def test_draws_do_not_depend_on_block_size(self):
+        # type: () -> None
+        game: Game = Game(CPU(), CPU(), create_board(), 5)
+        game.rng.set_block_size(1)
+        self.assertEqual(play(game, 300), play(Game(CPU(), CPU(), create_board(), 5), 300))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,187 @@
+"""
+This file contains tests of the save format of the game "Tenzichi Own The Planet - Board Game Edition".
+Author: DtjiSoftwareDeveloper
+"""
+
+
+# Importing necessary libraries
+
+import os
+import tempfile
+import unittest
+from tenzichi_own_the_planet_board_game_edition import CPU, DEFAULT_ECONOMY, DELTA_FILE_SUFFIX, MPF_BACKEND, \
+    SAVE_FORMAT_MAGIC, SAVE_FORMAT_VERSION, SAVE_HEADER_STRUCT, SCIENTIFIC_BACKEND, AutoSaver, Economy, Game, Player, \
+    RandomCPUPolicy, create_board, decode_game, encode_game, generate_board, load_game_data, save_game_data
+
+
+# Game saved by the first version of the game, which pickled the whole game
+FIRST_VERSION_SAVE_FILE_NAME: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_data",
+                                                 "first_version.save")
+
+
+def get_paid_state(game):
+    # type: (Game) -> list
+    # Returns the coins, EXP, level and position of every participant of 'game' with all income paid.
+    return [(participant.coins, participant.exp, participant.level, participant.position)
+            for participant in game.participants]
+
+
+class SaveFormatTest(unittest.TestCase):
+    """
+    This class contains tests of saving and loading games.
+    """
+
+    def setUp(self):
+        # type: () -> None
+        self.directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        # type: () -> None
+        self.directory.cleanup()
+
+    def test_encode_game_round_trip(self):
+        # type: () -> None
+        policy: RandomCPUPolicy = RandomCPUPolicy()
+        for backend in (MPF_BACKEND, SCIENTIFIC_BACKEND):
+            game: Game = Game(Player("PLAYER", backend), CPU(backend), create_board(backend), 5)
+            while game.turn < 300:
+                game.step(policy)
+
+            buffer: bytes = encode_game(game)
+            loaded: Game = decode_game(buffer)
+            self.assertEqual(encode_game(loaded), buffer)
+            self.assertEqual(loaded.player.name, "PLAYER")
+            self.assertIsInstance(loaded.cpu, CPU)
+            self.assertEqual({place.name for place in loaded.player.get_owned_list()},
+                             {place.name for place in game.player.get_owned_list()})
+            while game.turn < 500:
+                game.step(policy)
+                loaded.step(policy)
+            self.assertEqual(encode_game(loaded), encode_game(game))
+
+    def test_save_game_data_round_trip(self):
+        # type: () -> None
+        game: Game = Game(Player("PLAYER"), CPU(), create_board(), 5)
+        policy: RandomCPUPolicy = RandomCPUPolicy()
+        while game.turn < 200:
+            game.step(policy)
+
+        file_name: str = os.path.join(self.directory.name, "game.save")
+        save_game_data(game, file_name)
+        self.assertEqual(encode_game(load_game_data(file_name)), encode_game(game))
+
+    def test_decode_rejects_other_saves(self):
+        # type: () -> None
+        buffer: bytes = encode_game(Game(Player("PLAYER"), CPU(), create_board()))
+        self.assertRaises(ValueError, decode_game, SAVE_HEADER_STRUCT.pack(SAVE_FORMAT_MAGIC, SAVE_FORMAT_VERSION + 1)
+                          + buffer[SAVE_HEADER_STRUCT.size:])
+        self.assertRaises(ValueError, decode_game, b"ABCD" + buffer[4:])
+
+    def test_load_first_version_save(self):
+        # type: () -> None
+        game: Game = load_game_data(FIRST_VERSION_SAVE_FILE_NAME)
+        self.assertEqual(game.turn, 12)
+        self.assertEqual(game.player.name, "ALICE")
+        self.assertEqual(game.player.position, 7)
+        self.assertEqual(game.player.coins, MPF_BACKEND.number("1e30") - MPF_BACKEND.number("1e5") -
+                         MPF_BACKEND.number("1e16"))
+        self.assertEqual([place.name for place in game.player.get_owned_list()],
+                         ["NAIVAGADI WILD", "SANCTUARY OF SERENITY"])
+        self.assertEqual([place.name for place in game.cpu.get_owned_list()], ["CARDLEY STRAND"])
+        self.assertEqual(game.board.get_place(0).level, 3)
+
+        buffer: bytes = encode_game(game)
+        self.assertEqual(encode_game(decode_game(buffer)), buffer)
+        policy: RandomCPUPolicy = RandomCPUPolicy()
+        while game.turn < 100:
+            game.step(policy)
+
+    def create_game_with_unpaid_income(self):
+        # type: () -> Game
+        game: Game = Game(Player("PLAYER"), CPU(), create_board(), 5)
+        game.player.coins = MPF_BACKEND.number("1e10")
+        self.assertTrue(game.player.purchase_place(game.board.get_place(0)))
+        game.player.accrue_income(3)
+        return game
+
+    def test_encode_game_keeps_unpaid_income(self):
+        # type: () -> None
+        game: Game = self.create_game_with_unpaid_income()
+        self.assertEqual(get_paid_state(decode_game(encode_game(game))), get_paid_state(game))
+
+    def test_save_game_data_keeps_unpaid_income(self):
+        # type: () -> None
+        game: Game = self.create_game_with_unpaid_income()
+        file_name: str = os.path.join(self.directory.name, "game.save")
+        save_game_data(game, file_name)
+        self.assertEqual(get_paid_state(load_game_data(file_name)), get_paid_state(game))
+
+    def test_autosave_keeps_unpaid_income(self):
+        # type: () -> None
+        game: Game = self.create_game_with_unpaid_income()
+        file_name: str = os.path.join(self.directory.name, "game.save")
+        autosaver: AutoSaver = AutoSaver(file_name)
+        autosaver.save(game)  # a full save
+        game.cpu.accrue_income(2)
+        autosaver.save(game)  # a delta
+        autosaver.close()
+        self.assertEqual(get_paid_state(load_game_data(file_name)), get_paid_state(game))
+
+    def test_autosave_full_saves_and_deltas(self):
+        # type: () -> None
+        file_name: str = os.path.join(self.directory.name, "game.save")
+        delta_file_name: str = file_name + DELTA_FILE_SUFFIX
+        autosaver: AutoSaver = AutoSaver(file_name, 10, 0, 3)
+        self.addCleanup(autosaver.close)
+        game: Game = Game(CPU(), CPU(), create_board(), 5)
+        policy: RandomCPUPolicy = RandomCPUPolicy()
+        self.assertFalse(autosaver.maybe_save(game))
+        while game.turn < 120:
+            game.step(policy)
+            if autosaver.maybe_save(game):
+                autosaver.flush()
+                self.assertIsNone(autosaver.error)
+                self.assertEqual(game.turn % 10, 0)
+                # Every third autosave is a full save, which removes the delta saved against the previous one.
+                self.assertEqual(os.path.exists(delta_file_name), autosaver.saves % 3 != 1)
+                self.assertEqual(get_paid_state(load_game_data(file_name)), get_paid_state(game))
+                if autosaver.saves == 2:
+                    with open(delta_file_name, "rb") as file:
+                        stale_delta: bytes = file.read()
+        self.assertEqual(autosaver.saves, 12)
+        self.assertEqual(sorted(os.listdir(self.directory.name)), ["game.save", "game.save.delta"])
+
+        # A delta saved against a full save which was replaced since is ignored.
+        autosaver.save(game)
+        autosaver.flush()
+        self.assertFalse(os.path.exists(delta_file_name))
+        with open(delta_file_name, "wb") as file:
+            file.write(stale_delta)
+        self.assertEqual(get_paid_state(load_game_data(file_name)), get_paid_state(game))
+
+    def test_encode_game_keeps_economy(self):
+        # type: () -> None
+        economy: Economy = DEFAULT_ECONOMY.replace(
+            upgrades=[("COIN UPGRADE", 3, 7, 1), ("EXP UPGRADE", 8, 1, 9)],
+            place_exponents=[(coin_cost + 1, coins_per_turn, exp_per_turn - 1)
+                             for coin_cost, coins_per_turn, exp_per_turn in DEFAULT_ECONOMY.place_exponents],
+            shiny_exponent_range=(2, 6), start_coin_bonus_exponent=9, cpu_probability=0.5)
+        policy: RandomCPUPolicy = RandomCPUPolicy(economy.cpu_probability)
+        for board in (create_board(None, economy), generate_board(1000, 4, None, economy)):
+            game: Game = Game(CPU(), CPU(), board, 3)
+            while game.turn < 300:
+                game.step(policy)
+
+            loaded: Game = decode_game(encode_game(game))
+            self.assertEqual(loaded.economy, economy)
+            self.assertEqual([upgrade.coin_cost for upgrade in loaded.board.get_upgrade_catalog()],
+                             [upgrade.coin_cost for upgrade in board.get_upgrade_catalog()])
+            self.assertEqual(loaded.board.get_place(0).coin_cost, board.get_place(0).coin_cost)
+            while game.turn < 500:
+                game.step(policy)
+                loaded.step(policy)
+            self.assertEqual(encode_game(loaded), encode_game(game))
+
+
+if __name__ == '__main__':
+    unittest.main()
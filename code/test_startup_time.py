@@ -0,0 +1,36 @@
+"""
+This file contains tests of the startup of the game "Tenzichi Own The Planet - Board Game Edition".
+Author: DtjiSoftwareDeveloper
+"""
+
+
+# Importing necessary libraries
+
+import unittest
+from startup_time import check_startup, measure_startup
+
+
+class StartupTimeTest(unittest.TestCase):
+    """
+    This class contains tests of importing the game in new processes.
+    """
+
+    def test_import_defers_libraries(self):
+        # type: () -> None
+        for measurement in measure_startup(2):
+            self.assertEqual(measurement["imported_modules"], [])
+            self.assertGreater(measurement["new_game_time"], 0)
+
+    def test_check_startup(self):
+        # type: () -> None
+        fast: dict = {"import_time": 0.01, "new_game_time": 0.01, "imported_modules": []}
+        slow: dict = {"import_time": 0.2, "new_game_time": 0.01, "imported_modules": []}
+        eager: dict = {"import_time": 0.01, "new_game_time": 0.01, "imported_modules": ["numpy"]}
+        self.assertEqual(check_startup([fast, fast, slow], 0.05), [])
+        self.assertEqual(len(check_startup([fast, slow, slow], 0.05)), 1)
+        self.assertEqual(len(check_startup([fast, eager], 0.05)), 1)
+        self.assertEqual(len(check_startup([slow, eager], 0.05)), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
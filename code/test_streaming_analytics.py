@@ -0,0 +1,91 @@
+"""
+This file contains tests of the streaming analytics of the game "Tenzichi Own The Planet - Board Game Edition".
+Author: DtjiSoftwareDeveloper
+"""
+
+
+# Importing necessary libraries
+
+import os
+import tempfile
+import unittest
+import numpy as np
+from streaming_analytics import ANALYTICS_FILE_NAME, LOG10_BUCKET_EDGES, StreamingAnalytics, analyze_games, \
+    get_histogram_quantiles, load_event_chunks, run_pipeline
+from tenzichi_own_the_planet_board_game_edition import CPU, PURCHASE_PLACE, Game, RandomCPUPolicy, \
+    SimulationReport, create_board, simulate
+
+
+AGGREGATES: tuple = ("wins", "all_owned_turn_counts", "place_purchases", "place_upgrades", "place_acquisitions",
+                     "upgrade_purchases", "coin_counts", "exp_counts")
+
+
+class StreamingAnalyticsTest(unittest.TestCase):
+    """
+    This class contains tests of analyzing simulated games with the streaming pipeline.
+    """
+
+    def assert_same_aggregates(self, analytics, other):
+        # type: (StreamingAnalytics, StreamingAnalytics) -> None
+        self.assertEqual((analytics.n_games, analytics.total_turns), (other.n_games, other.total_turns))
+        for name in AGGREGATES:
+            np.testing.assert_array_equal(getattr(analytics, name), getattr(other, name))
+
+    def test_aggregates_follow_games(self):
+        # type: () -> None
+        analytics: StreamingAnalytics = analyze_games(0, 4, 300, 5)
+        simulation_report: SimulationReport = simulate(4, 300, 5)
+        self.assertEqual((analytics.n_games, analytics.total_turns), (4, simulation_report.total_turns))
+        self.assertEqual(analytics.wins.tolist()[:2], [simulation_report.player_wins, simulation_report.cpu_wins])
+
+        place_purchases: np.ndarray = np.zeros(len(analytics.place_purchases), dtype=np.int64)
+        for game_index in range(4):
+            game: Game = Game(CPU(), CPU(), create_board(), 5, game_index)
+            game.reports = []
+            while game.turn < 300:
+                game.step(RandomCPUPolicy())
+            for report in game.reports:
+                if report.decision == PURCHASE_PLACE and report.succeeded:
+                    place_purchases[report.tile.ordinal] += 1
+        np.testing.assert_array_equal(analytics.place_purchases, place_purchases)
+        # Both participants of every game are sampled every 100 turns.
+        self.assertEqual(analytics.coin_counts.sum(axis=1).tolist(), [8, 8, 8])
+        self.assertEqual(analytics.exp_counts.sum(axis=1).tolist(), [8, 8, 8])
+
+    def test_chunks_and_merging_do_not_change_results(self):
+        # type: () -> None
+        analytics: StreamingAnalytics = analyze_games(0, 6, 300, 5)
+        self.assert_same_aggregates(analyze_games(0, 6, 300, 5, chunk_size=7), analytics)
+        self.assert_same_aggregates(analyze_games(0, 2, 300, 5).merge(analyze_games(2, 6, 300, 5)), analytics)
+        self.assert_same_aggregates(run_pipeline(6, 300, 5, None, 2, 4), analytics)
+
+    def test_written_chunks(self):
+        # type: () -> None
+        directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        analytics: StreamingAnalytics = run_pipeline(4, 200, 5, directory.name, 1, 4, chunk_size=10)
+        reloaded: StreamingAnalytics = StreamingAnalytics(len(analytics.place_purchases), analytics.upgrade_names,
+                                                          2, 200, analytics.sample_interval)
+        n_chunks: int = 0  # initial value
+        for columns in load_event_chunks(directory.name, "events_000000000"):
+            reloaded.add_chunk(columns)
+            n_chunks += 1
+        self.assertGreater(n_chunks, 1)
+        self.assert_same_aggregates(reloaded, analytics)
+
+        with np.load(os.path.join(directory.name, ANALYTICS_FILE_NAME)) as saved:
+            self.assertEqual(int(saved["n_games"]), 4)
+            np.testing.assert_array_equal(saved["place_purchases"], analytics.place_purchases)
+            self.assertEqual(saved["coin_quantiles"].shape, (2, 5))
+
+    def test_histogram_quantiles(self):
+        # type: () -> None
+        counts: np.ndarray = np.zeros(len(LOG10_BUCKET_EDGES) + 1, dtype=np.int64)
+        self.assertTrue(np.isnan(get_histogram_quantiles(counts, LOG10_BUCKET_EDGES)).all())
+        counts[1:1001] = 1  # one value in every bucket of the first decade
+        np.testing.assert_allclose(get_histogram_quantiles(counts, LOG10_BUCKET_EDGES, (0.5,)), [10.0 ** 0.5],
+                                   rtol=1e-3)
+
+
+if __name__ == '__main__':
+    unittest.main()
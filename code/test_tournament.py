@@ -0,0 +1,35 @@
+"""
+This file contains tests of the tournament runner of the game "Tenzichi Own The Planet - Board Game Edition".
+Author: DtjiSoftwareDeveloper
+"""
+
+
+# Importing necessary libraries
+
+import unittest
+from tournament import TournamentReport, play_games, run_tournament
+
+
+class TournamentTest(unittest.TestCase):
+    """
+    This class contains tests of playing tournaments over pools of worker processes.
+    """
+
+    def test_results_do_not_depend_on_workers(self):
+        # type: () -> None
+        report: TournamentReport = play_games(0, 6, 200, 42)
+        self.assertEqual(report.n_games, 6)
+        self.assertEqual(run_tournament(6, 200, 42, 1, 6), report)
+        self.assertEqual(run_tournament(6, 200, 42, 2, 4), report)
+
+    def test_merge(self):
+        # type: () -> None
+        report: TournamentReport = play_games(0, 2, 200, 42)
+        report.merge(play_games(2, 5, 200, 42))
+        self.assertEqual(report, play_games(0, 5, 200, 42))
+        self.assertEqual(report.player_wins + report.cpu_wins + report.unfinished_games, 5)
+        self.assertEqual(sum(report.winning_turn_counts.values()), report.player_wins + report.cpu_wins)
+
+
+if __name__ == '__main__':
+    unittest.main()
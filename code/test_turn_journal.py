@@ -0,0 +1,68 @@
+"""
+This file contains tests of the turn journal of the game "Tenzichi Own The Planet - Board Game Edition".
+Author: DtjiSoftwareDeveloper
+"""
+
+
+# Importing necessary libraries
+
+import os
+import tempfile
+import unittest
+from tenzichi_own_the_planet_board_game_edition import CPU, DEFAULT_ECONOMY, Economy, Game, RandomCPUPolicy, \
+    create_board, encode_game
+from turn_journal import JournalReader, JournalRecorder, record_simulated_game
+
+
+def get_paid_state(game):
+    # type: (Game) -> list
+    # Returns the coins, EXP, level and position of every participant of 'game' with all income paid.
+    return [(participant.coins, participant.exp, participant.level, participant.position)
+            for participant in game.participants]
+
+
+class TurnJournalTest(unittest.TestCase):
+    """
+    This class contains tests of recording games into journals and reconstructing them.
+    """
+
+    def setUp(self):
+        # type: () -> None
+        self.directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        # type: () -> None
+        self.directory.cleanup()
+
+    def test_seek_replays_exactly(self):
+        # type: () -> None
+        # Small shinies keep the coins small enough for the income of places to show in them.
+        economy: Economy = DEFAULT_ECONOMY.replace(shiny_exponent_range=(5, 7))
+        game: Game = Game(CPU(), CPU(), create_board(None, economy), 11)
+        policy: RandomCPUPolicy = RandomCPUPolicy()
+        file_name: str = os.path.join(self.directory.name, "game")
+        states: dict = {}  # initial value
+        with JournalRecorder(game, file_name, 10) as recorder:
+            while game.turn < 300:
+                recorder.record(game.step(policy))
+                states[game.turn] = get_paid_state(game.clone())
+
+        self.assertGreater(sum(participant.count_owned() for participant in game.participants), 0)
+        with JournalReader(file_name) as reader:
+            for turn in range(1, 301):
+                self.assertEqual(get_paid_state(reader.seek(turn)), states[turn], "turn " + str(turn))
+
+    def test_record_simulated_game(self):
+        # type: () -> None
+        file_name: str = os.path.join(self.directory.name, "game")
+        game: Game = record_simulated_game(file_name, 650, 3, None, 100)
+        with JournalReader(file_name) as reader:
+            self.assertEqual((reader.first_turn, reader.last_turn), (0, 650))
+            self.assertEqual(reader.keyframe_turns, [0, 100, 200, 300, 400, 500, 600])
+            self.assertEqual(encode_game(reader.seek(650)), encode_game(game))
+            self.assertEqual(encode_game(reader.seek(0)), encode_game(reader.load_keyframe(0)))
+            self.assertRaises(ValueError, reader.seek, 651)
+
+
+if __name__ == '__main__':
+    unittest.main()
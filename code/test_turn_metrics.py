@@ -0,0 +1,90 @@
+"""
+This file contains tests of the turn metrics of the game "Tenzichi Own The Planet - Board Game Edition".
+Author: DtjiSoftwareDeveloper
+"""
+
+
+# Importing necessary libraries
+
+import os
+import json
+import tempfile
+import unittest
+from tenzichi_own_the_planet_board_game_edition import BUY_UPGRADE, CPU, DICE_ROLL_PHASE, INCOME_ACCRUAL_PHASE, \
+    TURN_PHASES, Game, RandomCPUPolicy, SimulationReport, TurnMetrics, TurnReport, create_board, encode_game, simulate
+
+
+class TurnMetricsTest(unittest.TestCase):
+    """
+    This class contains tests of measuring the turns of games.
+    """
+
+    def setUp(self):
+        # type: () -> None
+        self.directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        # type: () -> None
+        self.directory.cleanup()
+
+    def test_counters_follow_turns(self):
+        # type: () -> None
+        game: Game = Game(CPU(), CPU(), create_board(), 5)
+        unmeasured_game: Game = game.clone()
+        game.metrics = TurnMetrics()
+        policy: RandomCPUPolicy = RandomCPUPolicy()
+        reports: list = []  # initial value
+        while game.turn < 300:
+            reports.append(game.step(policy))
+            unmeasured_game.step(policy)
+
+        counters: dict = game.metrics.counters
+        self.assertEqual(encode_game(game), encode_game(unmeasured_game))
+        self.assertEqual(counters["turns"], 300)
+        self.assertEqual(counters["shinies"], sum(report.shiny is not None for report in reports))
+        self.assertEqual(counters["upgrades_bought"],
+                         sum(report.succeeded and report.decision == BUY_UPGRADE for report in reports))
+        self.assertEqual(counters["place_transactions"],
+                         sum(report.succeeded and report.decision not in (None, BUY_UPGRADE) for report in reports))
+        self.assertEqual(sum(game.metrics.bucket_counts[DICE_ROLL_PHASE]), 300)
+        self.assertEqual(sum(game.metrics.bucket_counts[INCOME_ACCRUAL_PHASE]), 300)
+
+    def test_fast_forwarded_turns(self):
+        # type: () -> None
+        metrics: TurnMetrics = TurnMetrics()
+        simulation_report: SimulationReport = simulate(2, 500, 1, None, metrics)
+        self.assertEqual(metrics.counters["turns"], simulation_report.total_turns)
+        self.assertGreater(metrics.counters["fast_forwarded_turns"], 0)
+        self.assertLess(metrics.counters["fast_forwarded_turns"], simulation_report.total_turns)
+
+    def test_export(self):
+        # type: () -> None
+        json_file_name: str = os.path.join(self.directory.name, "metrics.json")
+        prometheus_file_name: str = os.path.join(self.directory.name, "metrics.prom")
+        game: Game = Game(CPU(), CPU(), create_board(), 5)
+        game.metrics = TurnMetrics(json_file_name, None, 100)
+        policy: RandomCPUPolicy = RandomCPUPolicy()
+        while game.turn < 99:
+            game.step(policy)
+        self.assertFalse(os.path.exists(json_file_name))
+        report: TurnReport = game.step(policy)
+        self.assertEqual(report.turn, 100)
+
+        with open(json_file_name, "r") as file:
+            metrics: dict = json.load(file)
+        self.assertEqual(metrics["counters"]["turns"], 100)
+        self.assertEqual(set(metrics["phases"]), set(TURN_PHASES))
+        self.assertEqual(metrics["phases"][DICE_ROLL_PHASE]["count"], 100)
+        self.assertEqual(metrics["phases"][DICE_ROLL_PHASE]["buckets"]["+Inf"], 100)
+
+        self.assertEqual(game.metrics.export_format, "json")
+        prometheus_metrics: TurnMetrics = TurnMetrics(prometheus_file_name)
+        self.assertEqual(prometheus_metrics.export_format, "prometheus")
+        prometheus_metrics.export()
+        with open(prometheus_file_name, "r") as file:
+            self.assertIn("tenzichi_turns_total 0\n", file.read())
+        self.assertRaises(ValueError, TurnMetrics, json_file_name, "xml")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+"""
+This file contains tests of the vectorized simulator of the game "Tenzichi Own The Planet - Board Game Edition".
+Author: DtjiSoftwareDeveloper
+"""
+
+
+# Importing necessary libraries
+
+import unittest
+from tenzichi_own_the_planet_board_game_edition import DEFAULT_ECONOMY, Economy
+from vectorized_simulator import VectorizedSimulator, reference_summary
+
+
+class VectorizedSimulatorTest(unittest.TestCase):
+    """
+    This class contains tests of the vectorized simulator against the reference rules of the game.
+    """
+
+    def assert_matches_reference(self, n_games, n_turns, seed, economy=None):
+        # type: (int, int, int, Economy or None) -> None
+        simulator: VectorizedSimulator = VectorizedSimulator(n_games, seed, economy=economy)
+        simulator.run(n_turns)
+        self.assertEqual(simulator.turn, n_turns)
+        expected: dict = reference_summary(n_games, n_turns, seed, economy)
+        summary: dict = simulator.summary()
+        self.assertEqual(summary.keys(), expected.keys())
+        for key in expected:
+            self.assertAlmostEqual(summary[key], expected[key], 6, key)
+
+    def test_matches_reference(self):
+        # type: () -> None
+        self.assert_matches_reference(50, 300, 7)
+
+    def test_matches_reference_with_economy(self):
+        # type: () -> None
+        self.assert_matches_reference(50, 300, 7, DEFAULT_ECONOMY.replace(shiny_exponent_range=(5, 9),
+                                                                          start_coin_bonus_exponent=6,
+                                                                          cpu_probability=0.5))
+
+    def test_run_is_reproducible(self):
+        # type: () -> None
+        simulators: list = [VectorizedSimulator(20, 3), VectorizedSimulator(20, 3)]
+        for simulator in simulators:
+            simulator.run(200)
+        self.assertEqual(simulators[0].summary(), simulators[1].summary())
+
+
+if __name__ == '__main__':
+    unittest.main()
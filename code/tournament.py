@@ -0,0 +1,151 @@
+"""
+This file contains source code of the tournament runner of the game "Tenzichi Own The Planet - Board Game Edition".
+Author: DtjiSoftwareDeveloper
+"""
+
+
+# Importing necessary libraries
+
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from tenzichi_own_the_planet_board_game_edition import *
+
+
+# Creating static functions to be used throughout the tournament.
+
+
+def play_games(first_game_index, last_game_index, max_turns, master_seed, numeric_backend_name="mpf",
+               board_file_name=None):
+    # type: (int, int, int, int, str, str or None) -> TournamentReport
+    """
+    This function plays the games with indices in the range [first_game_index, last_game_index) of a tournament.
+    It is run in the worker processes of the tournament. The games are played on the board saved into
+    'board_file_name' if it is given, which all worker processes map read-only instead of copying it.
+    :return: a report of the games played
+    """
+
+    numeric_backend: NumericBackend = get_numeric_backend(numeric_backend_name)
+    policy: RandomCPUPolicy = RandomCPUPolicy()
+    report: TournamentReport = TournamentReport()
+    for game_index in range(first_game_index, last_game_index):
+        board: Board = create_board(numeric_backend) if board_file_name is None else \
+            load_board(board_file_name, numeric_backend)
+        game: Game = Game(CPU(numeric_backend), CPU(numeric_backend), board, master_seed, game_index)
+        winner: Player or None = play_game(game, policy, policy, max_turns)
+        if winner is game.player:
+            report.add_game(game.turn, 1)
+        elif winner is game.cpu:
+            report.add_game(game.turn, 2)
+        else:
+            report.add_game(game.turn, 0)
+
+    return report
+
+
+def run_tournament(n_games, max_turns, master_seed, workers=None, games_per_task=100, numeric_backend_name="mpf",
+                   board_file_name=None):
+    # type: (int, int, int, int or None, int, str, str or None) -> TournamentReport
+    """
+    This function plays 'n_games' CPU versus CPU games of at most 'max_turns' turns each over a pool of
+    'workers' processes (one per CPU core by default), on the board saved into 'board_file_name' if it is given. The
+    results only depend on 'n_games', 'max_turns', 'master_seed' and the board.
+    :return: the merged report of all games
+    """
+
+    start_time: float = time.perf_counter()
+    report: TournamentReport = TournamentReport()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures: list = [executor.submit(play_games, first, min(first + games_per_task, n_games), max_turns,
+                                         master_seed, numeric_backend_name, board_file_name)
+                         for first in range(0, n_games, games_per_task)]
+        for future in futures:
+            report.merge(future.result())
+
+    report.elapsed_seconds = time.perf_counter() - start_time
+    return report
+
+
+# Creating necessary classes
+
+
+class TournamentReport:
+    """
+    This class contains attributes of the merged results of the games in a tournament.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self.n_games: int = 0  # initial value
+        self.total_turns: int = 0  # initial value
+        self.player_wins: int = 0  # initial value
+        self.cpu_wins: int = 0  # initial value
+        self.unfinished_games: int = 0  # initial value
+        self.winning_turn_counts: dict = {}  # number of finished games keyed by their number of turns
+        self.elapsed_seconds: float = 0  # initial value
+
+    def __str__(self):
+        # type: () -> str
+        res: str = ""  # initial value
+        res += "Games played: " + str(self.n_games) + "\n"
+        res += "Turns played: " + str(self.total_turns) + "\n"
+        res += "Player wins: " + str(self.player_wins) + "\n"
+        res += "CPU wins: " + str(self.cpu_wins) + "\n"
+        res += "Unfinished games: " + str(self.unfinished_games) + "\n"
+        res += "Mean turns of finished games: " + str(self.get_mean_winning_turns()) + "\n"
+        res += "Elapsed seconds: " + str(self.elapsed_seconds) + "\n"
+        res += "Games per second: " + str(self.n_games / self.elapsed_seconds if self.elapsed_seconds > 0
+                                          else float("inf")) + "\n"
+        return res
+
+    def __eq__(self, other):
+        # type: (object) -> bool
+        # The elapsed time is not part of the results of a tournament.
+        return isinstance(other, TournamentReport) and \
+            (self.n_games, self.total_turns, self.player_wins, self.cpu_wins, self.unfinished_games,
+             self.winning_turn_counts) == \
+            (other.n_games, other.total_turns, other.player_wins, other.cpu_wins, other.unfinished_games,
+             other.winning_turn_counts)
+
+    def add_game(self, turns, winner_seat):
+        # type: (int, int) -> None
+        # 'winner_seat' is 1 if the player won, 2 if the CPU won and 0 if the game is unfinished.
+        self.n_games += 1
+        self.total_turns += turns
+        if winner_seat == 0:
+            self.unfinished_games += 1
+            return
+
+        if winner_seat == 1:
+            self.player_wins += 1
+        else:
+            self.cpu_wins += 1
+
+        self.winning_turn_counts[turns] = self.winning_turn_counts.get(turns, 0) + 1
+
+    def merge(self, other):
+        # type: (TournamentReport) -> None
+        self.n_games += other.n_games
+        self.total_turns += other.total_turns
+        self.player_wins += other.player_wins
+        self.cpu_wins += other.cpu_wins
+        self.unfinished_games += other.unfinished_games
+        for turns, count in other.winning_turn_counts.items():
+            self.winning_turn_counts[turns] = self.winning_turn_counts.get(turns, 0) + count
+
+    def get_mean_winning_turns(self):
+        # type: () -> float or None
+        finished_games: int = self.player_wins + self.cpu_wins
+        if finished_games == 0:
+            return None
+        return sum(turns * count for turns, count in self.winning_turn_counts.items()) / finished_games
+
+
+if __name__ == '__main__':
+    if len(sys.argv) not in (4, 5, 6):
+        print("Usage: python tournament.py N_GAMES MAX_TURNS MASTER_SEED [WORKERS] [BOARD_FILE]")
+        sys.exit(1)
+
+    print(str(run_tournament(int(sys.argv[1]), int(sys.argv[2]), int(sys.argv[3]),
+                             int(sys.argv[4]) if len(sys.argv) >= 5 else None,
+                             board_file_name=sys.argv[5] if len(sys.argv) == 6 else None)))
@@ -0,0 +1,273 @@
+"""
+This file contains source code of the turn journal of the game "Tenzichi Own The Planet - Board Game Edition".
+A journal records every turn of a game into an append-only events file and saves the whole game into a keyframes
+file every few turns, so that the game can be reconstructed at any turn by loading the nearest keyframe and
+replaying the turns after it.
+Author: DtjiSoftwareDeveloper
+"""
+
+
+# Importing necessary libraries
+
+import sys
+import time
+import mmap
+import bisect
+import struct
+from tenzichi_own_the_planet_board_game_edition import *
+
+
+# The events file of a journal starts with a header holding the turn before its first event, followed by one
+# EVENT_STRUCT per turn. The keyframes file holds a KEYFRAME_STRUCT followed by a saved game per keyframe.
+JOURNAL_MAGIC: bytes = b"TOTJ"
+JOURNAL_VERSION: int = 1
+JOURNAL_HEADER_STRUCT: struct.Struct = struct.Struct("<4sHQ")
+# Dice value, coin and EXP exponents of the shiny (0 if none), decision, whether it was accepted and upgrade index
+EVENT_STRUCT: struct.Struct = struct.Struct("<BIIBBB")
+KEYFRAME_STRUCT: struct.Struct = struct.Struct("<QI")  # turn and length of the saved game
+DECISION_CODES: dict = {None: 0, BUY_UPGRADE: 1, PURCHASE_PLACE: 2, UPGRADE_PLACE: 3, ACQUIRE_PLACE: 4}
+NO_UPGRADE_INDEX: int = 255
+
+
+# Creating static functions to be used throughout the turn journal.
+
+
+def get_events_file_name(file_name):
+    # type: (str) -> str
+    return file_name + ".events"
+
+
+def get_keyframes_file_name(file_name):
+    # type: (str) -> str
+    return file_name + ".keyframes"
+
+
+def encode_event(report):
+    # type: (TurnReport) -> bytes
+    upgrade_index: int = NO_UPGRADE_INDEX
+    if report.decision == BUY_UPGRADE and report.accepted:
+        upgrade_index = report.tile.get_upgrades_sold().index(report.target)
+
+    return EVENT_STRUCT.pack(report.dice_value,
+                             0 if report.shiny is None else report.shiny.coin_exponent,
+                             0 if report.shiny is None else report.shiny.exp_exponent,
+                             DECISION_CODES[report.decision], report.accepted, upgrade_index)
+
+
+# Creating necessary classes
+
+
+class ReplayRandom:
+    """
+    This class contains attributes of a random number generator which returns the values drawn during a recorded
+    turn instead of random ones.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self.values: list = []  # values still to be returned, in reverse order
+
+    def begin_turn(self, turn, seat):
+        # type: (int, int) -> None
+        pass
+
+    def draws(self, kind):
+        # type: (int) -> ReplayRandom
+        return self
+
+    def randint(self, a, b):
+        # type: (int, int) -> int
+        return self.values.pop()
+
+
+class ReplayPolicy(DecisionPolicy):
+    """
+    This class contains the decisions made during a recorded turn.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self.accepted: bool = False  # initial value
+        self.upgrade_index: int = NO_UPGRADE_INDEX  # initial value
+
+    def choose_upgrade(self, game, participant, upgrade_shop):
+        # type: (Game, Player, UpgradeShop) -> int or None
+        return self.upgrade_index if self.accepted else None
+
+    def should_purchase_place(self, game, participant, place):
+        # type: (Game, Player, Place) -> bool
+        return self.accepted
+
+    def should_upgrade_place(self, game, participant, place):
+        # type: (Game, Player, Place) -> bool
+        return self.accepted
+
+    def should_acquire_place(self, game, participant, place, owner):
+        # type: (Game, Player, Place, Player) -> bool
+        return self.accepted
+
+
+class JournalRecorder:
+    """
+    This class contains attributes of a journal being recorded for a game.
+    """
+
+    def __init__(self, game, file_name, keyframe_interval=250):
+        # type: (Game, str, int) -> None
+        self.game: Game = game
+        self.keyframe_interval: int = keyframe_interval
+        self.__events_file = open(get_events_file_name(file_name), "wb")
+        self.__keyframes_file = open(get_keyframes_file_name(file_name), "wb")
+        self.__events_file.write(JOURNAL_HEADER_STRUCT.pack(JOURNAL_MAGIC, JOURNAL_VERSION, game.turn))
+        self.__keyframes_file.write(JOURNAL_HEADER_STRUCT.pack(JOURNAL_MAGIC, JOURNAL_VERSION, game.turn))
+        self.write_keyframe()
+
+    def __enter__(self):
+        # type: () -> JournalRecorder
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # type: (type, BaseException, object) -> None
+        self.close()
+
+    def write_keyframe(self):
+        # type: () -> None
+        saved_game: bytes = encode_game(self.game)
+        self.__keyframes_file.write(KEYFRAME_STRUCT.pack(self.game.turn, len(saved_game)))
+        self.__keyframes_file.write(saved_game)
+
+    def record(self, report):
+        # type: (TurnReport) -> None
+        # This method must be called with the report of every turn of the game, right after the turn.
+        self.__events_file.write(encode_event(report))
+        if self.game.turn % self.keyframe_interval == 0:
+            self.write_keyframe()
+
+    def close(self):
+        # type: () -> None
+        self.__events_file.close()
+        self.__keyframes_file.close()
+
+
+class JournalReader:
+    """
+    This class contains attributes of a recorded journal which can be used to reconstruct its game at any turn.
+    """
+
+    def __init__(self, file_name):
+        # type: (str) -> None
+        self.__events_file = open(get_events_file_name(file_name), "rb")
+        self.__events: mmap.mmap = mmap.mmap(self.__events_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.first_turn = JOURNAL_HEADER_STRUCT.unpack_from(self.__events, 0)
+        if magic != JOURNAL_MAGIC or version != JOURNAL_VERSION:
+            raise ValueError("Unsupported journal: " + str(file_name))
+
+        self.last_turn: int = \
+            self.first_turn + (len(self.__events) - JOURNAL_HEADER_STRUCT.size) // EVENT_STRUCT.size
+
+        # Indexing the keyframes by turn without reading the saved games in them
+        self.__keyframes_file = open(get_keyframes_file_name(file_name), "rb")
+        self.__keyframes: mmap.mmap = mmap.mmap(self.__keyframes_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.keyframe_turns: list = []  # initial value
+        self.__keyframe_offsets: list = []  # initial value
+        offset: int = JOURNAL_HEADER_STRUCT.size
+        while offset + KEYFRAME_STRUCT.size <= len(self.__keyframes):
+            turn, length = KEYFRAME_STRUCT.unpack_from(self.__keyframes, offset)
+            if offset + KEYFRAME_STRUCT.size + length > len(self.__keyframes):
+                break  # the last keyframe was not completely written
+            self.keyframe_turns.append(turn)
+            self.__keyframe_offsets.append(offset + KEYFRAME_STRUCT.size)
+            offset += KEYFRAME_STRUCT.size + length
+
+    def __enter__(self):
+        # type: () -> JournalReader
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # type: (type, BaseException, object) -> None
+        self.close()
+
+    def get_event(self, turn):
+        # type: (int) -> tuple
+        return EVENT_STRUCT.unpack_from(self.__events, JOURNAL_HEADER_STRUCT.size +
+                                        (turn - self.first_turn - 1) * EVENT_STRUCT.size)
+
+    def load_keyframe(self, index):
+        # type: (int) -> Game
+        offset: int = self.__keyframe_offsets[index]
+        length: int = KEYFRAME_STRUCT.unpack_from(self.__keyframes, offset - KEYFRAME_STRUCT.size)[1]
+        return decode_game(memoryview(self.__keyframes)[offset:offset + length])
+
+    def seek(self, turn):
+        # type: (int) -> Game
+        """
+        This method reconstructs the game right after 'turn' turns have been played.
+        :return: the reconstructed game
+        """
+
+        if turn < self.first_turn or turn > self.last_turn:
+            raise ValueError("Turn " + str(turn) + " is not in the journal, which covers turns " +
+                             str(self.first_turn) + " to " + str(self.last_turn) + ".")
+
+        index: int = bisect.bisect_right(self.keyframe_turns, turn) - 1
+        game: Game = self.load_keyframe(index)
+        self.replay(game, turn)
+        return game
+
+    def replay(self, game, turn):
+        # type: (Game, int) -> None
+        """
+        This method plays the recorded turns of 'game' until 'turn' turns have been played, without any input or
+        output. The random number generator of the game is left untouched.
+        :return: None
+        """
+
+        replay_random: ReplayRandom = ReplayRandom()
+        replay_policy: ReplayPolicy = ReplayPolicy()
+        rng: RandomService = game.rng
+        game.rng = replay_random
+        try:
+            while game.turn < turn:
+                dice_value, coin_exponent, exp_exponent, decision, accepted, upgrade_index = \
+                    self.get_event(game.turn + 1)
+                replay_random.values = [exp_exponent, coin_exponent, dice_value] if coin_exponent > 0 \
+                    else [dice_value]
+                replay_policy.accepted = bool(accepted)
+                replay_policy.upgrade_index = upgrade_index
+                game.step(replay_policy)
+        finally:
+            game.rng = rng
+
+    def close(self):
+        # type: () -> None
+        self.__events.close()
+        self.__keyframes.close()
+        self.__events_file.close()
+        self.__keyframes_file.close()
+
+
+def record_simulated_game(file_name, max_turns, seed=None, numeric_backend=None, keyframe_interval=250):
+    # type: (str, int, int or None, NumericBackend or None, int) -> Game
+    """
+    This function plays a CPU versus CPU game of 'max_turns' turns and records its journal.
+    :return: the game after its last turn
+    """
+
+    game: Game = Game(CPU(numeric_backend), CPU(numeric_backend), create_board(numeric_backend), seed)
+    policy: RandomCPUPolicy = RandomCPUPolicy()
+    with JournalRecorder(game, file_name, keyframe_interval) as recorder:
+        while game.turn < max_turns:
+            recorder.record(game.step(policy))
+
+    return game
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3:
+        print("Usage: python turn_journal.py JOURNAL_FILE_NAME TURN")
+        sys.exit(1)
+
+    with JournalReader(sys.argv[1]) as reader:
+        start_time: float = time.perf_counter()
+        reconstructed_game: Game = reader.seek(int(sys.argv[2]))
+        print("Reconstructed in " + str(time.perf_counter() - start_time) + " seconds:\n" + str(reconstructed_game))
@@ -0,0 +1,349 @@
+"""
+This file contains source code of the vectorized simulator of the game "Tenzichi Own The Planet - Board Game Edition".
+It plays many CPU versus CPU games in lockstep with NumPy, keeping every game as a row of struct-of-arrays state.
+Coins, EXP, costs and incomes are stored as base 10 logarithms.
+Author: DtjiSoftwareDeveloper
+"""
+
+
+# Importing necessary libraries
+
+import sys
+import time
+import numpy as np
+from tenzichi_own_the_planet_board_game_edition import *
+
+
+# Creating static functions to be used throughout the vectorized simulator.
+
+
+def log10_add(a, b):
+    # type: (np.ndarray, np.ndarray) -> np.ndarray
+    """
+    This function adds numbers stored as base 10 logarithms, where -inf stands for zero.
+    :return: log10(10 ** a + 10 ** b)
+    """
+
+    high: np.ndarray = np.maximum(a, b)
+    low: np.ndarray = np.minimum(a, b)
+    with np.errstate(invalid="ignore"):
+        res: np.ndarray = high + np.log10(1.0 + 10.0 ** (low - high))
+    return np.where(np.isneginf(low), high, res)
+
+
+def log10_subtract(a, b):
+    # type: (np.ndarray, np.ndarray) -> np.ndarray
+    """
+    This function subtracts numbers stored as base 10 logarithms, assuming a >= b, where -inf stands for zero.
+    :return: log10(10 ** a - 10 ** b)
+    """
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        res: np.ndarray = a + np.log10(1.0 - 10.0 ** (b - a))
+    res = np.where(np.isneginf(b), a, res)
+    return np.where(a <= b, -np.inf, res)
+
+
+def log10_sum(values, mask):
+    # type: (np.ndarray, np.ndarray) -> np.ndarray
+    """
+    This function sums the numbers stored as base 10 logarithms in each row of 'values' where 'mask' is True.
+    :return: the base 10 logarithm of the sum of each row, which is -inf for rows with nothing to sum
+    """
+
+    masked: np.ndarray = np.where(mask, values, -np.inf)
+    high: np.ndarray = masked.max(axis=1)
+    safe_high: np.ndarray = np.where(np.isneginf(high), 0.0, high)
+    with np.errstate(divide="ignore"):
+        return safe_high + np.log10((10.0 ** (masked - safe_high[:, None])).sum(axis=1))
+
+
+def number_log10(value):
+    # type: (object) -> float
+    return ScientificNumber.from_value(str(value)).log10()
+
+
+# Creating necessary classes
+
+
+class VectorizedBoard:
+    """
+    This class contains attributes of a board converted into arrays for the vectorized simulator.
+    """
+
+    def __init__(self, board):
+        # type: (Board) -> None
+        compiled_board: CompiledBoard = board.get_compiled_board()
+        self.size: int = compiled_board.size
+        self.tile_codes: np.ndarray = np.array(compiled_board.tile_codes, dtype=np.int8)
+        place_positions: np.ndarray = np.array(compiled_board.place_positions, dtype=np.int64)
+        # Ordinal of the place on each position, or -1
+        self.place_ordinals: np.ndarray = np.full(self.size, -1, dtype=np.int64)
+        self.place_ordinals[place_positions] = np.arange(len(place_positions))
+        place_costs: list = []  # initial value
+        place_coins_per_turn: list = []  # initial value
+        place_exp_per_turn: list = []  # initial value
+        upgrades_sold: list = board.get_upgrade_catalog()
+        if isinstance(board, GeneratedBoard):
+            # The numbers of the places of a generated board are powers of ten whose exponents are in its arrays.
+            place_costs = board.tile_arrays.coin_cost_exponents
+            place_coins_per_turn = board.tile_arrays.coins_per_turn_exponents
+            place_exp_per_turn = board.tile_arrays.exp_per_turn_exponents
+        else:
+            for place in board.get_places():
+                place_costs.append(number_log10(place.coin_cost))
+                place_coins_per_turn.append(number_log10(place.coins_per_turn))
+                place_exp_per_turn.append(number_log10(place.exp_per_turn))
+
+        self.n_places: int = len(place_costs)
+        self.place_costs: np.ndarray = np.array(place_costs, dtype=np.float64)
+        self.place_coins_per_turn: np.ndarray = np.array(place_coins_per_turn, dtype=np.float64)
+        self.place_exp_per_turn: np.ndarray = np.array(place_exp_per_turn, dtype=np.float64)
+        self.upgrade_costs: np.ndarray = np.array([number_log10(upgrade.coin_cost) for upgrade in upgrades_sold])
+        self.upgrade_coin_multipliers: np.ndarray = \
+            np.log10(np.array([upgrade.coin_gain_multiplier for upgrade in upgrades_sold], dtype=np.float64))
+        self.upgrade_exp_multipliers: np.ndarray = \
+            np.log10(np.array([upgrade.exp_gain_multiplier for upgrade in upgrades_sold], dtype=np.float64))
+
+
+class VectorizedSimulator:
+    """
+    This class contains attributes of N CPU versus CPU games played in lockstep, one turn of every game per step.
+    Seat 0 is the player and seat 1 is the CPU of each game. The games follow the economy of 'board', which is
+    created by create_board() with 'economy' if it is not given, and the CPUs accept offers with 'probability', which
+    is the one of the economy by default.
+    """
+
+    def __init__(self, n_games, seed=None, board=None, probability=None, economy=None):
+        # type: (int, int or None, Board or None, float or None, Economy or None) -> None
+        board = create_board(SCIENTIFIC_BACKEND, economy) if board is None else board
+        if economy is not None and economy != board.economy:
+            raise ValueError("The economy of the games must be the economy their board was created with.")
+        self.economy: Economy = board.economy
+        self.board: VectorizedBoard = VectorizedBoard(board)
+        self.n_games: int = n_games
+        self.probability: float = self.economy.cpu_probability if probability is None else probability
+        self.seed: int = random.getrandbits(64) if seed is None else seed & MASK_64
+        # Keys of the random streams of each game, seat and kind of draw, so that game i draws the same numbers as
+        # Game(..., seed, i) does
+        self.stream_keys: np.ndarray = np.array([[[get_stream_key(self.seed, game_index, seat, kind)
+                                                   for kind in range(len(DRAWS_PER_TURN))] for seat in range(2)]
+                                                 for game_index in range(n_games)], dtype=np.uint64)
+        self.turn: int = 0  # initial value
+        self.positions: np.ndarray = np.zeros((n_games, 2), dtype=np.int64)
+        self.coins: np.ndarray = np.full((n_games, 2), -np.inf)
+        self.exp: np.ndarray = np.full((n_games, 2), -np.inf)
+        self.levels: np.ndarray = np.ones((n_games, 2), dtype=np.int64)
+        self.required_exp: np.ndarray = np.full((n_games, 2), 6.0)
+        self.coin_multipliers: np.ndarray = np.zeros((n_games, 2))
+        self.exp_multipliers: np.ndarray = np.zeros((n_games, 2))
+        self.owners: np.ndarray = np.full((n_games, self.board.n_places), -1, dtype=np.int8)
+        self.place_costs: np.ndarray = np.tile(self.board.place_costs, (n_games, 1))
+        self.place_coins_per_turn: np.ndarray = np.tile(self.board.place_coins_per_turn, (n_games, 1))
+        self.place_exp_per_turn: np.ndarray = np.tile(self.board.place_exp_per_turn, (n_games, 1))
+        # log10 of the start coin bonus at game level 1
+        self.start_coin_bonus: float = float(self.economy.start_coin_bonus_exponent)
+        self.winners: np.ndarray = np.full(n_games, -1, dtype=np.int8)
+        self.finishing_turns: np.ndarray = np.zeros(n_games, dtype=np.int64)
+
+    def draw_values(self, seat, kind, index):
+        # type: (int, int, int) -> np.ndarray
+        # Returns the 'index'th random values of 'kind' drawn by the participant in 'seat' of every game this turn.
+        counter: int = self.turn * DRAWS_PER_TURN[kind] + index
+        return mix64_array(self.stream_keys[:, seat, kind] + np.uint64(counter * GOLDEN_GAMMA & MASK_64))
+
+    def draw_integers(self, seat, kind, index, a, b):
+        # type: (int, int, int, int, int) -> np.ndarray
+        values: np.ndarray = self.draw_values(seat, kind, index) >> np.uint64(32)
+        return a + ((values * np.uint64(b - a + 1)) >> np.uint64(32)).astype(np.int64)
+
+    def level_up(self, seat, games):
+        # type: (int, np.ndarray) -> None
+        # Same closed form as Player.level_up(), on base 10 logarithms
+        levels: np.ndarray = self.levels[:, seat]
+        required_exp: np.ndarray = self.required_exp[:, seat]
+        exp: np.ndarray = self.exp[:, seat]
+        mask: np.ndarray = games & (exp >= required_exp)
+        if not mask.any():
+            return
+
+        level: np.ndarray = levels[mask]
+        b: np.ndarray = 2 * level + 1
+        gap: np.ndarray = exp[mask] - required_exp[mask]
+        levels_gained: np.ndarray = np.maximum(1, ((np.sqrt(b * b + 8 * gap) - b) // 2).astype(np.int64) + 1)
+        raised: np.ndarray = required_exp[mask] + levels_gained * level + levels_gained * (levels_gained + 1) // 2
+        lower: np.ndarray = (levels_gained > 1) & (exp[mask] < raised - levels_gained - level)
+        while lower.any():
+            raised[lower] -= levels_gained[lower] + level[lower]
+            levels_gained[lower] -= 1
+            lower &= (levels_gained > 1) & (exp[mask] < raised - levels_gained - level)
+        higher: np.ndarray = exp[mask] >= raised
+        while higher.any():
+            levels_gained[higher] += 1
+            raised[higher] += levels_gained[higher] + level[higher]
+            higher &= exp[mask] >= raised
+
+        levels[mask] = level + levels_gained
+        required_exp[mask] = raised
+
+    def pay(self, seat, games, costs):
+        # type: (int, np.ndarray, np.ndarray) -> np.ndarray
+        """
+        This method makes the participant in 'seat' of each game in 'games' pay the corresponding cost in 'costs'
+        if he/she has sufficient coins.
+        :return: a mask of the games where the payment succeeded
+        """
+
+        coins: np.ndarray = self.coins[:, seat]
+        paid: np.ndarray = games & (coins >= costs)
+        coins[paid] = log10_subtract(coins[paid], costs[paid])
+        return paid
+
+    def step(self):
+        # type: () -> None
+        """
+        This method plays one turn of every unfinished game.
+        """
+
+        seat: int = self.turn % 2
+        self.turn += 1
+        active: np.ndarray = self.winners < 0
+        n: int = self.n_games
+        rows: np.ndarray = np.arange(n)
+
+        # Rolling the dice and moving
+        positions: np.ndarray = self.positions[:, seat]
+        moved: np.ndarray = positions + self.draw_integers(seat, DICE_DRAWS, 0, 1, DICE_FACES)
+        passed_start: np.ndarray = active & (moved >= self.board.size)
+        moved[passed_start] -= self.board.size
+        positions[active] = moved[active]
+        self.coins[passed_start, seat] = log10_add(self.coins[passed_start, seat],
+                                                   np.full(int(passed_start.sum()), self.start_coin_bonus))
+        codes: np.ndarray = self.board.tile_codes[positions]
+
+        # Landing on shiny zones
+        shiny: np.ndarray = active & (codes == SHINY_ZONE_CODE)
+        shiny_exponent_range: tuple = self.economy.shiny_exponent_range
+        coin_rewards: np.ndarray = self.draw_integers(seat, SHINY_DRAWS, 0, *shiny_exponent_range).astype(np.float64)
+        exp_rewards: np.ndarray = self.draw_integers(seat, SHINY_DRAWS, 1, *shiny_exponent_range).astype(np.float64)
+        self.coins[shiny, seat] = log10_add(self.coins[shiny, seat], coin_rewards[shiny])
+        self.exp[shiny, seat] = log10_add(self.exp[shiny, seat], exp_rewards[shiny])
+        self.level_up(seat, shiny)
+
+        accepts: np.ndarray = \
+            (self.draw_values(seat, DECISION_DRAWS, 0) >> np.uint64(11)) * (1.0 / (1 << 53)) <= self.probability
+
+        # Landing on upgrade shops
+        shop: np.ndarray = active & (codes == UPGRADE_SHOP_CODE) & accepts
+        upgrade_indices: np.ndarray = \
+            self.draw_integers(seat, DECISION_DRAWS, 1, 0, len(self.board.upgrade_costs) - 1)
+        bought: np.ndarray = self.pay(seat, shop, self.board.upgrade_costs[upgrade_indices])
+        self.coin_multipliers[bought, seat] += self.board.upgrade_coin_multipliers[upgrade_indices[bought]]
+        self.exp_multipliers[bought, seat] += self.board.upgrade_exp_multipliers[upgrade_indices[bought]]
+
+        # Landing on places
+        on_place: np.ndarray = active & (codes == PLACE_CODE) & accepts
+        ordinals: np.ndarray = np.where(on_place, self.board.place_ordinals[positions], 0)
+        owners: np.ndarray = self.owners[rows, ordinals]
+        costs: np.ndarray = self.place_costs[rows, ordinals]
+        purchased: np.ndarray = self.pay(seat, on_place & (owners < 0), costs)
+        upgraded: np.ndarray = self.pay(seat, on_place & (owners == seat), costs)
+        acquired: np.ndarray = self.pay(seat, on_place & (owners >= 0) & (owners != seat), costs)
+        levelled: np.ndarray = upgraded | acquired
+        self.levels[levelled, seat] += 1
+        growth: np.ndarray = self.levels[:, seat].astype(np.float64)
+        changed: np.ndarray = purchased | levelled
+        self.place_costs[rows[changed], ordinals[changed]] += growth[changed]
+        self.place_coins_per_turn[rows[levelled], ordinals[levelled]] += growth[levelled]
+        self.place_exp_per_turn[rows[levelled], ordinals[levelled]] += growth[levelled]
+        self.owners[rows[purchased | acquired], ordinals[purchased | acquired]] = seat
+
+        # Paying the income of the turn
+        owned: np.ndarray = self.owners == seat
+        coin_income: np.ndarray = log10_sum(self.place_coins_per_turn, owned) + self.coin_multipliers[:, seat]
+        exp_income: np.ndarray = log10_sum(self.place_exp_per_turn, owned) + self.exp_multipliers[:, seat]
+        self.coins[active, seat] = log10_add(self.coins[active, seat], coin_income[active])
+        self.exp[active, seat] = log10_add(self.exp[active, seat], exp_income[active])
+        self.level_up(seat, active)
+
+        # Checking whether the participant owns all places
+        won: np.ndarray = active & owned.all(axis=1)
+        self.winners[won] = seat
+        self.finishing_turns[won] = self.turn
+
+    def run(self, max_turns):
+        # type: (int) -> None
+        while self.turn < max_turns and (self.winners < 0).any():
+            self.step()
+
+    def summary(self):
+        # type: () -> dict
+        """
+        This method summarizes the state of all games for comparison with the reference rules.
+        :return: a dictionary of mean statistics over all games
+        """
+
+        return summarize(self.levels, self.positions, (self.owners[:, :, None] == np.arange(2)).sum(axis=1),
+                         self.coins, self.winners)
+
+
+def summarize(levels, positions, places_owned, coins, winners):
+    # type: (np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray) -> dict
+    return {
+        "mean player level": float(levels[:, 0].mean()),
+        "mean CPU level": float(levels[:, 1].mean()),
+        "mean player position": float(positions[:, 0].mean()),
+        "mean CPU position": float(positions[:, 1].mean()),
+        "mean places owned by player": float(places_owned[:, 0].mean()),
+        "mean places owned by CPU": float(places_owned[:, 1].mean()),
+        "mean player log10 coins": float(np.where(np.isneginf(coins[:, 0]), 0.0, coins[:, 0]).mean()),
+        "finished games": int((winners >= 0).sum())
+    }
+
+
+def reference_summary(n_games, n_turns, seed=None, economy=None):
+    # type: (int, int, int or None, Economy or None) -> dict
+    """
+    This function plays the same games as the vectorized simulator with the reference 'Game' rules and
+    summarizes them in the same way as 'VectorizedSimulator.summary()'.
+    :return: a dictionary of mean statistics over all games
+    """
+
+    seed = random.getrandbits(64) if seed is None else seed
+    economy = DEFAULT_ECONOMY if economy is None else economy
+    policy: RandomCPUPolicy = RandomCPUPolicy(economy.cpu_probability)
+    levels: np.ndarray = np.zeros((n_games, 2))
+    positions: np.ndarray = np.zeros((n_games, 2))
+    places_owned: np.ndarray = np.zeros((n_games, 2))
+    coins: np.ndarray = np.zeros((n_games, 2))
+    winners: np.ndarray = np.full(n_games, -1)
+    for i in range(n_games):
+        game: Game = Game(CPU(SCIENTIFIC_BACKEND), CPU(SCIENTIFIC_BACKEND), create_board(SCIENTIFIC_BACKEND, economy),
+                          seed, i)
+        winner: Player or None = play_game(game, policy, policy, n_turns)
+        for seat, participant in enumerate((game.player, game.cpu)):
+            levels[i, seat] = participant.level
+            positions[i, seat] = participant.position
+            places_owned[i, seat] = participant.count_owned()
+            coins[i, seat] = participant.coins.log10()
+            if winner is participant:
+                winners[i] = seat
+
+    return summarize(levels, positions, places_owned, coins, winners)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) not in (3, 4):
+        print("Usage: python vectorized_simulator.py N_GAMES MAX_TURNS [SEED]")
+        sys.exit(1)
+
+    simulator: VectorizedSimulator = VectorizedSimulator(int(sys.argv[1]),
+                                                         int(sys.argv[3]) if len(sys.argv) == 4 else None)
+    start_time: float = time.perf_counter()
+    simulator.run(int(sys.argv[2]))
+    elapsed_seconds: float = time.perf_counter() - start_time
+    print("Games played: " + str(simulator.n_games))
+    print("Turns per game: " + str(simulator.turn))
+    print("Turns per second: " + str(simulator.n_games * simulator.turn / elapsed_seconds))
+    for key, value in simulator.summary().items():
+        print(key + ": " + str(value))